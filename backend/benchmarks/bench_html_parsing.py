@@ -0,0 +1,64 @@
+"""
+Micro-benchmark: headline extraction per HTML parser backend
+
+Parses the homepages in benchmarks/fixtures/ with every available backend
+in parsers.py and compares them with the original full-tree html.parser
+scan. Every backend must extract the same items and region. The fixtures
+are synthetic pages (generated filler text in each source's container
+markup), not recorded copies of the sites, so absolute timings and ratios
+are indicative only.
+
+Run from the backend directory:
+    python -m benchmarks.bench_html_parsing [--sources somoynews jamuna prothomalo] [--rounds 50] [--max-items N]
+"""
+
+import argparse
+import time
+from pathlib import Path
+
+from parsers import available_parsers, get_parser
+from scraper import SCRAPER_SOURCES, extract_region
+
+FIXTURES = Path(__file__).parent / "fixtures"
+
+
+def measure(label: str, func, rounds: int) -> float:
+    func()  # warm-up
+    started = time.perf_counter()
+    for _ in range(rounds):
+        func()
+    per_call_ms = (time.perf_counter() - started) / rounds * 1000
+    print(f"  {label:<16} {per_call_ms:8.2f} ms/page")
+    return per_call_ms
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--sources", nargs="+", default=["somoynews", "jamuna", "prothomalo"])
+    parser.add_argument("--rounds", type=int, default=50)
+    parser.add_argument("--max-items", type=int, help="override each source's cap (a high value checks every container)")
+    args = parser.parse_args()
+
+    totals = {name: 0.0 for name in available_parsers()}
+    for key in args.sources:
+        source = SCRAPER_SOURCES[key]
+        if args.max_items:
+            source = source.model_copy(update={"max_items": args.max_items})
+        page = (FIXTURES / f"{key}.html").read_bytes()
+        print(f"{key} ({len(page) // 1024} KiB, {source.max_items} items)")
+
+        reference = extract_region(source, page, get_parser("html.parser"))
+        for name in totals:
+            backend = get_parser(name)
+            region, items = extract_region(source, page, backend)
+            assert items == reference[1], f"{name} extracted different items for {key}"
+            totals[name] += measure(name, lambda: extract_region(source, page, backend), args.rounds)
+
+    baseline = totals["html.parser"]
+    print("Total per cycle:")
+    for name, total in totals.items():
+        print(f"  {name:<16} {total:8.2f} ms  ({baseline / total:.1f}x)")
+
+
+if __name__ == "__main__":
+    main()
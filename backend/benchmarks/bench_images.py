@@ -0,0 +1,114 @@
+"""
+Benchmark: image transform engine vs. the original four-pass PIL pipeline
+
+Encodes synthetic photo-like images (smooth regions, edges and sensor-style
+noise) at typical news-photo sizes and times, per image, the original
+pipeline (full decode, blur, brightness, contrast, colour, then thumbnail)
+against images.decode_image + images.transform_image (draft decode,
+shrink first, fused colour pass). Outputs are compared pixel by pixel;
+the run fails if the mean absolute difference or PSNR leaves the bounds.
+Most of the difference is a uniform offset ("bias"): PIL's ImageEnhance
+truncates after each of its three blends, the fused pass rounds once.
+tests/test_images.py runs the same comparison with these bounds.
+
+Run from the backend directory:
+    python -m benchmarks.bench_images [--sizes 4000x3000 2048x1365 1200x800] [--rounds 5]
+        [--max-mean-diff 2.5] [--min-psnr 35]
+"""
+
+import argparse
+import sys
+import time
+from io import BytesIO
+
+import cv2
+import numpy as np
+from PIL import Image, ImageEnhance, ImageFilter
+
+from images import TRANSFORM, decode_image, transform_image
+
+
+def reference_pipeline(data: bytes) -> Image.Image:
+    """The pre-engine process_image transform, step for step"""
+    image = Image.open(BytesIO(data))
+    image = image.filter(ImageFilter.GaussianBlur(radius=TRANSFORM["blur_radius"]))
+    image = ImageEnhance.Brightness(image).enhance(TRANSFORM["brightness"])
+    image = ImageEnhance.Contrast(image).enhance(TRANSFORM["contrast"])
+    image = ImageEnhance.Color(image).enhance(TRANSFORM["color"])
+    max_width, max_height = TRANSFORM["max_size"]
+    if image.width > max_width or image.height > max_height:
+        image.thumbnail((max_width, max_height), Image.Resampling.LANCZOS)
+    return image.convert("RGB")
+
+
+def engine_pipeline(data: bytes) -> Image.Image:
+    image, scale = decode_image(data)
+    return transform_image(image, scale)
+
+
+def synthetic_photo(width: int, height: int, seed: int = 1) -> bytes:
+    """JPEG (quality 90) with smooth colour fields, hard edges and fine noise"""
+    rng = np.random.default_rng(seed)
+    field = rng.uniform(0, 255, (height // 64 + 2, width // 64 + 2, 3)).astype(np.float32)
+    pixels = cv2.resize(field, (width, height), interpolation=cv2.INTER_CUBIC)
+    for _ in range(12):
+        x, y = int(rng.integers(0, width)), int(rng.integers(0, height))
+        radius = int(rng.integers(height // 20, height // 5))
+        cv2.circle(pixels, (x, y), radius, tuple(float(c) for c in rng.uniform(0, 255, 3)), -1)
+    pixels += rng.normal(0, 6, pixels.shape).astype(np.float32)
+    image = Image.fromarray(np.clip(pixels, 0, 255).astype(np.uint8))
+    buffer = BytesIO()
+    image.save(buffer, "JPEG", quality=90)
+    return buffer.getvalue()
+
+
+def pixel_difference(reference: Image.Image, candidate: Image.Image) -> dict:
+    if candidate.size != reference.size:  # draft decode can round the thumbnail size by a pixel
+        candidate = candidate.resize(reference.size, Image.Resampling.LANCZOS)
+    signed = np.asarray(candidate, dtype=np.float32) - np.asarray(reference, dtype=np.float32)
+    diff = np.abs(signed)
+    mse = float(np.mean(diff ** 2))
+    return {
+        "bias": float(signed.mean()),
+        "mean": float(diff.mean()),
+        "p99": float(np.percentile(diff, 99)),
+        "psnr": 10 * np.log10(255 ** 2 / mse) if mse else float("inf"),
+    }
+
+
+def measure(func, data: bytes, rounds: int) -> float:
+    func(data)  # warm-up
+    started = time.perf_counter()
+    for _ in range(rounds):
+        func(data)
+    return (time.perf_counter() - started) / rounds * 1000
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--sizes", nargs="+", default=["4000x3000", "2048x1365", "1200x800"])
+    parser.add_argument("--rounds", type=int, default=5)
+    parser.add_argument("--max-mean-diff", type=float, default=2.5, help="allowed mean absolute difference per channel (0-255)")
+    parser.add_argument("--min-psnr", type=float, default=35.0, help="required PSNR in dB")
+    args = parser.parse_args()
+
+    failures = []
+    print(f"{'size':<11}{'KiB':>6}{'original':>11}{'engine':>11}{'speedup':>9}{'bias':>7}{'mean diff':>11}{'p99 diff':>10}{'PSNR':>9}")
+    for size in args.sizes:
+        width, height = (int(value) for value in size.split("x"))
+        data = synthetic_photo(width, height)
+        difference = pixel_difference(reference_pipeline(data), engine_pipeline(data))
+        original_ms = measure(reference_pipeline, data, args.rounds)
+        engine_ms = measure(engine_pipeline, data, args.rounds)
+        print(f"{size:<11}{len(data) // 1024:>6}{original_ms:>9.1f}ms{engine_ms:>9.1f}ms{original_ms / engine_ms:>8.1f}x"
+              f"{difference['bias']:>+7.2f}{difference['mean']:>11.2f}{difference['p99']:>10.1f}{difference['psnr']:>7.1f}dB")
+        if difference["mean"] > args.max_mean_diff or difference["psnr"] < args.min_psnr:
+            failures.append(size)
+
+    if failures:
+        print(f"Output differs from the original pipeline beyond the bounds for: {', '.join(failures)}")
+        sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
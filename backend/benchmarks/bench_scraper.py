@@ -0,0 +1,99 @@
+"""
+Benchmark: scrape_sources against the offline replay server
+
+Starts benchmarks.replay_server on a free port, points every source at it
+and drives scraper.scrape_sources with the same engine settings the server
+uses, reporting items/sec per round and per-source fetch latency and parse
+time. Nothing is stored: the conditional-fetch state lives in memory, so no
+MongoDB or .env is needed. The replayed pages are the synthetic fixtures in
+benchmarks/fixtures/ (generated filler in each source's container markup),
+not recorded copies of the sites, so timings are indicative only. All sources
+share the replay host, so the per-host connection limit defaults to one per source.
+
+Run from the backend directory:
+    python -m benchmarks.bench_scraper [--rounds 5] [--latency 0.2] [--jitter 0.1]
+        [--error-rate 0.1] [--slow-rate 0.1] [--slow-seconds 5] [--deadline 15]
+        [--per-host-limit 6] [--parser lxml] [--conditional]
+"""
+
+import argparse
+import asyncio
+import time
+
+from benchmarks.replay_server import ReplayServer
+from scraper import ScrapeEngine, SourceStateStore, point_sources_at, save_states, scrape_sources
+
+
+class MemoryCollection:
+    """The slice of a Motor collection SourceStateStore uses, kept in a dict"""
+
+    def __init__(self):
+        self.documents = {}
+
+    def find(self, query):
+        async def documents():
+            for document in list(self.documents.values()):
+                yield document
+        return documents()
+
+    async def replace_one(self, query, document, upsert=False):
+        self.documents[query["_id"]] = document
+
+    async def delete_many(self, query):
+        self.documents.clear()
+
+
+async def run(engine: ScrapeEngine, args):
+    state = SourceStateStore(MemoryCollection())
+
+    total_items = 0
+    total_seconds = 0.0
+    for round_number in range(1, args.rounds + 1):
+        started = time.perf_counter()
+        # --conditional exercises the ETag / unchanged-page path after the first round
+        results = await scrape_sources(engine, state=state, force=not args.conditional)
+        items = [item for result in results for item in result.items]
+        await save_states(state, results)
+        elapsed = time.perf_counter() - started
+        total_items += len(items)
+        total_seconds += elapsed
+        print(f"round {round_number:>3}: {len(items):>3} items in {elapsed * 1000:8.1f} ms  ({len(items) / elapsed:8.1f} items/s)")
+    print(f"overall: {total_items} items in {total_seconds:.2f} s ({total_items / total_seconds:.1f} items/s)")
+
+    print(f"\n{'source':<14}{'polls':>6}{'errors':>7}{'unchgd':>7}{'items':>6}{'fetch p50':>11}{'fetch p95':>11}{'parse avg':>11}")
+    for key, stats in engine.metrics.stats().items():
+        print(f"{key:<14}{stats['polls']:>6}{stats['errors']:>7}{stats['unchanged']:>7}{stats['items']:>6}"
+              f"{stats['fetch_ms_p50']:>9.1f}ms{stats['fetch_ms_p95']:>9.1f}ms{stats['parse_ms_avg']:>9.1f}ms")
+    await engine.close()
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--rounds", type=int, default=5)
+    parser.add_argument("--latency", type=float, default=0.2)
+    parser.add_argument("--jitter", type=float, default=0.1)
+    parser.add_argument("--error-rate", type=float, default=0.0)
+    parser.add_argument("--slow-rate", type=float, default=0.0)
+    parser.add_argument("--slow-seconds", type=float, default=5.0)
+    parser.add_argument("--deadline", type=float, default=15.0, help="SCRAPE_DEADLINE for each source")
+    parser.add_argument("--per-host-limit", type=int, help="SCRAPE_PER_HOST_LIMIT (default: number of replayed sources)")
+    parser.add_argument("--parser", default="lxml", help="SCRAPE_PARSER backend")
+    parser.add_argument("--conditional", action="store_true", help="use stored ETags/hashes instead of forcing full scrapes")
+    args = parser.parse_args()
+
+    replay = ReplayServer(latency=args.latency, jitter=args.jitter, error_rate=args.error_rate,
+                          slow_rate=args.slow_rate, slow_seconds=args.slow_seconds, seed=1).start()
+    point_sources_at(replay.url)
+    engine = ScrapeEngine(deadline=args.deadline, per_host_limit=args.per_host_limit or len(replay.pages), parser=args.parser)
+
+    print(f"Replay server at {replay.url} ({len(replay.pages)} sources, latency {args.latency}s +/- {args.jitter}s, "
+          f"errors {args.error_rate:.0%}, slow {args.slow_rate:.0%})")
+    try:
+        asyncio.run(run(engine, args))
+    finally:
+        replay.stop()
+    print(f"replay requests served: {replay.requests}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,86 @@
+"""
+Micro-benchmark: article list serialization
+
+Compares the previous response path (NewsArticle per document, then FastAPI
+response_model validation + jsonable_encoder + json.dumps) with the fast path
+(DocumentEncoder + orjson) on synthetic 100-article pages.
+
+Run from the backend directory:
+    python -m benchmarks.bench_serialization [--articles 100] [--rounds 200]
+"""
+
+import argparse
+import json
+import time
+import uuid
+from datetime import datetime
+from typing import List
+
+from fastapi.encoders import jsonable_encoder
+from pydantic import TypeAdapter
+
+from serialization import DocumentEncoder, dumps
+from server import NewsArticle
+
+
+def make_documents(count: int) -> List[dict]:
+    """Documents shaped like what Motor returns for news_articles"""
+    return [{
+        "_id": uuid.uuid4().bytes[:12],
+        "id": str(uuid.uuid4()),
+        "title": f"পরীক্ষামূলক সংবাদ শিরোনাম নম্বর {i}",
+        "content": "সংবাদের বিস্তারিত বিষয়বস্তু। " * 120,
+        "summary": "সংবাদের সংক্ষিপ্ত সারাংশ। " * 8,
+        "category": "প্রযুক্তি",
+        "author": "সংবাদদাতা",
+        "published_at": datetime(2025, 8, 22, 10, 30, i % 60, 123000),
+        "image_url": None,
+        "is_featured": i % 7 == 0,
+        "is_breaking": i % 5 == 0,
+        "views": i * 3,
+        "source": None,
+        "source_url": None,
+    } for i in range(count)]
+
+
+def current_path(documents: List[dict], adapter: TypeAdapter) -> bytes:
+    articles = [NewsArticle(**document) for document in documents]
+    validated = adapter.validate_python(articles, from_attributes=True)
+    return json.dumps(jsonable_encoder(validated), ensure_ascii=False).encode("utf-8")
+
+
+def fast_path(documents: List[dict], encoder: DocumentEncoder) -> bytes:
+    return dumps(encoder.encode_many(documents))
+
+
+def measure(label: str, func, rounds: int) -> float:
+    func()  # warm-up
+    started = time.perf_counter()
+    for _ in range(rounds):
+        func()
+    per_call_ms = (time.perf_counter() - started) / rounds * 1000
+    print(f"{label:<40} {per_call_ms:8.3f} ms/page")
+    return per_call_ms
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--articles", type=int, default=100)
+    parser.add_argument("--rounds", type=int, default=200)
+    args = parser.parse_args()
+
+    documents = make_documents(args.articles)
+    adapter = TypeAdapter(List[NewsArticle])
+    encoder = DocumentEncoder(NewsArticle)
+
+    # Both paths must produce the same JSON document
+    assert json.loads(current_path(documents, adapter)) == json.loads(fast_path(documents, encoder))
+
+    print(f"Serializing {args.articles} articles, {args.rounds} rounds")
+    slow = measure("model + response_model + json.dumps", lambda: current_path(documents, adapter), args.rounds)
+    fast = measure("DocumentEncoder + orjson", lambda: fast_path(documents, encoder), args.rounds)
+    print(f"Speedup: {slow / fast:.1f}x")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,137 @@
+"""
+Local HTTP stand-in for the scraped news sites
+
+Serves benchmarks/fixtures/<source>.html at /<source> (any path below it
+too) with configurable latency, error rate and slow, trickled responses.
+Responses carry an ETag and answer If-None-Match with 304 like a real CDN.
+
+Point the backend at it with SCRAPER_REPLAY_URL=http://127.0.0.1:8765, or run
+it from the backend directory on its own:
+    python -m benchmarks.replay_server [--port 8765] [--latency 0.2] [--error-rate 0.1] [--slow-rate 0.1]
+"""
+
+import argparse
+import hashlib
+import random
+import threading
+import time
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from pathlib import Path
+from typing import Dict, Optional
+
+FIXTURES = Path(__file__).parent / "fixtures"
+
+
+class ReplayServer:
+    """Replays the fixture pages of each source from a background thread"""
+
+    def __init__(self, fixtures: Path = FIXTURES, host: str = "127.0.0.1", port: int = 0,
+                 latency: float = 0.0, jitter: float = 0.0, error_rate: float = 0.0,
+                 slow_rate: float = 0.0, slow_seconds: float = 5.0, etag: bool = True, seed: Optional[int] = None):
+        self.pages: Dict[str, bytes] = {path.stem: path.read_bytes() for path in sorted(fixtures.glob("*.html"))}
+        self.etags = {key: f'"{hashlib.sha1(page).hexdigest()[:16]}"' for key, page in self.pages.items()}
+        self.latency = latency
+        self.jitter = jitter
+        self.error_rate = error_rate
+        self.slow_rate = slow_rate
+        self.slow_seconds = slow_seconds
+        self.etag = etag
+        self.random = random.Random(seed)
+        self.requests = 0
+        self._lock = threading.Lock()
+        self._httpd = ThreadingHTTPServer((host, port), self._handler())
+        self._httpd.daemon_threads = True
+        self._thread: Optional[threading.Thread] = None
+
+    @property
+    def url(self) -> str:
+        host, port = self._httpd.server_address[:2]
+        return f"http://{host}:{port}"
+
+    def start(self) -> "ReplayServer":
+        self._thread = threading.Thread(target=self._httpd.serve_forever, daemon=True)
+        self._thread.start()
+        return self
+
+    def stop(self):
+        self._httpd.shutdown()
+        self._httpd.server_close()
+
+    def _roll(self, rate: float) -> bool:
+        with self._lock:
+            return self.random.random() < rate
+
+    def _delay(self) -> float:
+        with self._lock:
+            return max(0.0, self.latency + self.random.uniform(-self.jitter, self.jitter))
+
+    def _handler(self):
+        replay = self
+
+        class Handler(BaseHTTPRequestHandler):
+            protocol_version = "HTTP/1.1"  # keep-alive, like the real sites
+
+            def do_GET(self):
+                with replay._lock:
+                    replay.requests += 1
+                key = self.path.strip("/").split("/")[0].split("?")[0]
+                time.sleep(replay._delay())
+
+                if key not in replay.pages:
+                    return self._send(404, b"not found")
+                if replay._roll(replay.error_rate):
+                    return self._send(503, b"service unavailable")
+                if replay.etag and self.headers.get("If-None-Match") == replay.etags[key]:
+                    return self._send(304, b"", {"ETag": replay.etags[key]})
+
+                headers = {"ETag": replay.etags[key]} if replay.etag else {}
+                self._send(200, replay.pages[key], headers, slow=replay._roll(replay.slow_rate))
+
+            def _send(self, status: int, body: bytes, headers: Optional[dict] = None, slow: bool = False):
+                self.send_response(status)
+                self.send_header("Content-Type", "text/html; charset=utf-8")
+                self.send_header("Content-Length", str(len(body)))
+                for name, value in (headers or {}).items():
+                    self.send_header(name, value)
+                self.end_headers()
+                if not slow:
+                    self.wfile.write(body)
+                    return
+                # Trickle the body in ten chunks over slow_seconds
+                chunk = max(1, len(body) // 10)
+                try:
+                    for offset in range(0, len(body), chunk):
+                        self.wfile.write(body[offset:offset + chunk])
+                        self.wfile.flush()
+                        time.sleep(replay.slow_seconds / 10)
+                except (BrokenPipeError, ConnectionResetError):
+                    self.close_connection = True  # the scraper gave up (deadline)
+
+            def log_message(self, *args):
+                pass
+
+        return Handler
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--port", type=int, default=8765)
+    parser.add_argument("--latency", type=float, default=0.0, help="seconds before each response")
+    parser.add_argument("--jitter", type=float, default=0.0, help="+/- seconds added to the latency")
+    parser.add_argument("--error-rate", type=float, default=0.0, help="fraction of requests answered with 503")
+    parser.add_argument("--slow-rate", type=float, default=0.0, help="fraction of responses trickled over --slow-seconds")
+    parser.add_argument("--slow-seconds", type=float, default=5.0)
+    parser.add_argument("--no-etag", action="store_true", help="send no ETag (and never 304)")
+    args = parser.parse_args()
+
+    server = ReplayServer(port=args.port, latency=args.latency, jitter=args.jitter, error_rate=args.error_rate,
+                          slow_rate=args.slow_rate, slow_seconds=args.slow_seconds, etag=not args.no_etag).start()
+    print(f"Replaying {', '.join(server.pages)} at {server.url}/<source>; Ctrl+C to stop")
+    try:
+        threading.Event().wait()
+    except KeyboardInterrupt:
+        server.stop()
+
+
+if __name__ == "__main__":
+    main()
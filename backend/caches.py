@@ -0,0 +1,230 @@
+import asyncio
+import time
+from collections import OrderedDict
+from datetime import datetime
+from typing import Iterable, NamedTuple, Optional, Tuple
+
+
+# Materialized feed cache for list endpoints
+class CachedFeed(NamedTuple):
+    """A serialized feed and its validators, derived from the body when it was materialized"""
+    body: bytes
+    etag: str
+    last_modified: datetime
+
+
+class FeedCache:
+    """Pre-serialized list responses keyed by query filters and page parameters.
+
+    Entries are invalidated precisely on content and flag writes: a written
+    article only drops the feeds whose filters it matches (before or after
+    the write). View counts are not writes in that sense; they reach list
+    bodies when an entry expires after `ttl` seconds. Bounded by entry count
+    and total bytes.
+    """
+
+    def __init__(self, max_entries: int = 256, max_bytes: int = 64 * 1024 * 1024, ttl: float = 30.0):
+        self.max_entries = max_entries
+        self.max_bytes = max_bytes
+        self.ttl = ttl
+        self._entries: "OrderedDict[Tuple, Tuple[float, dict, CachedFeed]]" = OrderedDict()
+        self.bytes = 0
+        self.version = 0
+        self.hits = 0
+        self.misses = 0
+        self.expirations = 0
+        self.invalidations = 0
+        self.evictions = 0
+
+    @staticmethod
+    def make_key(filters: dict, page: tuple) -> Tuple:
+        return (tuple(sorted(filters.items())), page)
+
+    def _drop(self, key: Tuple):
+        _, _, feed = self._entries.pop(key)
+        self.bytes -= len(feed.body)
+
+    def get(self, filters: dict, page: tuple) -> Optional[CachedFeed]:
+        key = self.make_key(filters, page)
+        entry = self._entries.get(key)
+        if entry is not None and entry[0] <= time.monotonic():
+            self._drop(key)
+            self.expirations += 1
+            entry = None
+        if entry is None:
+            self.misses += 1
+            return None
+        self._entries.move_to_end(key)
+        self.hits += 1
+        return entry[2]
+
+    def put(self, filters: dict, page: tuple, feed: CachedFeed, version: int):
+        """Store a feed computed while the cache was at `version`.
+
+        A write that happened while the feed was being read bumps the version,
+        so a possibly stale result is simply not stored.
+        """
+        if version != self.version or len(feed.body) > self.max_bytes:
+            return
+        key = self.make_key(filters, page)
+        if key in self._entries:
+            self._drop(key)
+        self._entries[key] = (time.monotonic() + self.ttl, dict(filters), feed)
+        self.bytes += len(feed.body)
+        while len(self._entries) > self.max_entries or self.bytes > self.max_bytes:
+            self._drop(next(iter(self._entries)))
+            self.evictions += 1
+
+    @staticmethod
+    def _matches(filters: dict, document: dict) -> bool:
+        return all(document.get(field) == value for field, value in filters.items())
+
+    def invalidate(self, documents: Iterable[dict]):
+        """Drop every feed that any of the given article states would appear in"""
+        documents = list(documents)
+        self.version += 1
+        stale = [
+            key for key, (_, filters, _) in self._entries.items()
+            if any(self._matches(filters, document) for document in documents)
+        ]
+        for key in stale:
+            self._drop(key)
+        self.invalidations += len(stale)
+
+    def clear(self):
+        self.version += 1
+        self.invalidations += len(self._entries)
+        self._entries.clear()
+        self.bytes = 0
+
+    def stats(self) -> dict:
+        lookups = self.hits + self.misses
+        return {
+            "entries": len(self._entries),
+            "max_entries": self.max_entries,
+            "bytes": self.bytes,
+            "max_bytes": self.max_bytes,
+            "ttl": self.ttl,
+            "hits": self.hits,
+            "misses": self.misses,
+            "hit_ratio": round(self.hits / lookups, 4) if lookups else 0.0,
+            "expirations": self.expirations,
+            "invalidations": self.invalidations,
+            "evictions": self.evictions,
+            "version": self.version,
+        }
+
+
+# Bounded LRU + TTL cache for single-article responses
+class ArticleCache:
+    """Serialized article responses by id, bounded by entry count and total bytes"""
+
+    def __init__(self, max_entries: int = 1000, max_bytes: int = 32 * 1024 * 1024, ttl: float = 60.0):
+        self.max_entries = max_entries
+        self.max_bytes = max_bytes
+        self.ttl = ttl
+        self._entries: "OrderedDict[str, Tuple[float, bytes]]" = OrderedDict()
+        self.bytes = 0
+        self.version = 0
+        self.hits = 0
+        self.misses = 0
+        self.expirations = 0
+        self.evictions = 0
+        self.invalidations = 0
+
+    def _drop(self, article_id: str):
+        _, body = self._entries.pop(article_id)
+        self.bytes -= len(body)
+
+    def get(self, article_id: str) -> Optional[bytes]:
+        entry = self._entries.get(article_id)
+        if entry is not None and entry[0] <= time.monotonic():
+            self._drop(article_id)
+            self.expirations += 1
+            entry = None
+        if entry is None:
+            self.misses += 1
+            return None
+        self._entries.move_to_end(article_id)
+        self.hits += 1
+        return entry[1]
+
+    def put(self, article_id: str, body: bytes, version: int):
+        """Store a response read while the cache was at `version` (skipped if a write happened since)"""
+        if version != self.version or len(body) > self.max_bytes:
+            return
+        if article_id in self._entries:
+            self._drop(article_id)
+        self._entries[article_id] = (time.monotonic() + self.ttl, body)
+        self.bytes += len(body)
+        while len(self._entries) > self.max_entries or self.bytes > self.max_bytes:
+            self._drop(next(iter(self._entries)))
+            self.evictions += 1
+
+    def invalidate(self, article_ids: Iterable[str]):
+        self.version += 1
+        for article_id in article_ids:
+            if article_id in self._entries:
+                self._drop(article_id)
+                self.invalidations += 1
+
+    def clear(self):
+        self.version += 1
+        self.invalidations += len(self._entries)
+        self._entries.clear()
+        self.bytes = 0
+
+    def stats(self) -> dict:
+        lookups = self.hits + self.misses
+        return {
+            "entries": len(self._entries),
+            "max_entries": self.max_entries,
+            "bytes": self.bytes,
+            "max_bytes": self.max_bytes,
+            "ttl": self.ttl,
+            "hits": self.hits,
+            "misses": self.misses,
+            "hit_ratio": round(self.hits / lookups, 4) if lookups else 0.0,
+            "expirations": self.expirations,
+            "evictions": self.evictions,
+            "invalidations": self.invalidations,
+        }
+
+# Short-lived cache of a single computed value
+class TTLValue:
+    """Caches the result of an async computation for `ttl` seconds.
+
+    Concurrent callers during a refresh share one computation.
+    """
+
+    def __init__(self, ttl: float):
+        self.ttl = ttl
+        self._value = None
+        self._expires_at = 0.0
+        self._lock = asyncio.Lock()
+        self._generation = 0
+        self.hits = 0
+        self.misses = 0
+
+    async def get(self, compute):
+        if time.monotonic() < self._expires_at:
+            self.hits += 1
+            return self._value
+        async with self._lock:
+            if time.monotonic() < self._expires_at:
+                self.hits += 1
+                return self._value
+            self.misses += 1
+            generation = self._generation
+            value = await compute()
+            if generation == self._generation:  # not invalidated while computing
+                self._value = value
+                self._expires_at = time.monotonic() + self.ttl
+            return value
+
+    def invalidate(self):
+        self._generation += 1
+        self._expires_at = 0.0
+
+    def stats(self) -> dict:
+        return {"ttl": self.ttl, "hits": self.hits, "misses": self.misses}
@@ -0,0 +1,111 @@
+import logging
+from collections import Counter
+from datetime import datetime, timezone
+from typing import Iterable, List
+
+from stats import aggregate_article_stats, day_key
+
+
+# Incrementally maintained article counters (one document in news_counters)
+COUNTERS_ID = "news_articles"
+
+
+def counter_key(name: str) -> str:
+    """Field-name-safe form of a free-text key: '.' would nest and a leading '$' is invalid"""
+    if name == "":
+        return "%"
+    return name.replace("%", "%25").replace(".", "%2E").replace("$", "%24")
+
+
+def decode_counter_key(key: str) -> str:
+    if key == "%":
+        return ""
+    return key.replace("%2E", ".").replace("%24", "$").replace("%25", "%")
+
+
+def _article_delta(article: dict, sign: int) -> Counter:
+    delta = Counter({"total": sign})
+    if article.get("is_featured"):
+        delta["featured"] += sign
+    if article.get("is_breaking"):
+        delta["breaking"] += sign
+    if article.get("category") is not None:
+        delta[f"category.{counter_key(article['category'])}"] += sign
+    published_at = article.get("published_at") or datetime.now(timezone.utc)
+    delta[f"day.{day_key(published_at)}"] += sign
+    return delta
+
+
+class ArticleCounters:
+    """Totals, featured/breaking, per-category and per-day article counts kept
+    up to date with atomic $inc updates from every write path, so the stats
+    endpoints read one document instead of scanning news_articles"""
+
+    def __init__(self, collection):
+        self.collection = collection
+
+    async def _apply(self, delta: Counter):
+        delta = {field: value for field, value in delta.items() if value}
+        if delta:
+            await self.collection.update_one({"_id": COUNTERS_ID}, {"$inc": delta}, upsert=True)
+
+    async def record_inserted(self, articles: Iterable[dict]):
+        delta = Counter()
+        for article in articles:
+            delta.update(_article_delta(article, 1))
+        await self._apply(delta)
+
+    async def record_deleted(self, articles: Iterable[dict]):
+        delta = Counter()
+        for article in articles:
+            delta.update(_article_delta(article, -1))
+        await self._apply(delta)
+
+    async def record_flag_change(self, field: str, new_status: bool):
+        """`field` is "featured" or "breaking"; called after a toggle actually changed the flag"""
+        await self._apply(Counter({field: 1 if new_status else -1}))
+
+    async def read(self) -> dict:
+        counters = await self.collection.find_one({"_id": COUNTERS_ID}) or {}
+        return {
+            "total": counters.get("total", 0),
+            "featured": counters.get("featured", 0),
+            "breaking": counters.get("breaking", 0),
+            "category": {decode_counter_key(key): count for key, count in counters.get("category", {}).items()},
+            "day": counters.get("day", {}),
+        }
+
+    async def exists(self) -> bool:
+        return await self.collection.count_documents({"_id": COUNTERS_ID}, limit=1) > 0
+
+    async def reconcile(self, articles_collection, categories: List[str]) -> dict:
+        """Recompute every counter from news_articles, store it and report the drift found"""
+        current = await self.read()
+        stats = await aggregate_article_stats(articles_collection, categories)
+        recomputed = {
+            "total": stats["total_news"],
+            "featured": stats["featured_news"],
+            "breaking": stats["breaking_news"],
+            "category": {category: count for category, count in stats["category_counts"].items() if category is not None},
+            "day": stats["daily_counts"],
+        }
+
+        drift = {}
+        for field in ("total", "featured", "breaking"):
+            if current[field] != recomputed[field]:
+                drift[field] = recomputed[field] - current[field]
+        for field in ("category", "day"):
+            for key in set(current[field]) | set(recomputed[field]):
+                difference = recomputed[field].get(key, 0) - current[field].get(key, 0)
+                if difference:
+                    drift[f"{field}.{key}"] = difference
+
+        stored_categories = {counter_key(category): count for category, count in recomputed["category"].items()}
+        await self.collection.replace_one(
+            {"_id": COUNTERS_ID},
+            {**recomputed, "category": stored_categories, "reconciled_at": datetime.now(timezone.utc)},
+            upsert=True
+        )
+        if drift:
+            logging.warning(f"Article counters drifted, corrected: {drift}")
+        return {"drift": drift, "counters": recomputed}
@@ -0,0 +1,167 @@
+import asyncio
+import logging
+import re
+import time
+from typing import Awaitable, Callable, Optional, Tuple
+from urllib.parse import urljoin
+
+from parsers import Document, parse_html_document
+
+
+# Readability-style main text and lead image extraction for article pages
+_UNLIKELY = re.compile(r"comment|share|social|related|sidebar|advert|banner|promo|footer|header|menu|nav|breadcrumb|popup|subscribe|tag", re.I)
+_POSITIVE = re.compile(r"article|body|content|story|detail|news|text|entry|post", re.I)
+_MAYBE_CANDIDATE = re.compile(r"article|body|content|main|detail", re.I)  # keeps e.g. "article-header" despite _UNLIKELY
+_REMOVED_TAGS = ["script", "style", "noscript", "iframe", "form", "nav", "header", "footer", "aside", "button", "svg"]
+_SENTENCE_MARKS = re.compile(r"[,،।!?]")
+MIN_PARAGRAPH_CHARS = 25
+
+
+def _class_weight(element) -> int:
+    names = f"{element.get('class', '')} {element.get('id', '')}"
+    weight = 0
+    if _POSITIVE.search(names):
+        weight += 25
+    if _UNLIKELY.search(names):
+        weight -= 25
+    return weight
+
+
+def _text(element) -> str:
+    return " ".join(element.text_content().split())
+
+
+def _link_density(element) -> float:
+    text_length = len(_text(element)) or 1
+    link_length = sum(len(_text(link)) for link in element.iter("a"))
+    return link_length / text_length
+
+
+def extract_article(page: Document, url: str) -> Tuple[str, Optional[str]]:
+    """Main text (paragraphs separated by blank lines) and lead image URL of an article page.
+
+    Paragraphs score their parent (and half that for the grandparent) by
+    length and sentence marks; class/id names push containers up or down and
+    link-heavy containers are discounted. Returns ("", None) when nothing
+    article-like is found or the page is empty. Pass the raw response bytes
+    so the declared charset is honoured. CPU-bound, run in a thread.
+    """
+    document = parse_html_document(page)
+    if document is None:
+        return "", None
+
+    lead_image = None
+    for prop in ("og:image", "twitter:image"):
+        meta = document.xpath(f"//meta[@property='{prop}' or @name='{prop}']/@content")
+        if meta and meta[0].strip():
+            lead_image = urljoin(url, meta[0].strip())
+            break
+
+    for element in document.xpath("|".join(f"//{tag}" for tag in _REMOVED_TAGS)):
+        if element.getparent() is not None:
+            element.drop_tree()
+    for element in list(document.iter("div", "section", "ul")):
+        names = f"{element.get('class', '')} {element.get('id', '')}"
+        if element.getparent() is not None and _UNLIKELY.search(names) and not _MAYBE_CANDIDATE.search(names):
+            element.drop_tree()
+
+    scores = {}
+    for paragraph in document.iter("p"):
+        content = _text(paragraph)
+        if len(content) < MIN_PARAGRAPH_CHARS:
+            continue
+        score = 1 + len(_SENTENCE_MARKS.findall(content)) + min(len(content) // 100, 3)
+        parent = paragraph.getparent()
+        grandparent = parent.getparent() if parent is not None else None
+        for ancestor, share in ((parent, 1.0), (grandparent, 0.5)):
+            if ancestor is None or not isinstance(ancestor.tag, str):
+                continue
+            if ancestor not in scores:
+                scores[ancestor] = float(_class_weight(ancestor))
+            scores[ancestor] += score * share
+
+    if not scores:
+        return "", lead_image
+    best = max(scores, key=lambda element: scores[element] * (1 - _link_density(element)))
+
+    paragraphs = [_text(paragraph) for paragraph in best.iter("p")]
+    body = "\n\n".join(paragraph for paragraph in paragraphs if len(paragraph) >= MIN_PARAGRAPH_CHARS)
+
+    if lead_image is None:
+        images = best.xpath(".//img/@src")
+        if images:
+            lead_image = urljoin(url, images[0])
+    return body, lead_image
+
+
+# Second pipeline stage: fetch linked article pages in the background
+ExtractedCallback = Callable[[str, str, Optional[str]], Awaitable[None]]
+
+
+class BodyExtractor:
+    """Bounded queue of (article id, source url) drained by a few workers.
+
+    Pages are fetched through the scrape engine, so its per-host limits and
+    deadline apply; parsing runs in a thread and `on_extracted(article_id,
+    body, lead_image)` stores the result. The scrape cycle only enqueues.
+    """
+
+    def __init__(self, engine, on_extracted: ExtractedCallback, workers: int = 4, max_queue: int = 500):
+        self.engine = engine
+        self.on_extracted = on_extracted
+        self.workers = workers
+        self.queue: asyncio.Queue = asyncio.Queue(maxsize=max_queue)
+        self.extracted = 0
+        self.empty = 0
+        self.failed = 0
+        self.dropped = 0
+        self.total_ms = 0.0
+        self._tasks = []
+
+    def submit(self, article_id: str, url: str):
+        try:
+            self.queue.put_nowait((article_id, url))
+        except asyncio.QueueFull:
+            self.dropped += 1
+            logging.warning(f"Body extraction queue full, skipping {url}")
+
+    async def run(self):
+        self._tasks = [asyncio.create_task(self._worker()) for _ in range(self.workers)]
+        await asyncio.gather(*self._tasks, return_exceptions=True)
+
+    async def stop(self):
+        for task in self._tasks:
+            task.cancel()
+        await asyncio.gather(*self._tasks, return_exceptions=True)
+
+    async def _worker(self):
+        while True:
+            article_id, url = await self.queue.get()
+            started = time.monotonic()
+            try:
+                response = await asyncio.wait_for(self.engine.fetch(url), timeout=self.engine.deadline)
+                if response.status_code != 200:
+                    raise ValueError(f"HTTP {response.status_code}")
+                body, lead_image = await asyncio.to_thread(extract_article, response.content, str(response.url))
+                if body:
+                    await self.on_extracted(article_id, body, lead_image)
+                    self.extracted += 1
+                else:
+                    self.empty += 1
+            except Exception as e:
+                self.failed += 1
+                logging.warning(f"Body extraction failed for {url}: {str(e) or type(e).__name__}")
+            finally:
+                self.total_ms += (time.monotonic() - started) * 1000
+                self.queue.task_done()
+
+    def stats(self) -> dict:
+        processed = self.extracted + self.empty + self.failed
+        return {
+            "queued": self.queue.qsize(),
+            "extracted": self.extracted,
+            "empty": self.empty,
+            "failed": self.failed,
+            "dropped": self.dropped,
+            "avg_ms": round(self.total_ms / processed, 1) if processed else 0.0,
+        }
@@ -0,0 +1,80 @@
+import hashlib
+import logging
+import re
+import unicodedata
+from typing import Iterable, List, Set
+
+from pymongo import UpdateOne
+from pymongo.errors import BulkWriteError
+
+
+# Normalized title fingerprints for exact-duplicate detection
+FINGERPRINT_FIELD = "title_fingerprint"
+
+# Zero-width joiners/non-joiners, zero-width space, BOM, soft hyphen
+_INVISIBLE = dict.fromkeys(map(ord, "\u200b\u200c\u200d\u2060\ufeff\u00ad"))
+_WHITESPACE = re.compile(r"\s+")
+
+
+def normalize_title(title: str) -> str:
+    """NFC, no invisible joiners, punctuation/symbols (including the dari '।') as spaces, collapsed whitespace, casefolded"""
+    title = unicodedata.normalize("NFC", title).translate(_INVISIBLE)
+    title = "".join(" " if unicodedata.category(char)[0] in "PS" else char for char in title)
+    return _WHITESPACE.sub(" ", title).strip().casefold()
+
+
+def title_fingerprint(title: str) -> str:
+    return hashlib.sha1(normalize_title(title).encode("utf-8")).hexdigest()
+
+
+async def existing_fingerprints(collection, fingerprints: Iterable[str]) -> Set[str]:
+    """Which of the given fingerprints are already stored, in one indexed $in query"""
+    fingerprints = list(set(fingerprints))
+    if not fingerprints:
+        return set()
+    # $exists repeats the partial index filter so the planner can use that index
+    cursor = collection.find({FINGERPRINT_FIELD: {"$exists": True, "$in": fingerprints}}, {"_id": 0, FINGERPRINT_FIELD: 1})
+    return {document[FINGERPRINT_FIELD] async for document in cursor}
+
+
+async def new_items(collection, items: List[dict]) -> List[dict]:
+    """Drop scraped items whose title is already stored or repeated earlier in the batch.
+    Surviving items get their `title_fingerprint` set."""
+    for item in items:
+        item[FINGERPRINT_FIELD] = title_fingerprint(item["title"])
+    seen = await existing_fingerprints(collection, (item[FINGERPRINT_FIELD] for item in items))
+    fresh = []
+    for item in items:
+        if item[FINGERPRINT_FIELD] not in seen:
+            seen.add(item[FINGERPRINT_FIELD])
+            fresh.append(item)
+    return fresh
+
+
+async def backfill_fingerprints(collection, batch_size: int = 500) -> int:
+    """Fingerprint stored scraped articles that predate fingerprints; later duplicates stay unfingerprinted"""
+    updated = 0
+    cursor = collection.find(
+        {FINGERPRINT_FIELD: {"$exists": False}, "source": {"$ne": None}},
+        {"_id": 1, "title": 1}
+    ).sort("published_at", 1)
+    batch = []
+    async for document in cursor:
+        batch.append(UpdateOne({"_id": document["_id"]}, {"$set": {FINGERPRINT_FIELD: title_fingerprint(document["title"])}}))
+        if len(batch) >= batch_size:
+            updated += await _write_backfill(collection, batch)
+            batch = []
+    if batch:
+        updated += await _write_backfill(collection, batch)
+    if updated:
+        logging.info(f"Backfilled title fingerprints on {updated} articles")
+    return updated
+
+
+async def _write_backfill(collection, batch: List[UpdateOne]) -> int:
+    try:
+        result = await collection.bulk_write(batch, ordered=False)
+        return result.modified_count
+    except BulkWriteError as e:
+        # Duplicate fingerprints hit the unique index; everything else in the batch was applied
+        return e.details.get("nModified", 0)
@@ -0,0 +1,52 @@
+import hashlib
+from datetime import datetime, timezone
+from email.utils import format_datetime, parsedate_to_datetime
+from typing import Optional
+
+from fastapi import Request, Response
+
+
+# Conditional GET support (ETag / Last-Modified / 304)
+def http_now() -> datetime:
+    # HTTP dates have one-second resolution
+    return datetime.now(timezone.utc).replace(microsecond=0)
+
+
+def content_etag(body: bytes) -> str:
+    """Strong ETag of a response body: it changes exactly when the representation does,
+    independent of unrelated writes and of process restarts"""
+    return f'"{hashlib.sha1(body).hexdigest()[:16]}"'
+
+
+def validator_headers(etag: str, last_modified: datetime) -> dict:
+    return {
+        "ETag": etag,
+        "Last-Modified": format_datetime(last_modified, usegmt=True),
+        # Clients may store responses but must revalidate before reuse
+        "Cache-Control": "no-cache",
+    }
+
+
+def _parse_http_date(value: str) -> Optional[datetime]:
+    try:
+        parsed = parsedate_to_datetime(value)
+    except (TypeError, ValueError):
+        return None
+    return parsed if parsed.tzinfo else parsed.replace(tzinfo=timezone.utc)
+
+
+def is_not_modified(request: Request, etag: str, last_modified: datetime) -> bool:
+    """Evaluate If-None-Match (preferred) or If-Modified-Since against the current validators"""
+    if_none_match = request.headers.get("if-none-match")
+    if if_none_match is not None:
+        candidates = [tag.strip() for tag in if_none_match.split(",")]
+        return "*" in candidates or etag in candidates
+    if_modified_since = request.headers.get("if-modified-since")
+    if if_modified_since:
+        since = _parse_http_date(if_modified_since)
+        return since is not None and last_modified <= since
+    return False
+
+
+def not_modified_response(etag: str, last_modified: datetime) -> Response:
+    return Response(status_code=304, headers=validator_headers(etag, last_modified))
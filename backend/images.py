@@ -0,0 +1,483 @@
+import asyncio
+import hashlib
+import json
+import logging
+import multiprocessing
+import os
+import re
+import time
+from concurrent.futures import ProcessPoolExecutor
+from concurrent.futures.process import BrokenProcessPool
+from io import BytesIO
+from pathlib import Path
+from typing import Dict, Iterable, List, Optional, Set, Tuple
+
+import cv2
+import numpy as np
+from PIL import Image, ImageFile
+
+Image.init()
+
+# Encoders for the variant formats, best first; AVIF only where Pillow was built with it
+FORMATS = {
+    "avif": {"encoder": "AVIF", "extension": "avif", "media_type": "image/avif", "quality": 55},
+    "webp": {"encoder": "WEBP", "extension": "webp", "media_type": "image/webp", "quality": 80},
+    "jpeg": {"encoder": "JPEG", "extension": "jpg", "media_type": "image/jpeg", "quality": 85},
+}
+VARIANT_FORMATS = [name for name, spec in FORMATS.items() if spec["encoder"] in Image.SAVE]
+
+# Transform parameters; part of every store key, so changing one re-renders all images
+TRANSFORM = {
+    "blur_radius": 0.5,
+    "brightness": 1.1,
+    "contrast": 1.05,
+    "color": 0.95,
+    "max_size": [800, 600],
+    "widths": [160, 400, 800],
+    "formats": VARIANT_FORMATS,
+    "quality": {name: FORMATS[name]["quality"] for name in VARIANT_FORMATS},
+}
+
+
+def save_variants(image: Image.Image, output_prefix: str):
+    """Write `<prefix>_<w>x<h>.<ext>` for every configured width and format.
+
+    Widths at or above the image's own width collapse into one full-size
+    variant; nothing is upscaled.
+    """
+    image = image.convert("RGB")
+    for width in TRANSFORM["widths"]:
+        if width < image.width:
+            height = max(1, round(image.height * width / image.width))
+            variant = image.resize((width, height), Image.Resampling.LANCZOS)
+        else:
+            variant = image
+        for name in TRANSFORM["formats"]:
+            spec = FORMATS[name]
+            path = Path(f"{output_prefix}_{variant.width}x{variant.height}.{spec['extension']}")
+            partial_path = path.with_name(f".{path.name}.{os.getpid()}.partial")
+            variant.save(partial_path, spec["encoder"], quality=TRANSFORM["quality"][name])
+            os.replace(partial_path, path)  # readers never see a partial file
+        if variant is image:
+            break
+
+
+# Transform engine: shrink first, then one fused colour pass on the small image
+LUMA = np.array([0.299, 0.587, 0.114], dtype=np.float32)  # ITU-R 601, as PIL's "L" mode
+MIN_BLUR_SIGMA = 0.2  # below this a Gaussian kernel changes nothing visible
+
+
+def decode_image(data: bytes) -> Tuple[Image.Image, float]:
+    """Decode `data` to RGB no larger than TRANSFORM["max_size"]; returns the image and
+    its scale relative to the source.
+
+    JPEGs are decoded in draft mode, letting libjpeg skip to the smallest DCT
+    scale (1/2, 1/4, 1/8) that still covers the target size, so a 12 MP photo
+    never materializes at full resolution.
+    """
+    image = Image.open(BytesIO(data))
+    source_width = image.width
+    max_width, max_height = TRANSFORM["max_size"]
+    image.draft("RGB", (max_width, max_height))
+    image = image.convert("RGB")
+    if image.width > max_width or image.height > max_height:
+        image.thumbnail((max_width, max_height), Image.Resampling.LANCZOS)
+    return image, image.width / source_width
+
+
+def transform_image(image: Image.Image, scale: float = 1.0) -> Image.Image:
+    """Blur, brightness, contrast and colour of TRANSFORM applied to an already shrunken RGB image.
+
+    Brightness, contrast and colour are all linear, so they fold into one 3x4
+    colour matrix applied by cv2.transform in a single pass:
+    out = contrast * (color * b*x + (1 - color) * luma(b*x)) + mean * (1 - contrast).
+    The blur radius is meant for the source resolution and is scaled by the
+    shrink factor `scale`.
+    """
+    pixels = np.asarray(image)
+    sigma = TRANSFORM["blur_radius"] * scale
+    if sigma >= MIN_BLUR_SIGMA:
+        pixels = cv2.GaussianBlur(pixels, (0, 0), sigmaX=sigma)
+
+    brightness, contrast, color = TRANSFORM["brightness"], TRANSFORM["contrast"], TRANSFORM["color"]
+    mean = brightness * float(np.dot(cv2.mean(pixels)[:3], LUMA))
+    matrix = np.empty((3, 4), dtype=np.float32)
+    matrix[:, :3] = contrast * brightness * (color * np.eye(3, dtype=np.float32) + (1 - color) * LUMA[np.newaxis, :])
+    matrix[:, 3] = mean * (1 - contrast)
+    return Image.fromarray(cv2.transform(pixels, matrix))  # saturating uint8 output
+
+
+# Image Processing Functions (run in worker processes)
+def process_image(data: bytes, output_prefix: str) -> bool:
+    """Process and modify a downloaded image to avoid copyright issues, writing its size/format variants"""
+    try:
+        # Decode straight to the target size, then apply the modifications
+        # (subtle blur, brightness, contrast, colour) to avoid copyright
+        image, scale = decode_image(data)
+        image = transform_image(image, scale)
+
+        # Save every size/format variant from this one decode
+        save_variants(image, output_prefix)
+
+        return True
+
+    except Exception as e:
+        logging.error(f"Error processing image: {str(e)}")
+        return False
+
+
+# Streaming, size-capped image downloads (on the event loop, through the scrape engine)
+IMAGE_SIGNATURES = [
+    (0, b"\xff\xd8\xff"),  # JPEG
+    (0, b"\x89PNG\r\n\x1a\n"),
+    (0, b"GIF87a"),
+    (0, b"GIF89a"),
+    (8, b"WEBP"),  # RIFF....WEBP
+    (4, b"ftypavif"),
+    (0, b"BM"),
+]
+ACCEPTED_CONTENT_TYPES = ("image/", "application/octet-stream", "binary/octet-stream")
+
+
+class DownloadRejected(Exception):
+    """The response is not an image we are willing to process; `reason` is a metrics key"""
+
+    def __init__(self, reason: str, detail: str = ""):
+        super().__init__(f"{reason}: {detail}" if detail else reason)
+        self.reason = reason
+
+
+def looks_like_image(head: bytes) -> bool:
+    return any(head[offset:offset + len(signature)] == signature for offset, signature in IMAGE_SIGNATURES)
+
+
+class ImageDownloader:
+    """Streams source images through the scrape engine's HTTP client.
+
+    Downloads are rejected as early as the evidence allows: on a non-image
+    Content-Type or an oversized Content-Length before any body is read, on
+    magic bytes that are no image format after the first chunk, and on a
+    pixel count over `max_pixels` as soon as an incremental header parse
+    (ImageFile.Parser) knows the dimensions. The body is never buffered past
+    `max_bytes`. Nothing is decoded here: when the stream never revealed
+    the dimensions, the complete body is opened and verified (headers and
+    checksums, no pixels) instead; the worker's draft-mode decode does the rest.
+    """
+
+    def __init__(self, engine, max_bytes: int = 10 * 1024 * 1024, max_pixels: int = 40_000_000):
+        self.engine = engine
+        self.max_bytes = max_bytes
+        self.max_pixels = max_pixels
+        self.downloaded = 0
+        self.failed = 0
+        self.rejected: Dict[str, int] = {}
+        self.bytes_downloaded = 0
+        self.bytes_saved = 0  # announced by Content-Length but never transferred
+
+    async def download(self, url: str) -> Optional[bytes]:
+        """Image bytes of `url`; None (and counted) when the download fails or is rejected"""
+        try:
+            data = await asyncio.wait_for(self._download(url), timeout=self.engine.deadline)
+            self.downloaded += 1
+            return data
+        except DownloadRejected as e:
+            self.rejected[e.reason] = self.rejected.get(e.reason, 0) + 1
+            logging.info(f"Image download rejected, {str(e)}: {url}")
+        except Exception as e:
+            self.failed += 1
+            logging.warning(f"Image download failed for {url}: {str(e) or type(e).__name__}")
+        return None
+
+    async def _download(self, url: str) -> bytes:
+        async with self.engine.stream(url) as response:
+            if response.status_code != 200:
+                raise ValueError(f"HTTP {response.status_code}")
+            content_type = response.headers.get("content-type", "").lower()
+            if content_type and not content_type.startswith(ACCEPTED_CONTENT_TYPES):
+                raise self._abandon(response, 0, "content_type", content_type)
+            announced = int(response.headers.get("content-length") or 0)
+            if announced > self.max_bytes:
+                raise self._abandon(response, 0, "too_large", f"{announced} bytes announced")
+
+            parser = ImageFile.Parser()
+            try:
+                buffer = bytearray()
+                searching = True  # feeding the parser until it knows the dimensions
+                sniffed = False
+                async for chunk in response.aiter_bytes():
+                    buffer += chunk
+                    self.bytes_downloaded += len(chunk)
+                    if len(buffer) > self.max_bytes:
+                        raise self._abandon(response, len(buffer), "too_large", f"over {self.max_bytes} bytes")
+                    if not sniffed and len(buffer) >= 16:
+                        if not looks_like_image(bytes(buffer[:16])):
+                            raise self._abandon(response, len(buffer), "not_image", content_type or "no content type")
+                        sniffed = True
+                    if searching:
+                        searching = not self._check_header(parser, chunk, response, len(buffer))
+            finally:
+                self._release(parser)
+            if not looks_like_image(bytes(buffer[:16])):
+                raise DownloadRejected("not_image", content_type or "no content type")
+
+            data = bytes(buffer)
+            if searching:
+                try:
+                    width, height = await asyncio.to_thread(self._verify, data)
+                except Exception as e:
+                    raise DownloadRejected("corrupt", str(e) or type(e).__name__)
+                if width * height > self.max_pixels:
+                    raise DownloadRejected("too_many_pixels", f"{width}x{height}")
+            return data
+
+    def _check_header(self, parser: ImageFile.Parser, chunk: bytes, response, received: int) -> bool:
+        """Feed the header parser; True once it knows the dimensions"""
+        try:
+            parser.feed(chunk)
+        except Exception as e:
+            raise self._abandon(response, received, "corrupt", str(e) or type(e).__name__)
+        if parser.image is None:
+            return False
+        width, height = parser.image.size
+        if width * height > self.max_pixels:
+            raise self._abandon(response, received, "too_many_pixels", f"{width}x{height}")
+        return True
+
+    @staticmethod
+    def _verify(data: bytes) -> Tuple[int, int]:
+        """Dimensions of a complete image file, checked without decoding its pixels. Blocking, run in a thread."""
+        with Image.open(BytesIO(data)) as image:
+            size = image.size
+            image.verify()
+        return size
+
+    @staticmethod
+    def _release(parser: ImageFile.Parser):
+        """Close the header parser without decoding the body it buffered"""
+        parser.data = None
+        try:
+            parser.close()
+        except OSError:
+            pass  # no complete header or frame: nothing left to finalize
+
+    def _abandon(self, response, received: int, reason: str, detail: str) -> DownloadRejected:
+        announced = int(response.headers.get("content-length") or 0)
+        self.bytes_saved += max(0, announced - received)
+        return DownloadRejected(reason, detail)
+
+    def stats(self) -> dict:
+        return {
+            "downloaded": self.downloaded,
+            "failed": self.failed,
+            "rejected": dict(self.rejected),
+            "bytes_downloaded": self.bytes_downloaded,
+            "bytes_saved": self.bytes_saved,
+            "max_bytes": self.max_bytes,
+            "max_pixels": self.max_pixels,
+        }
+
+
+# Content-addressed store for processed images
+IMAGE_KEY = re.compile(r"^[0-9a-f]{32}$")
+VARIANT_NAME = re.compile(r"^[0-9a-f]{32}_(\d+)x(\d+)\.(\w+)$")
+FORMAT_BY_EXTENSION = {spec["extension"]: name for name, spec in FORMATS.items()}
+
+
+class ImageStore:
+    """Processed images on disk, keyed by hash of source URL + transform parameters.
+
+    The same source image is processed once; articles reference it as
+    `/api/images/<key>`, which never changes content and can be cached forever.
+    Each key has a set of size/format variants (see `save_variants`); files
+    no article references are removed by `collect_garbage`.
+    """
+
+    def __init__(self, root: Path, url_prefix: str = "/api/images/"):
+        self.root = Path(root)
+        self.url_prefix = url_prefix
+
+    def key(self, image_url: str) -> str:
+        material = f"{image_url}\n{json.dumps(TRANSFORM, sort_keys=True)}"
+        return hashlib.sha256(material.encode("utf-8")).hexdigest()[:32]
+
+    def directory(self, key: str) -> Path:
+        return self.root / key[:2]
+
+    def url(self, key: str) -> str:
+        return f"{self.url_prefix}{key}"
+
+    def key_from_url(self, url: Optional[str]) -> Optional[str]:
+        """Store key of an `/api/images/<key>` URL, None for anything else"""
+        if url and url.startswith(self.url_prefix):
+            key = url[len(self.url_prefix):]
+            if IMAGE_KEY.match(key):
+                return key
+        return None
+
+    def variants(self, key: str) -> List[dict]:
+        """Stored variants of `key`, narrowest first"""
+        variants = []
+        for path in self.directory(key).glob(f"{key}_*"):
+            match = VARIANT_NAME.match(path.name)
+            if match and match.group(3) in FORMAT_BY_EXTENSION:
+                width, height, extension = int(match.group(1)), int(match.group(2)), match.group(3)
+                variants.append({"width": width, "height": height, "format": FORMAT_BY_EXTENSION[extension], "path": path})
+        return sorted(variants, key=lambda variant: (variant["width"], variant["format"]))
+
+    def describe(self, key: str) -> Optional[dict]:
+        """`image_url` and `image_variants` fields of an article using this image; None if not stored"""
+        variants = self.variants(key)
+        if not variants:
+            return None
+        return {
+            "image_url": self.url(key),
+            "image_variants": [{
+                "width": variant["width"],
+                "height": variant["height"],
+                "format": variant["format"],
+                "url": f"{self.url(key)}?w={variant['width']}&format={variant['format']}",
+            } for variant in variants],
+        }
+
+    def select(self, key: str, width: Optional[int], formats: List[str]) -> Optional[dict]:
+        """Best-fit variant: the narrowest at least `width` wide (the widest when none is,
+        the widest when no width is asked for) in the first of `formats` that is stored"""
+        variants = self.variants(key)
+        for name in formats:
+            candidates = [variant for variant in variants if variant["format"] == name]
+            if candidates:
+                fitting = [variant for variant in candidates if width and variant["width"] >= width]
+                return fitting[0] if fitting else candidates[-1]
+        return None
+
+    def prepare(self, key: str) -> str:
+        directory = self.directory(key)
+        directory.mkdir(parents=True, exist_ok=True)  # the root too, on first use
+        return str(directory / key)
+
+    def collect_garbage(self, referenced: Set[str], grace_seconds: float = 3600) -> dict:
+        """Delete files whose key is not referenced; files newer than grace_seconds are kept
+        (processed but not stored yet). Blocking, run in a thread."""
+        cutoff = time.time() - grace_seconds
+        removed = kept = freed = 0
+        for path in self.root.glob("*/*"):
+            key = path.name.split(".")[0].split("_")[0]
+            stat = path.stat()
+            if key in referenced or stat.st_mtime > cutoff:
+                kept += 1
+                continue
+            path.unlink(missing_ok=True)
+            removed += 1
+            freed += stat.st_size
+        return {"removed": removed, "kept": kept, "freed_bytes": freed}
+
+    def stats(self) -> dict:
+        files = [path for path in self.root.glob("*/*") if path.is_file()]
+        return {"root": str(self.root), "files": len(files), "bytes": sum(path.stat().st_size for path in files)}
+
+
+# Process pool that keeps image work off the event loop
+class ImageProcessor:
+    """Runs image jobs in a process pool sized to the CPU count.
+
+    Source images are downloaded on the event loop by `downloader`, decoded
+    and transformed in the pool. Jobs are awaited with a per-job timeout (a timed-out job still finishes in
+    its worker, its result is discarded). Workers are spawned rather than
+    forked so they never inherit the server's event loop or database client
+    threads.
+    """
+
+    def __init__(self, store: ImageStore, downloader: ImageDownloader, workers: Optional[int] = None, timeout: float = 30.0):
+        self.store = store
+        self.downloader = downloader
+        self.workers = workers or os.cpu_count() or 1
+        self.timeout = timeout
+        self._executor: Optional[ProcessPoolExecutor] = None
+        self._in_flight: Dict[str, asyncio.Future] = {}
+        self.cache_hits = 0
+        self.pending = 0
+        self.max_pending = 0
+        self.completed = 0
+        self.failed = 0
+        self.timed_out = 0
+        self.total_ms = 0.0
+
+    @property
+    def executor(self) -> ProcessPoolExecutor:
+        if self._executor is None:
+            self._executor = ProcessPoolExecutor(max_workers=self.workers, mp_context=multiprocessing.get_context("spawn"))
+        return self._executor
+
+    async def submit(self, func, *args):
+        """Run `func(*args)` in a worker; None on failure or timeout"""
+        self.pending += 1
+        self.max_pending = max(self.max_pending, self.pending)
+        started = time.monotonic()
+        try:
+            future = asyncio.get_running_loop().run_in_executor(self.executor, func, *args)
+            result = await asyncio.wait_for(future, timeout=self.timeout)
+            self.completed += 1
+            return result
+        except asyncio.TimeoutError:
+            self.timed_out += 1
+            logging.warning(f"Image job {func.__name__} timed out after {self.timeout}s")
+        except BrokenProcessPool as e:
+            self.failed += 1
+            self._executor = None  # a worker died; start a fresh pool for the next job
+            logging.error(f"Image worker pool broke, restarting: {str(e)}")
+        except Exception as e:
+            self.failed += 1
+            logging.error(f"Image job {func.__name__} failed: {str(e)}")
+        finally:
+            self.pending -= 1
+            self.total_ms += (time.monotonic() - started) * 1000
+        return None
+
+    async def process_image(self, image_url: Optional[str]) -> Optional[dict]:
+        """Article image fields (see `ImageStore.describe`) for a source image URL; None for a
+        missing URL or a failed job"""
+        if not image_url:
+            return None
+        # Store lookups glob the store directory: off the event loop
+        if self.store.key_from_url(image_url):  # already processed
+            return await asyncio.to_thread(self.store.describe, self.store.key_from_url(image_url))
+        key = self.store.key(image_url)
+        stored = await asyncio.to_thread(self.store.describe, key)
+        if stored:
+            self.cache_hits += 1
+            return stored
+        # The same source image requested twice at once is processed once
+        if key not in self._in_flight:
+            self._in_flight[key] = asyncio.ensure_future(self._download_and_process(image_url, key))
+            self._in_flight[key].add_done_callback(lambda _: self._in_flight.pop(key, None))
+        processed = await asyncio.shield(self._in_flight[key])
+        return await asyncio.to_thread(self.store.describe, key) if processed else None
+
+    async def _download_and_process(self, image_url: str, key: str) -> bool:
+        data = await self.downloader.download(image_url)
+        if data is None:
+            return False
+        output_prefix = await asyncio.to_thread(self.store.prepare, key)
+        return bool(await self.submit(process_image, data, output_prefix))
+
+    async def process_images(self, image_urls: Iterable[Optional[str]]) -> List[Optional[dict]]:
+        """Process a batch of images concurrently"""
+        return list(await asyncio.gather(*[self.process_image(image_url) for image_url in image_urls]))
+
+    def shutdown(self):
+        if self._executor is not None:
+            self._executor.shutdown(wait=False, cancel_futures=True)
+            self._executor = None
+
+    def stats(self) -> dict:
+        finished = self.completed + self.failed + self.timed_out
+        return {
+            "workers": self.workers,
+            "queue_depth": self.pending,
+            "max_queue_depth": self.max_pending,
+            "cache_hits": self.cache_hits,
+            "completed": self.completed,
+            "failed": self.failed,
+            "timed_out": self.timed_out,
+            "avg_ms": round(self.total_ms / finished, 1) if finished else 0.0,
+        }
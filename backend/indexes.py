@@ -0,0 +1,103 @@
+import logging
+from typing import List
+
+from pymongo import ASCENDING, DESCENDING, IndexModel
+from pymongo.errors import OperationFailure
+
+
+# Indexes required by the hot read paths, per collection
+REQUIRED_INDEXES = {
+    "news_articles": [
+        # get_article, toggles, view counter flushes
+        IndexModel([("id", ASCENDING)], name="id_unique", unique=True),
+        # unfiltered feed, keyset pages
+        IndexModel([("published_at", DESCENDING), ("id", DESCENDING)], name="published_at_id"),
+        # filtered feeds sorted by recency
+        IndexModel([("category", ASCENDING), ("published_at", DESCENDING), ("id", DESCENDING)], name="category_published_at"),
+        IndexModel([("is_breaking", ASCENDING), ("published_at", DESCENDING), ("id", DESCENDING)], name="is_breaking_published_at"),
+        IndexModel([("is_featured", ASCENDING), ("published_at", DESCENDING), ("id", DESCENDING)], name="is_featured_published_at"),
+        # batch dedup of scraped titles; unique so concurrent runs cannot both insert a story.
+        # Partial: only fingerprinted (scraped) articles take part, manual articles may share titles
+        IndexModel([("title_fingerprint", ASCENDING)], name="title_fingerprint_unique", unique=True,
+                   partialFilterExpression={"title_fingerprint": {"$exists": True}}),
+    ],
+    "status_checks": [
+        IndexModel([("timestamp", DESCENDING)], name="timestamp"),
+    ],
+}
+
+# Indexes no query uses any more, dropped on startup when present
+RETIRED_INDEXES = {
+    "news_articles": ["title_is_breaking"],
+}
+
+
+async def ensure_indexes(db) -> dict:
+    """Create the required indexes; safe to run on every startup.
+
+    Runs as a startup task so the API serves requests while indexes build
+    (MongoDB 4.2+ builds never hold an exclusive collection lock).
+    """
+    report = {}
+    for collection_name, names in RETIRED_INDEXES.items():
+        existing = await db[collection_name].index_information()
+        for name in names:
+            if name in existing:
+                await db[collection_name].drop_index(name)
+                report[f"{collection_name}.{name}"] = "dropped"
+    for collection_name, models in REQUIRED_INDEXES.items():
+        collection = db[collection_name]
+        for model in models:
+            name = model.document["name"]
+            try:
+                await collection.create_indexes([model])
+                report[f"{collection_name}.{name}"] = "ok"
+            except OperationFailure as e:
+                # An index on the same keys with other options, or duplicate ids for the unique index
+                logging.error(f"Could not create index {collection_name}.{name}: {str(e)}")
+                report[f"{collection_name}.{name}"] = f"failed: {e.details.get('errmsg', str(e)) if e.details else str(e)}"
+    logging.info(f"Index bootstrap finished: {report}")
+    return report
+
+
+def hot_queries() -> List[dict]:
+    """The queries the API issues on every request, in explain() command form"""
+    newest_first = {"published_at": -1}
+    return [
+        {"name": "get_article", "command": {"find": "news_articles", "filter": {"id": "00000000-0000-0000-0000-000000000000"}, "limit": 1}},
+        {"name": "news_feed", "command": {"find": "news_articles", "filter": {}, "sort": newest_first, "limit": 20}},
+        {"name": "news_by_category", "command": {"find": "news_articles", "filter": {"category": "রাজনীতি"}, "sort": newest_first, "limit": 20}},
+        {"name": "featured_news", "command": {"find": "news_articles", "filter": {"is_featured": True}, "sort": newest_first, "limit": 20}},
+        {"name": "breaking_news", "command": {"find": "news_articles", "filter": {"is_breaking": True}, "sort": newest_first, "limit": 20}},
+        {"name": "title_fingerprint_dedup", "command": {"find": "news_articles", "filter": {"title_fingerprint": {"$exists": True, "$in": [""]}}, "projection": {"_id": 0, "title_fingerprint": 1}}},
+    ]
+
+
+def _plan_stages(plan: dict) -> List[dict]:
+    stages = [plan]
+    for child in [plan.get("inputStage")] + plan.get("inputStages", []):
+        if child:
+            stages.extend(_plan_stages(child))
+    return stages
+
+
+async def explain_hot_queries(db) -> List[dict]:
+    """Report for every hot query whether its winning plan is served by an index"""
+    results = []
+    for query in hot_queries():
+        try:
+            explained = await db.command({"explain": query["command"], "verbosity": "queryPlanner"})
+            winning_plan = explained["queryPlanner"]["winningPlan"]
+            # Slot-based engine (MongoDB 5.0+) nests the classic plan under "queryPlan"
+            stages = _plan_stages(winning_plan.get("queryPlan", winning_plan))
+            stage_names = [stage["stage"] for stage in stages]
+            results.append({
+                "query": query["name"],
+                "covered": "COLLSCAN" not in stage_names,
+                "in_memory_sort": "SORT" in stage_names,
+                "indexes": [stage["indexName"] for stage in stages if "indexName" in stage],
+                "stages": stage_names,
+            })
+        except Exception as e:
+            results.append({"query": query["name"], "covered": False, "error": str(e)})
+    return results
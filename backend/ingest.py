@@ -0,0 +1,58 @@
+import logging
+from typing import List
+
+from pymongo import InsertOne, UpdateOne
+from pymongo.errors import BulkWriteError
+
+from fingerprints import FINGERPRINT_FIELD, title_fingerprint
+
+DUPLICATE_KEY = 11000
+
+
+# One-round-trip, idempotent batch writes for news_articles
+def with_fingerprint(document: dict) -> dict:
+    """Add the title fingerprint to a scraped article. Generated and manual articles stay out
+    of title dedup (they may share titles, e.g. the AI fallback titles repeat on every run)."""
+    if document.get("source"):
+        return {**document, FINGERPRINT_FIELD: title_fingerprint(document["title"])}
+    return document
+
+
+async def insert_articles(collection, documents: List[dict]) -> List[dict]:
+    """Write a batch of article documents with one unordered bulk_write and return those actually stored.
+
+    Fingerprinted documents are upserts with $setOnInsert keyed on the
+    fingerprint, so re-running a batch or racing another run never stores a
+    story twice; the rest are plain inserts. One failing document does not
+    stop the others.
+    """
+    if not documents:
+        return []
+    operations = []
+    for document in documents:
+        if document.get(FINGERPRINT_FIELD):
+            fields = {key: value for key, value in document.items() if key != FINGERPRINT_FIELD}
+            operations.append(UpdateOne({FINGERPRINT_FIELD: document[FINGERPRINT_FIELD]}, {"$setOnInsert": fields}, upsert=True))
+        else:
+            operations.append(InsertOne(document))
+
+    try:
+        result = await collection.bulk_write(operations, ordered=False)
+        upserted = result.upserted_ids
+        failed = set()
+    except BulkWriteError as e:
+        upserted = {entry["index"]: entry["_id"] for entry in e.details.get("upserted", [])}
+        failed = {error["index"] for error in e.details.get("writeErrors", [])}
+        unexpected = [error for error in e.details.get("writeErrors", []) if error.get("code") != DUPLICATE_KEY]
+        if unexpected:
+            logging.error(f"Article batch write errors: {unexpected}")
+
+    stored = []
+    for index, (operation, document) in enumerate(zip(operations, documents)):
+        if isinstance(operation, UpdateOne):
+            if index in upserted:
+                document["_id"] = upserted[index]
+                stored.append(document)
+        elif index not in failed:
+            stored.append(document)
+    return stored
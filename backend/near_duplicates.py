@@ -0,0 +1,104 @@
+import hashlib
+from collections import OrderedDict, defaultdict
+from typing import Dict, Optional, Set, Tuple
+
+import numpy as np
+
+from fingerprints import normalize_title
+
+
+# Near-duplicate headline detection: MinHash over character shingles + LSH banding.
+# Permutations are (a * x + b) mod p with p = 2^31 - 1, so a, b, x < p keep every product below 2^63
+_MERSENNE_PRIME = np.uint64((1 << 31) - 1)
+
+
+class NearDuplicateIndex:
+    """In-memory MinHash LSH index of recent article titles.
+
+    Titles are normalized like the exact fingerprints, cut into character
+    shingles and reduced to `num_perm` MinHash values. Signatures are split
+    into bands; articles sharing any band are candidates, and a candidate
+    counts as a duplicate when the estimated Jaccard similarity of the two
+    shingle sets reaches `threshold`. The oldest entries are evicted beyond
+    `max_entries`.
+    """
+
+    def __init__(self, threshold: float = 0.7, num_perm: int = 128, bands: int = 32, shingle_size: int = 3, max_entries: int = 20000):
+        if num_perm % bands:
+            raise ValueError("num_perm must be a multiple of bands")
+        self.threshold = threshold
+        self.num_perm = num_perm
+        self.bands = bands
+        self.rows = num_perm // bands
+        self.shingle_size = shingle_size
+        self.max_entries = max_entries
+        generator = np.random.default_rng(1)  # fixed, so signatures are comparable across restarts
+        self._a = generator.integers(1, int(_MERSENNE_PRIME), num_perm, dtype=np.uint64)
+        self._b = generator.integers(0, int(_MERSENNE_PRIME), num_perm, dtype=np.uint64)
+        self._signatures: "OrderedDict[str, np.ndarray]" = OrderedDict()
+        self._buckets: Dict[Tuple[int, bytes], Set[str]] = defaultdict(set)
+
+    def shingles(self, title: str) -> Set[str]:
+        text = normalize_title(title)
+        if len(text) <= self.shingle_size:
+            return {text}
+        return {text[i:i + self.shingle_size] for i in range(len(text) - self.shingle_size + 1)}
+
+    def signature(self, title: str) -> np.ndarray:
+        hashes = np.fromiter(
+            (int.from_bytes(hashlib.blake2b(shingle.encode("utf-8"), digest_size=4).digest(), "little") for shingle in self.shingles(title)),
+            dtype=np.uint64
+        ) % _MERSENNE_PRIME
+        return ((self._a[:, None] * hashes[None, :] + self._b[:, None]) % _MERSENNE_PRIME).min(axis=1)
+
+    def _band_keys(self, signature: np.ndarray):
+        for band in range(self.bands):
+            yield band, signature[band * self.rows:(band + 1) * self.rows].tobytes()
+
+    def similarity(self, first: np.ndarray, second: np.ndarray) -> float:
+        return float(np.count_nonzero(first == second)) / self.num_perm
+
+    def best_match(self, signature: np.ndarray) -> Optional[Tuple[str, float]]:
+        """Most similar indexed article at or above the threshold, as (id, estimated similarity)"""
+        candidates = set()
+        for key in self._band_keys(signature):
+            candidates |= self._buckets.get(key, set())
+        best = None
+        for article_id in candidates:
+            score = self.similarity(signature, self._signatures[article_id])
+            if score >= self.threshold and (best is None or score > best[1]):
+                best = (article_id, score)
+        return best
+
+    def add(self, article_id: str, signature: np.ndarray):
+        if article_id in self._signatures:
+            self.remove(article_id)
+        self._signatures[article_id] = signature
+        for key in self._band_keys(signature):
+            self._buckets[key].add(article_id)
+        while len(self._signatures) > self.max_entries:
+            self.remove(next(iter(self._signatures)))
+
+    def remove(self, article_id: str):
+        signature = self._signatures.pop(article_id, None)
+        if signature is None:
+            return
+        for key in self._band_keys(signature):
+            bucket = self._buckets.get(key)
+            if bucket is not None:
+                bucket.discard(article_id)
+                if not bucket:
+                    del self._buckets[key]
+
+    def clear(self):
+        self._signatures.clear()
+        self._buckets.clear()
+
+    def stats(self) -> dict:
+        return {
+            "entries": len(self._signatures),
+            "buckets": len(self._buckets),
+            "threshold": self.threshold,
+            "num_perm": self.num_perm,
+            "bands": self.bands,
+        }
@@ -0,0 +1,48 @@
+import base64
+import json
+from datetime import datetime
+from typing import List, Optional, Tuple
+
+
+# Keyset (cursor) pagination over (published_at, id), newest first
+KEYSET_SORT = [("published_at", -1), ("id", -1)]
+
+
+class InvalidCursor(ValueError):
+    pass
+
+
+def encode_cursor(article: dict) -> str:
+    """Opaque cursor pointing just after the given article"""
+    payload = json.dumps({"p": article["published_at"].isoformat(), "i": article["id"]}, separators=(",", ":"))
+    return base64.urlsafe_b64encode(payload.encode("utf-8")).decode("ascii").rstrip("=")
+
+
+def decode_cursor(cursor: str) -> Tuple[datetime, str]:
+    try:
+        padded = cursor + "=" * (-len(cursor) % 4)
+        payload = json.loads(base64.urlsafe_b64decode(padded.encode("ascii")))
+        return datetime.fromisoformat(payload["p"]), str(payload["i"])
+    except (ValueError, KeyError, TypeError) as e:
+        raise InvalidCursor(str(e))
+
+
+def keyset_query(query: dict, cursor: Optional[str]) -> dict:
+    """Restrict `query` to the articles that come after `cursor` (empty cursor = first page)"""
+    if not cursor:
+        return query
+    published_at, article_id = decode_cursor(cursor)
+    after = {"$or": [
+        {"published_at": {"$lt": published_at}},
+        {"published_at": published_at, "id": {"$lt": article_id}},
+    ]}
+    return {"$and": [query, after]} if query else after
+
+
+async def fetch_page(collection, query: dict, cursor: Optional[str], limit: int, projection: Optional[dict] = None) -> Tuple[List[dict], Optional[str]]:
+    """Fetch one keyset page and the cursor of the next one (None on the last page)"""
+    articles = await collection.find(keyset_query(query, cursor), projection).sort(KEYSET_SORT).limit(limit + 1).to_list(length=None)
+    if len(articles) <= limit:
+        return articles, None
+    articles = articles[:limit]
+    return articles, encode_cursor(articles[-1])
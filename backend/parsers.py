@@ -0,0 +1,179 @@
+from functools import lru_cache
+from typing import Callable, Dict, List, NamedTuple, Optional, Tuple, Union
+
+import soupsieve
+from bs4 import BeautifulSoup, SoupStrainer
+from bs4.dammit import EncodingDetector
+from lxml import etree
+from lxml import html as lxml_html
+
+try:
+    from selectolax.lexbor import LexborHTMLParser
+except ImportError:  # optional: pip install selectolax
+    LexborHTMLParser = None
+
+
+# Pluggable headline parsers. Every backend finds the same containers as the
+# original BeautifulSoup + lambda scan (tag in container_tags, class contains a
+# keyword case-insensitively, first max_items in document order) and reads the
+# first title tag and first image inside each one. Pages are passed as the raw
+# response bytes (so each backend honours the declared charset), or as text.
+class Headline(NamedTuple):
+    markup: str  # container markup, hashed to detect an unchanged region
+    title: Optional[str]  # None when the container has no title tag
+    link: str  # href of the title when it is an <a>, else ""
+    image: Optional[str]  # src of the first <img>
+
+
+Document = Union[bytes, str]
+ParserFunc = Callable[[object, Document], List[Headline]]
+
+
+def _source_key(source) -> Tuple[tuple, tuple, tuple]:
+    return tuple(source.container_tags), tuple(keyword.lower() for keyword in source.class_keywords), tuple(source.title_tags)
+
+
+def _css_containers(container_tags: tuple, keywords: tuple) -> str:
+    # One compound selector rather than a tag x keyword list, so an element matching several keywords is returned once
+    return f":is({', '.join(container_tags)}):is({', '.join(f'[class*={keyword!r} i]' for keyword in keywords)})"
+
+
+# html.parser: the original full-tree scan, kept as the reference implementation
+def parse_html_parser(source, document: Document) -> List[Headline]:
+    soup = BeautifulSoup(document, 'html.parser')
+    keywords = [keyword.lower() for keyword in source.class_keywords]
+    elements = soup.find_all(source.container_tags, class_=lambda x: x and any(keyword in x.lower() for keyword in keywords))[:source.max_items]
+    return [_bs4_headline(source, element) for element in elements]
+
+
+def _bs4_headline(source, element) -> Headline:
+    title_elem = element.find(source.title_tags)
+    img_elem = element.find('img')
+    return Headline(
+        markup=str(element),
+        title=title_elem.get_text(strip=True) if title_elem else None,
+        link=title_elem.get('href', '') if title_elem and title_elem.name == 'a' else '',
+        image=img_elem.get('src') if img_elem else None,
+    )
+
+
+# soupstrainer: lxml tree builder restricted to matching containers, precompiled soupsieve selector
+@lru_cache(maxsize=None)
+def _strainer_selectors(container_tags: tuple, keywords: tuple) -> Tuple[SoupStrainer, soupsieve.SoupSieve]:
+    strainer = SoupStrainer(list(container_tags), class_=lambda x: x and any(keyword in x.lower() for keyword in keywords))
+    return strainer, soupsieve.compile(_css_containers(container_tags, keywords))
+
+
+def parse_soupstrainer(source, document: Document) -> List[Headline]:
+    container_tags, keywords, _ = _source_key(source)
+    strainer, selector = _strainer_selectors(container_tags, keywords)
+    soup = BeautifulSoup(document, 'lxml', parse_only=strainer)
+    return [_bs4_headline(source, element) for element in selector.select(soup, limit=source.max_items)]
+
+
+# lxml: C tree builder with precompiled XPath expressions
+@lru_cache(maxsize=None)
+def _lxml_parser(encoding: str) -> lxml_html.HTMLParser:
+    return lxml_html.HTMLParser(encoding=encoding)
+
+
+def parse_html_document(document: Document) -> Optional[etree._Element]:
+    """lxml tree of an HTML page; None for an empty page.
+
+    Bytes are decoded with the charset the page declares (<meta> or an XML
+    declaration), UTF-8 otherwise. Text is re-encoded as UTF-8 first, since
+    lxml refuses str input that carries an encoding declaration.
+    """
+    if isinstance(document, str):
+        document, encoding = document.encode("utf-8"), "utf-8"
+    else:
+        encoding = EncodingDetector.find_declared_encoding(document, is_html=True) or "utf-8"
+    if not document.strip():
+        return None
+    try:
+        return lxml_html.document_fromstring(document, parser=_lxml_parser(encoding))
+    except (etree.ParserError, LookupError):  # nothing but whitespace/comments, or an unknown charset name
+        if encoding == "utf-8":
+            return None
+        return parse_html_document(document.decode("utf-8", errors="replace"))
+
+
+@lru_cache(maxsize=None)
+def _lxml_selectors(container_tags: tuple, keywords: tuple, title_tags: tuple, max_items: int) -> Tuple[etree.XPath, etree.XPath, etree.XPath]:
+    lowered_class = "translate(@class, 'ABCDEFGHIJKLMNOPQRSTUVWXYZ', 'abcdefghijklmnopqrstuvwxyz')"
+    tags = " or ".join(f"self::{tag}" for tag in container_tags)
+    matches = " or ".join(f"contains({lowered_class}, '{keyword}')" for keyword in keywords)
+    return (
+        etree.XPath(f"(//*[{tags}][{matches}])[position() <= {max_items}]"),
+        etree.XPath("(" + " | ".join(f".//{tag}" for tag in title_tags) + ")[1]"),
+        etree.XPath("(.//img)[1]"),
+    )
+
+
+def parse_lxml(source, document: Document) -> List[Headline]:
+    containers, first_title, first_image = _lxml_selectors(*_source_key(source), source.max_items)
+    tree = parse_html_document(document)
+    if tree is None:
+        return []
+    headlines = []
+    for element in containers(tree):
+        titles, images = first_title(element), first_image(element)
+        title_elem = titles[0] if titles else None
+        headlines.append(Headline(
+            markup=etree.tostring(element, encoding="unicode", with_tail=False),
+            title="".join(part.strip() for part in title_elem.itertext()) if title_elem is not None else None,
+            link=title_elem.get('href', '') if title_elem is not None and title_elem.tag == 'a' else '',
+            image=images[0].get('src') if images else None,
+        ))
+    return headlines
+
+
+# selectolax: lexbor parser with CSS selectors evaluated natively (optional dependency)
+@lru_cache(maxsize=None)
+def _selectolax_selectors(container_tags: tuple, keywords: tuple, title_tags: tuple) -> Tuple[str, str]:
+    return _css_containers(container_tags, keywords), ", ".join(title_tags)
+
+
+def _decoded(document: Document) -> str:
+    # lexbor reads bytes as UTF-8 regardless of the declared charset
+    if isinstance(document, str):
+        return document
+    encoding = EncodingDetector.find_declared_encoding(document, is_html=True) or "utf-8"
+    try:
+        return document.decode(encoding, errors="replace")
+    except LookupError:
+        return document.decode("utf-8", errors="replace")
+
+
+def parse_selectolax(source, document: Document) -> List[Headline]:
+    containers, titles = _selectolax_selectors(*_source_key(source))
+    headlines = []
+    for element in LexborHTMLParser(_decoded(document)).css(containers)[:source.max_items]:
+        title_elem = element.css_first(titles)
+        img_elem = element.css_first('img')
+        headlines.append(Headline(
+            markup=element.html,
+            title=title_elem.text(deep=True, separator='', strip=True) if title_elem is not None else None,
+            link=(title_elem.attributes.get('href') or '') if title_elem is not None and title_elem.tag == 'a' else '',
+            image=img_elem.attributes.get('src') if img_elem is not None else None,
+        ))
+    return headlines
+
+
+PARSERS: Dict[str, ParserFunc] = {
+    "html.parser": parse_html_parser,
+    "soupstrainer": parse_soupstrainer,
+    "lxml": parse_lxml,
+    "selectolax": parse_selectolax,
+}
+
+
+def available_parsers() -> List[str]:
+    return [name for name in PARSERS if name != "selectolax" or LexborHTMLParser is not None]
+
+
+def get_parser(name: str) -> ParserFunc:
+    """Parser backend by name; raises ValueError for unknown or uninstalled backends"""
+    if name not in available_parsers():
+        raise ValueError(f"Unknown or unavailable HTML parser '{name}' (available: {', '.join(available_parsers())})")
+    return PARSERS[name]
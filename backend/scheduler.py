@@ -0,0 +1,114 @@
+import asyncio
+import random
+import time
+from typing import Dict, Iterable, List, Optional
+
+
+# Adaptive per-source polling cadence for the breaking news scraper
+class SourceCadence:
+    def __init__(self, interval: float):
+        self.interval = interval
+        self.next_due = 0.0  # monotonic; a new source is due immediately
+        self.failures = 0
+        self.last_new_items = 0
+
+
+class AdaptiveScheduler:
+    """Keeps a polling interval per source around the configured base interval.
+
+    A source that produced new headlines is polled sooner (interval x speedup),
+    an idle one backs off (interval x backoff) and a failing one backs off
+    exponentially from the base, always within [min_interval, max_interval]
+    and with +/- jitter so sources do not fire in lockstep. `wake()` interrupts
+    the current sleep, e.g. when the admin changes the interval.
+    """
+
+    def __init__(self, base_interval: float, min_interval: float = 60.0, max_interval: float = 3600.0,
+                 speedup: float = 0.5, backoff: float = 1.5, jitter: float = 0.1):
+        self.base_interval = base_interval
+        self.min_interval = min_interval
+        self.max_interval = max_interval
+        self.speedup = speedup
+        self.backoff = backoff
+        self.jitter = jitter
+        self.cycle_failures = 0
+        self._cadences: Dict[str, SourceCadence] = {}
+        self._wakeup = asyncio.Event()
+
+    def _clamp(self, interval: float) -> float:
+        return min(max(interval, self.min_interval), max(self.max_interval, self.base_interval))
+
+    def _jittered(self, interval: float) -> float:
+        return interval * random.uniform(1 - self.jitter, 1 + self.jitter)
+
+    def _cadence(self, key: str) -> SourceCadence:
+        if key not in self._cadences:
+            self._cadences[key] = SourceCadence(self._clamp(self.base_interval))
+        return self._cadences[key]
+
+    def set_base_interval(self, seconds: float):
+        """Apply a new base interval; every source restarts from it and is rescheduled right away"""
+        if seconds == self.base_interval:
+            return
+        self.base_interval = seconds
+        now = time.monotonic()
+        for cadence in self._cadences.values():
+            cadence.interval = self._clamp(seconds)
+            cadence.next_due = min(cadence.next_due, now + self._jittered(cadence.interval))
+
+    def due(self, keys: Iterable[str]) -> List[str]:
+        now = time.monotonic()
+        return [key for key in keys if self._cadence(key).next_due <= now]
+
+    def record(self, key: str, new_items: int, failed: bool = False):
+        """Feed back one poll of `key` and schedule its next one"""
+        cadence = self._cadence(key)
+        if failed:
+            cadence.failures += 1
+            cadence.interval = self._clamp(self.base_interval * 2 ** cadence.failures)
+        elif new_items:
+            cadence.failures = 0
+            cadence.interval = self._clamp(cadence.interval * self.speedup)
+        else:
+            cadence.failures = 0
+            cadence.interval = self._clamp(cadence.interval * self.backoff)
+        cadence.last_new_items = new_items
+        cadence.next_due = time.monotonic() + self._jittered(cadence.interval)
+
+    def cycle_failed(self) -> float:
+        """Delay before retrying after a whole cycle failed (e.g. the database is unreachable)"""
+        self.cycle_failures += 1
+        return self._jittered(min(self.min_interval * 2 ** (self.cycle_failures - 1), self.max_interval))
+
+    def cycle_succeeded(self):
+        self.cycle_failures = 0
+
+    def seconds_until_next(self, keys: Iterable[str]) -> float:
+        now = time.monotonic()
+        return max(0.0, min((self._cadence(key).next_due - now for key in keys), default=self.base_interval))
+
+    def wake(self):
+        self._wakeup.set()
+
+    async def sleep(self, seconds: float):
+        """Sleep up to `seconds`, returning early when woken"""
+        try:
+            await asyncio.wait_for(self._wakeup.wait(), timeout=seconds)
+        except asyncio.TimeoutError:
+            pass
+        self._wakeup.clear()
+
+    def stats(self, keys: Optional[Iterable[str]] = None) -> dict:
+        now = time.monotonic()
+        return {
+            "base_interval": self.base_interval,
+            "sources": {
+                key: {
+                    "interval": round(cadence.interval, 1),
+                    "due_in": round(max(0.0, cadence.next_due - now), 1),
+                    "failures": cadence.failures,
+                    "last_new_items": cadence.last_new_items,
+                }
+                for key, cadence in self._cadences.items() if keys is None or key in keys
+            },
+        }
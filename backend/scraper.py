@@ -0,0 +1,350 @@
+import asyncio
+import hashlib
+import logging
+import statistics
+import time
+from collections import deque
+from contextlib import asynccontextmanager
+from datetime import datetime, timezone
+from typing import Dict, List, Optional, Tuple
+from urllib.parse import urljoin, urlsplit
+
+import httpx
+from pydantic import BaseModel, Field
+
+from parsers import Document, Headline, ParserFunc, get_parser, parse_lxml
+
+
+DEFAULT_HEADERS = {
+    'User-Agent': 'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/91.0.4472.124 Safari/537.36'
+}
+
+
+# Non-blocking HTTP engine shared by all scraping
+class ScrapeEngine:
+    """Pooled async HTTP client with keep-alive, per-host connection limits
+    and a deadline that bounds each source (and so each concurrent cycle),
+    plus the HTML parser backend used on the fetched pages"""
+
+    def __init__(self, timeout: float = 10.0, deadline: float = 15.0, per_host_limit: int = 2, max_connections: int = 20, parser: str = "lxml"):
+        self.timeout = timeout
+        self.deadline = deadline
+        self.per_host_limit = per_host_limit
+        self.max_connections = max_connections
+        self.parser_name = parser
+        self.parser = get_parser(parser)
+        self.metrics = ScrapeMetrics()
+        self._client: Optional[httpx.AsyncClient] = None
+        self._host_slots: Dict[str, asyncio.Semaphore] = {}
+
+    @property
+    def client(self) -> httpx.AsyncClient:
+        if self._client is None or self._client.is_closed:
+            self._client = httpx.AsyncClient(
+                headers=DEFAULT_HEADERS,
+                timeout=self.timeout,
+                follow_redirects=True,
+                limits=httpx.Limits(max_connections=self.max_connections, max_keepalive_connections=self.max_connections)
+            )
+        return self._client
+
+    async def close(self):
+        if self._client is not None:
+            await self._client.aclose()
+            self._client = None
+
+    def _host_slot(self, url: str) -> asyncio.Semaphore:
+        host = urlsplit(url).netloc
+        if host not in self._host_slots:
+            self._host_slots[host] = asyncio.Semaphore(self.per_host_limit)
+        return self._host_slots[host]
+
+    async def fetch(self, url: str, headers: Optional[dict] = None) -> httpx.Response:
+        async with self._host_slot(url):
+            return await self.client.get(url, headers=headers)
+
+    @asynccontextmanager
+    async def stream(self, url: str, headers: Optional[dict] = None):
+        """Streaming GET under the same per-host limit; the caller reads (or abandons) the body"""
+        async with self._host_slot(url):
+            async with self.client.stream("GET", url, headers=headers) as response:
+                yield response
+
+
+# Declarative source registry
+class ScraperSource(BaseModel):
+    key: str
+    name: str  # stored as the article's `source`
+    url: str  # page that lists the headlines
+    base_url: str  # for resolving relative links and images
+    class_keywords: List[str]  # containers whose class contains any of these
+    container_tags: List[str] = ["div", "article"]
+    title_tags: List[str] = ["h1", "h2", "h3", "h4", "a"]
+    max_items: int = 2
+    content_template: str = "{name} থেকে প্রাপ্ত সংবাদ: {title}"
+    enabled: bool = True
+
+
+SCRAPER_SOURCES: Dict[str, ScraperSource] = {source.key: source for source in [
+    ScraperSource(
+        key="somoynews", name="সময় টিভি",
+        url="https://www.somoynews.tv/bangla", base_url="https://www.somoynews.tv",
+        class_keywords=["breaking", "urgent", "latest"], max_items=3,
+        content_template="{name} থেকে প্রাপ্ত ব্রেকিং নিউজ: {title}",
+    ),
+    ScraperSource(
+        key="jamuna", name="যমুনা টিভি",
+        url="https://www.jamuna.tv", base_url="https://www.jamuna.tv",
+        class_keywords=["news", "item"], max_items=3,
+        content_template="{name} থেকে প্রাপ্ত গুরুত্বপূর্ণ সংবাদ: {title}",
+    ),
+    ScraperSource(
+        key="prothomalo", name="প্রথম আলো",
+        url="https://www.prothomalo.com", base_url="https://www.prothomalo.com",
+        class_keywords=["story", "news"],
+    ),
+    ScraperSource(
+        key="bdnews24", name="বিডিনিউজ টোয়েন্টিফোর",
+        url="https://bangla.bdnews24.com", base_url="https://bangla.bdnews24.com",
+        class_keywords=["latest", "lead", "story"],
+    ),
+    ScraperSource(
+        key="channel24", name="চ্যানেল টোয়েন্টিফোর",
+        url="https://www.channel24bd.tv", base_url="https://www.channel24bd.tv",
+        class_keywords=["latest", "news-item", "lead"],
+    ),
+    ScraperSource(
+        key="banglanews24", name="বাংলানিউজ টোয়েন্টিফোর",
+        url="https://www.banglanews24.com", base_url="https://www.banglanews24.com",
+        class_keywords=["latest", "highlight", "news"],
+    ),
+]}
+
+
+def point_sources_at(base_url: str):
+    """Fetch every source from `{base_url}/{key}` (e.g. the offline replay server) instead of the live site"""
+    for key, source in SCRAPER_SOURCES.items():
+        SCRAPER_SOURCES[key] = source.model_copy(update={"url": f"{base_url.rstrip('/')}/{key}"})
+
+
+class SourceResult(BaseModel):
+    source: str
+    items: List[dict] = []
+    status_code: Optional[int] = None
+    error: Optional[str] = None
+    fetch_ms: float = 0.0
+    parse_ms: float = 0.0
+    unchanged: bool = False  # 304, same page/region or same headline set: nothing to dedup or insert
+    state: Optional[dict] = Field(default=None, exclude=True)  # to save once the items are stored (save_states)
+
+    @property
+    def failed(self) -> bool:
+        return self.error is not None or self.status_code not in (200, 304)
+
+
+class ScrapeMetrics:
+    """Per-source poll outcomes and recent fetch/parse latencies"""
+
+    def __init__(self, window: int = 256):
+        self.window = window
+        self._sources: Dict[str, dict] = {}
+
+    def record(self, result: SourceResult):
+        source = self._sources.setdefault(result.source, {
+            "polls": 0, "errors": 0, "unchanged": 0, "items": 0,
+            "fetch_ms": deque(maxlen=self.window), "parse_ms": deque(maxlen=self.window),
+        })
+        source["polls"] += 1
+        source["errors"] += result.failed
+        source["unchanged"] += result.unchanged
+        source["items"] += len(result.items)
+        source["fetch_ms"].append(result.fetch_ms)
+        if result.parse_ms:
+            source["parse_ms"].append(result.parse_ms)
+
+    @staticmethod
+    def _percentile(samples, fraction: float) -> float:
+        ordered = sorted(samples)
+        return ordered[min(len(ordered) - 1, int(fraction * len(ordered)))] if ordered else 0.0
+
+    def stats(self) -> dict:
+        return {
+            key: {
+                "polls": source["polls"],
+                "errors": source["errors"],
+                "unchanged": source["unchanged"],
+                "items": source["items"],
+                "fetch_ms_p50": self._percentile(source["fetch_ms"], 0.5),
+                "fetch_ms_p95": self._percentile(source["fetch_ms"], 0.95),
+                "parse_ms_avg": round(statistics.fmean(source["parse_ms"]), 1) if source["parse_ms"] else 0.0,
+            }
+            for key, source in self._sources.items()
+        }
+
+    def clear(self):
+        self._sources.clear()
+
+
+# Per-source conditional-fetch state (validators and content hashes, one document per source)
+class SourceStateStore:
+    """Remembers each source's ETag/Last-Modified and page, region and headline
+    hashes in MongoDB so quiet cycles stay cheap across restarts"""
+
+    def __init__(self, collection):
+        self.collection = collection
+        self._states: Optional[Dict[str, dict]] = None
+
+    async def _load(self) -> Dict[str, dict]:
+        if self._states is None:
+            self._states = {state["_id"]: state async for state in self.collection.find({})}
+        return self._states
+
+    async def get(self, key: str) -> dict:
+        return (await self._load()).get(key, {})
+
+    async def save(self, key: str, state: dict):
+        state = {**state, "_id": key, "checked_at": datetime.now(timezone.utc)}
+        await self.collection.replace_one({"_id": key}, state, upsert=True)
+        (await self._load())[key] = state
+
+    async def all(self) -> List[dict]:
+        return [{"source": key, **{field: value for field, value in state.items() if field != "_id"}}
+                for key, state in (await self._load()).items()]
+
+    async def clear(self):
+        await self.collection.delete_many({})
+        self._states = {}
+
+
+def _digest(data: bytes) -> str:
+    return hashlib.sha1(data).hexdigest()
+
+
+def conditional_headers(state: dict) -> dict:
+    headers = {}
+    if state.get("etag"):
+        headers["If-None-Match"] = state["etag"]
+    if state.get("last_modified"):
+        headers["If-Modified-Since"] = state["last_modified"]
+    return headers
+
+
+def headline_hash(items: List[dict]) -> str:
+    """Order-insensitive hash of the extracted headline set"""
+    headlines = sorted(f"{item['title']}\n{item['source_url']}" for item in items)
+    return _digest("\n".join(headlines).encode("utf-8"))
+
+
+def build_items(source: ScraperSource, headlines: List[Headline]) -> List[dict]:
+    items = []
+    for headline in headlines:
+        if headline.title is None:
+            continue
+        title = headline.title
+        link = urljoin(source.base_url, headline.link) if headline.link else ''
+        image_url = urljoin(source.base_url, headline.image) if headline.image else None
+
+        if len(title) > 10:  # Valid title
+            items.append({
+                "title": title,
+                "source": source.name,
+                "source_url": link,
+                "image_url": image_url,
+                "content": source.content_template.format(name=source.name, title=title),
+                "summary": title[:100] + "..." if len(title) > 100 else title
+            })
+    return items
+
+
+def extract_region(source: ScraperSource, document: Document, parser: ParserFunc = parse_lxml) -> Tuple[str, List[dict]]:
+    """Hash of the headline containers the source reads, plus the items built from them (CPU-bound, run in a thread)"""
+    headlines = parser(source, document)
+    region = _digest("".join(headline.markup for headline in headlines).encode("utf-8"))
+    return region, build_items(source, headlines)
+
+
+def extract_items(source: ScraperSource, document: Document, parser: ParserFunc = parse_lxml) -> List[dict]:
+    """Generic headline extractor driven by a source's configuration"""
+    return build_items(source, parser(source, document))
+
+
+def resolve_sources(keys: Optional[List[str]] = None) -> List[ScraperSource]:
+    """Registry entries for the given keys (all enabled sources when None); unknown keys raise KeyError"""
+    if keys is None:
+        return [source for source in SCRAPER_SOURCES.values() if source.enabled]
+    unknown = [key for key in keys if key not in SCRAPER_SOURCES]
+    if unknown:
+        raise KeyError(", ".join(unknown))
+    return [SCRAPER_SOURCES[key] for key in keys]
+
+
+async def scrape_source(engine: ScrapeEngine, source: ScraperSource, state: Optional[SourceStateStore] = None, force: bool = False) -> SourceResult:
+    """Fetch and parse one source, timing both steps.
+
+    With a state store the request is conditional and the result is marked
+    unchanged (with no items) on 304, an identical page body, an identical
+    headline region or an identical headline set. `force` skips those checks.
+    The new validators and hashes are returned in `result.state`, not saved:
+    the caller saves them with `save_states` after storing the items, so a
+    failed insert is retried on the next poll instead of being skipped as
+    unchanged.
+    """
+    result = SourceResult(source=source.key)
+    previous = await state.get(source.key) if state is not None else {}
+    if force:
+        previous = {}
+    started = time.monotonic()
+    try:
+        response = await asyncio.wait_for(engine.fetch(source.url, conditional_headers(previous)), timeout=engine.deadline)
+        result.status_code = response.status_code
+        result.fetch_ms = round((time.monotonic() - started) * 1000, 1)
+        if response.status_code == 304:
+            result.unchanged = True
+            return result
+        if response.status_code != 200:
+            return result
+
+        current = {
+            "etag": response.headers.get("etag"),
+            "last_modified": response.headers.get("last-modified"),
+            "page_hash": _digest(response.content),
+        }
+        if current["page_hash"] == previous.get("page_hash"):
+            result.unchanged = True
+        else:
+            started = time.monotonic()
+            current["region_hash"], items = await asyncio.to_thread(extract_region, source, response.content, engine.parser)
+            current["headline_hash"] = headline_hash(items)
+            result.parse_ms = round((time.monotonic() - started) * 1000, 1)
+            if current["region_hash"] == previous.get("region_hash") or current["headline_hash"] == previous.get("headline_hash"):
+                result.unchanged = True
+            else:
+                result.items = items
+
+        if state is not None:
+            result.state = {**previous, **current}
+    except Exception as e:
+        result.error = str(e) or type(e).__name__
+        logging.warning(f"Error scraping {source.key}: {result.error}")
+    return result
+
+
+async def save_states(state: SourceStateStore, results: List[SourceResult]):
+    """Record the conditional-fetch state of results whose items have been stored"""
+    for result in results:
+        if result.state is not None:
+            await state.save(result.source, result.state)
+
+
+async def scrape_sources(engine: ScrapeEngine, keys: Optional[List[str]] = None, state: Optional[SourceStateStore] = None, force: bool = False) -> List[SourceResult]:
+    """Scrape the selected sources concurrently; a cycle costs roughly as much as the slowest source"""
+    sources = resolve_sources(keys)
+    results = await asyncio.gather(*[scrape_source(engine, source, state, force) for source in sources])
+    for result in results:
+        engine.metrics.record(result)
+    timings = ", ".join(
+        f"{result.source}={result.fetch_ms + result.parse_ms:.0f}ms/" + ("unchanged" if result.unchanged else str(len(result.items)))
+        for result in results
+    )
+    logging.info(f"Scraped {sum(len(result.items) for result in results)} items from {len(sources)} sources ({timings})")
+    return results
@@ -0,0 +1,35 @@
+from typing import Iterable, List, Type
+
+import orjson
+from fastapi.encoders import jsonable_encoder
+from pydantic import BaseModel
+
+
+# Fast path for trusted database documents: BSON dict -> JSON bytes without
+# building and re-validating a Pydantic model per document
+class DocumentEncoder:
+    """Shapes raw article documents like `model` would, using the model's field order and defaults"""
+
+    def __init__(self, model: Type[BaseModel]):
+        self.model = model
+        self.fields = [
+            (name, None if field.is_required() or field.default_factory else field.default)
+            for name, field in model.model_fields.items()
+        ]
+
+    def encode(self, document: dict) -> dict:
+        return {name: document.get(name, default) for name, default in self.fields}
+
+    def encode_many(self, documents: Iterable[dict]) -> List[dict]:
+        fields = self.fields
+        return [{name: document.get(name, default) for name, default in fields} for document in documents]
+
+
+def _default(value):
+    # Pydantic models and other types orjson does not know natively
+    return jsonable_encoder(value)
+
+
+def dumps(payload) -> bytes:
+    """Serialize a response payload with orjson (datetimes become ISO 8601)"""
+    return orjson.dumps(payload, default=_default)
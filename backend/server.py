@@ -1,4 +1,4 @@
-from fastapi import FastAPI, APIRouter, HTTPException, Query, BackgroundTasks, Response, Depends, WebSocket, WebSocketDisconnect
+from fastapi import FastAPI, APIRouter, HTTPException, Query, BackgroundTasks, Request, Response, Depends, WebSocket, WebSocketDisconnect
 from fastapi.responses import FileResponse
 from fastapi.security import HTTPBasic, HTTPBasicCredentials
 from dotenv import load_dotenv
@@ -7,8 +7,8 @@ from motor.motor_asyncio import AsyncIOMotorClient
 import os
 import logging
 from pathlib import Path
-from pydantic import BaseModel, Field
-from typing import List, Optional
+from pydantic import BaseModel, Field, TypeAdapter
+from typing import List, Optional, Union
 import uuid
 from datetime import datetime, timezone, timedelta
 from emergentintegrations.llm.chat import LlmChat, UserMessage
@@ -16,13 +16,23 @@ import asyncio
 from weasyprint import HTML, CSS
 from io import BytesIO
 import tempfile
-import requests
-from bs4 import BeautifulSoup
-import cv2
-import numpy as np
-from PIL import Image, ImageFilter, ImageEnhance
 import secrets
 import json
+from caches import ArticleCache, CachedFeed, FeedCache, TTLValue
+from pagination import InvalidCursor, fetch_page
+from indexes import ensure_indexes, explain_hot_queries
+from view_counter import ViewCounter
+from http_cache import content_etag, http_now, is_not_modified, not_modified_response, validator_headers
+from serialization import DocumentEncoder, dumps
+from stats import day_key
+from counters import ArticleCounters
+from scheduler import AdaptiveScheduler
+from fingerprints import backfill_fingerprints, new_items
+from ingest import insert_articles, with_fingerprint
+from extractor import BodyExtractor
+from images import FORMATS as IMAGE_FORMATS, IMAGE_KEY, VARIANT_FORMATS, ImageDownloader, ImageProcessor, ImageStore
+from near_duplicates import NearDuplicateIndex
+from scraper import SCRAPER_SOURCES, ScrapeEngine, SourceResult, SourceStateStore, point_sources_at, resolve_sources, save_states, scrape_source, scrape_sources
 
 ROOT_DIR = Path(__file__).parent
 load_dotenv(ROOT_DIR / '.env')
@@ -65,6 +75,108 @@ class ConnectionManager:
 
 manager = ConnectionManager()
 
+# Materialized feeds for the public list endpoints; the TTL bounds how stale list view counts get
+feed_cache = FeedCache(
+    max_entries=int(os.environ.get('FEED_CACHE_SIZE', 256)),
+    max_bytes=int(os.environ.get('FEED_CACHE_MAX_MB', 64)) * 1024 * 1024,
+    ttl=float(os.environ.get('FEED_CACHE_TTL', 30))
+)
+
+# Single-article responses
+article_cache = ArticleCache(
+    max_entries=int(os.environ.get('ARTICLE_CACHE_SIZE', 1000)),
+    max_bytes=int(os.environ.get('ARTICLE_CACHE_MAX_MB', 32)) * 1024 * 1024,
+    ttl=float(os.environ.get('ARTICLE_CACHE_TTL', 60))
+)
+
+# Incrementally maintained article counts behind the stats endpoints
+article_counters = ArticleCounters(db.news_counters)
+COUNTERS_RECONCILE_INTERVAL = float(os.environ.get('COUNTERS_RECONCILE_HOURS', 24)) * 3600
+IMAGE_GC_INTERVAL = float(os.environ.get('IMAGE_GC_HOURS', 24)) * 3600
+IMAGE_GC_GRACE = float(os.environ.get('IMAGE_GC_GRACE_HOURS', 1)) * 3600
+
+# Short-lived caches of the computed dashboard statistics
+STATS_CACHE_TTL = float(os.environ.get('STATS_CACHE_TTL', 15))
+admin_stats_cache = TTLValue(STATS_CACHE_TTL)
+news_stats_cache = TTLValue(STATS_CACHE_TTL)
+
+def invalidate_stats_caches():
+    admin_stats_cache.invalidate()
+    news_stats_cache.invalidate()
+
+def invalidate_article_caches(*articles: dict):
+    """Invalidate cached views of the given article states (pass both old and new state on updates)"""
+    invalidate_stats_caches()
+    feed_cache.invalidate(articles)
+    article_cache.invalidate({article["id"] for article in articles if article.get("id")})
+
+def invalidate_all_article_caches():
+    """Invalidate every cached view after bulk writes"""
+    invalidate_stats_caches()
+    feed_cache.clear()
+    article_cache.clear()
+
+async def on_articles_inserted(*articles: dict):
+    """Bookkeeping after new articles are stored: cached views, then counters"""
+    if not articles:
+        return
+    invalidate_article_caches(*articles)
+    await update_counters(article_counters.record_inserted(articles))
+
+async def update_counters(update):
+    """Apply a counter update; a failure is logged (the periodic reconcile corrects it)
+    instead of failing a write that has already happened"""
+    try:
+        await update
+    except Exception as e:
+        logging.error(f"Error updating article counters: {str(e)}")
+    invalidate_stats_caches()  # again: stats read between the write and the counter update are stale
+
+async def on_views_flushed(article_ids):
+    """Drop the cached article responses that carry the view counts just written
+    (feeds are left to expire, so the homepage stays cached under traffic)"""
+    article_cache.invalidate(article_ids)
+
+# Write-behind article view counts
+view_counter = ViewCounter(
+    db.news_articles,
+    flush_interval=float(os.environ.get('VIEW_FLUSH_INTERVAL', 5)),
+    max_pending=int(os.environ.get('VIEW_MAX_PENDING', 1000)),
+    on_flush=on_views_flushed
+)
+
+async def cached_feed(request: Request, filters: dict, page: tuple, load) -> Response:
+    """Serve a list endpoint from the feed cache, materializing it with `load()` on a miss.
+
+    The ETag is a hash of the feed body, so a feed only stops answering 304
+    when its own content changes; writes that do not touch it leave it alone.
+    """
+    feed = feed_cache.get(filters, page)
+    if feed is None:
+        version = feed_cache.version
+        body = dumps(await load())
+        feed = CachedFeed(body, content_etag(body), http_now())
+        feed_cache.put(filters, page, feed, version)
+    if is_not_modified(request, feed.etag, feed.last_modified):
+        return not_modified_response(feed.etag, feed.last_modified)
+    return Response(content=feed.body, media_type="application/json", headers=validator_headers(feed.etag, feed.last_modified))
+
+async def cursor_feed(request: Request, query: dict, route: str, cursor: str, limit: int, view: str = "full") -> Response:
+    """Serve one keyset page as `{"articles": [...], "next_cursor": ...}`"""
+    encoder, projection = LIST_VIEWS[view]
+    
+    async def load():
+        try:
+            articles, next_cursor = await fetch_page(db.news_articles, query, cursor, limit, projection)
+        except InvalidCursor:
+            raise HTTPException(status_code=400, detail="অবৈধ পেজিনেশন কার্সর")
+        return {
+            "articles": encoder.encode_many(articles),
+            "next_cursor": next_cursor
+        }
+    
+    return await cached_feed(request, query, (route, view, "cursor", cursor, limit), load)
+
 # News Categories
 NEWS_CATEGORIES = [
     "রাজনীতি",
@@ -77,17 +189,17 @@ NEWS_CATEGORIES = [
     "শিক্ষা"
 ]
 
-# Bengali news websites for scraping
-NEWS_WEBSITES = {
-    "prothomalo": "https://www.prothomalo.com",
-    "bdnews24": "https://bangla.bdnews24.com",
-    "somoynews": "https://www.somoynews.tv",
-    "jamuna": "https://www.jamuna.tv",
-    "channel24": "https://www.channel24bd.tv",
-    "banglanews24": "https://www.banglanews24.com"
-}
+# Bengali news websites for scraping (configured in the scraper registry)
+NEWS_WEBSITES = {key: source.base_url for key, source in SCRAPER_SOURCES.items()}
 
 # Define Models
+class ImageVariant(BaseModel):
+    """One stored size/format of a processed article image"""
+    width: int
+    height: int
+    format: str
+    url: str
+
 class NewsArticle(BaseModel):
     id: str = Field(default_factory=lambda: str(uuid.uuid4()))
     title: str
@@ -97,11 +209,42 @@ class NewsArticle(BaseModel):
     author: str = "সংবাদদাতা"
     published_at: datetime = Field(default_factory=lambda: datetime.now(timezone.utc))
     image_url: Optional[str] = None
+    image_variants: Optional[List[ImageVariant]] = None
     is_featured: bool = False
     is_breaking: bool = False
     views: int = 0
     source: Optional[str] = None
     source_url: Optional[str] = None
+    duplicate_of: Optional[str] = None  # id of the earlier article this one near-duplicates (link mode)
+
+class NewsArticleCard(BaseModel):
+    """List/card representation of an article - everything except the body"""
+    id: str
+    title: str
+    summary: str
+    category: str
+    author: str = "সংবাদদাতা"
+    published_at: datetime
+    image_url: Optional[str] = None
+    image_variants: Optional[List[ImageVariant]] = None
+    is_featured: bool = False
+    is_breaking: bool = False
+    views: int = 0
+    source: Optional[str] = None
+    source_url: Optional[str] = None
+
+class NewsPage(BaseModel):
+    """One keyset page of a listing (`cursor` given); pass `next_cursor` back for the next one"""
+    articles: Union[List[NewsArticle], List[NewsArticleCard]]  # cards with view=card
+    next_cursor: Optional[str] = None
+
+# Response encoder and Mongo projection per list view; documents come from
+# our own write paths, so they are shaped directly instead of re-validated
+article_encoder = DocumentEncoder(NewsArticle)
+LIST_VIEWS = {
+    "full": (article_encoder, None),
+    "card": (DocumentEncoder(NewsArticleCard), {"_id": 0, "content": 0}),
+}
 
 class NewsArticleCreate(BaseModel):
     title: str
@@ -147,7 +290,7 @@ class AdminAuth(BaseModel):
     password: str
 
 class BreakingNewsRequest(BaseModel):
-    sources: Optional[List[str]] = ["somoynews", "jamuna", "prothomalo"]
+    sources: Optional[List[str]] = None  # scraper registry keys; None = all enabled sources
 
 class AdminStats(BaseModel):
     total_news: int
@@ -167,250 +310,257 @@ def verify_admin(credentials: HTTPBasicCredentials = Depends(security)):
         raise HTTPException(status_code=401, detail="Invalid admin credentials")
     return credentials.username
 
-# Enhanced Background task for auto breaking news fetch
+# Enhanced Background task for auto breaking news fetch (each source on its own adaptive cadence)
 async def fetch_breaking_news_background():
     while True:
         try:
             # Check if auto breaking news is enabled
             settings = await db.admin_settings.find_one()
             if not settings or not settings.get('auto_breaking_news', True):
-                await asyncio.sleep(300)  # Wait 5 minutes if disabled
+                await breaking_news_scheduler.sleep(300)  # Wait 5 minutes if disabled (or until settings change)
                 continue
             
-            # Get interval from settings (default 10 minutes for more frequent updates)
-            interval = settings.get('breaking_news_interval', 10) * 60  # Convert to seconds
-            
-            logging.info(f"Starting automatic breaking news fetch - interval: {interval/60} minutes")
+            # Base interval from settings (default 10 minutes); sources speed up or back off around it
+            breaking_news_scheduler.set_base_interval(settings.get('breaking_news_interval', 10) * 60)
+            source_keys = [source.key for source in resolve_sources()]
+            due_sources = breaking_news_scheduler.due(source_keys)
             
-            # Fetch new breaking news
-            breaking_news_data = await scrape_breaking_news()
-            
-            if breaking_news_data:
-                new_articles = []
-                for news_data in breaking_news_data:
-                    # Check if this news already exists (check by title similarity)
-                    existing = await db.news_articles.find_one({
-                        "$or": [
-                            {"title": news_data['title']},
-                            {"title": {"$regex": news_data['title'][:30], "$options": "i"}}
-                        ],
-                        "is_breaking": True
-                    })
-                    
-                    if not existing:
-                        # Create new breaking news article
-                        article = NewsArticle(
-                            title=news_data['title'],
-                            content=news_data['content'],
-                            summary=news_data['summary'],
-                            category="ব্রেকিং নিউজ",
-                            is_breaking=True,
-                            source=news_data['source'],
-                            source_url=news_data.get('source_url'),
-                            image_url=news_data.get('image_url')
-                        )
-                        
-                        article_dict = article.dict()
-                        await db.news_articles.insert_one(article_dict)
-                        new_articles.append(article_dict)
-                        
-                        logging.info(f"Created new breaking news: {article.title[:50]}...")
+            if due_sources:
+                logging.info(f"Starting automatic breaking news fetch - sources: {', '.join(due_sources)}")
+                results = await scrape_sources(scrape_engine, due_sources, scraper_state)
+                # One indexed fingerprint lookup for the whole batch
+                fresh_items = await new_items(db.news_articles, scraped_items(results))
+                
+                new_articles = await ingest_articles(breaking_news_articles(fresh_items))
+                await save_states(scraper_state, results)
+                for article in new_articles:
+                    logging.info(f"Created new breaking news: {article.title[:50]}...")
+                
+                for result in results:
+                    source_name = SCRAPER_SOURCES[result.source].name
+                    breaking_news_scheduler.record(result.source, sum(1 for article in new_articles if article.source == source_name), result.failed)
                 
                 # Broadcast new breaking news to all connected clients
                 if new_articles:
-                    await manager.broadcast(json.dumps({
+                    await manager.broadcast(dumps({
                         "type": "breaking_news",
-                        "data": new_articles
-                    }))
+                        "data": [article.dict() for article in new_articles]
+                    }).decode())
                     
                     logging.info(f"🔥 Auto-fetched and broadcasted {len(new_articles)} new breaking news articles")
                 else:
                     logging.info("No new breaking news found in this cycle")
-            else:
-                logging.warning("No breaking news data retrieved from sources")
             
-            # Log next fetch time
-            next_fetch = datetime.now(timezone.utc) + timedelta(seconds=interval)
+            breaking_news_scheduler.cycle_succeeded()
+            
+            # Sleep until the next source is due (or the admin changes the settings)
+            delay = breaking_news_scheduler.seconds_until_next(source_keys)
+            next_fetch = datetime.now(timezone.utc) + timedelta(seconds=delay)
             logging.info(f"Next breaking news fetch scheduled for: {next_fetch.strftime('%H:%M:%S')}")
             
-            await asyncio.sleep(interval)
+            await breaking_news_scheduler.sleep(delay)
             
         except Exception as e:
-            logging.error(f"Error in background breaking news fetch: {str(e)}")
-            await asyncio.sleep(300)  # Wait 5 minutes on error
+            delay = breaking_news_scheduler.cycle_failed()
+            logging.error(f"Error in background breaking news fetch: {str(e)} (retrying in {delay:.0f}s)")
+            await breaking_news_scheduler.sleep(delay)
+
+# Index bootstrap, fingerprints for scraped articles stored before fingerprinting, near-duplicate index
+async def prepare_news_articles():
+    try:
+        await ensure_indexes(db)
+        await backfill_fingerprints(db.news_articles)
+        await rebuild_near_duplicate_index()
+    except Exception as e:
+        logging.error(f"Error preparing news_articles: {str(e)}")
+
+# Background counter reconciliation (bootstraps the counters on first start)
+async def reconcile_counters_background():
+    while True:
+        try:
+            if await article_counters.exists():
+                await asyncio.sleep(COUNTERS_RECONCILE_INTERVAL)
+            report = await article_counters.reconcile(db.news_articles, NEWS_CATEGORIES)
+            invalidate_stats_caches()
+            logging.info(f"Article counters reconciled, drift: {report['drift'] or 'none'}")
+        except Exception as e:
+            logging.error(f"Error reconciling article counters: {str(e)}")
+            await asyncio.sleep(300)
+
+async def collect_image_garbage():
+    """Delete stored images that no article references any more"""
+    image_urls = await db.news_articles.distinct("image_url", {"image_url": {"$regex": f"^{image_store.url_prefix}"}})
+    referenced = {image_store.key_from_url(image_url) for image_url in image_urls}
+    report = await asyncio.to_thread(image_store.collect_garbage, referenced, IMAGE_GC_GRACE)
+    logging.info(f"Image store garbage collected: {report}")
+    return report
+
+async def collect_image_garbage_background():
+    while True:
+        await asyncio.sleep(IMAGE_GC_INTERVAL)
+        try:
+            await collect_image_garbage()
+        except Exception as e:
+            logging.error(f"Error collecting image garbage: {str(e)}")
 
 # Start background task
 @app.on_event("startup")
 async def startup_event():
+    asyncio.create_task(prepare_news_articles())
+    asyncio.create_task(view_counter.run())
+    asyncio.create_task(body_extractor.run())
+    asyncio.create_task(reconcile_counters_background())
+    asyncio.create_task(collect_image_garbage_background())
     asyncio.create_task(fetch_breaking_news_background())
 
-# Image Processing Functions
-def process_image(image_url: str) -> str:
-    """Process and modify image to avoid copyright issues"""
-    try:
-        # Download image
-        response = requests.get(image_url, timeout=10)
-        if response.status_code != 200:
-            return None
-            
-        # Convert to PIL Image
-        image = Image.open(BytesIO(response.content))
-        
-        # Apply modifications to avoid copyright
-        # 1. Add subtle blur
-        image = image.filter(ImageFilter.GaussianBlur(radius=0.5))
-        
-        # 2. Adjust brightness and contrast
-        enhancer = ImageEnhance.Brightness(image)
-        image = enhancer.enhance(1.1)
-        
-        enhancer = ImageEnhance.Contrast(image)
-        image = enhancer.enhance(1.05)
-        
-        # 3. Add subtle color adjustment
-        enhancer = ImageEnhance.Color(image)
-        image = enhancer.enhance(0.95)
-        
-        # 4. Resize if too large
-        if image.width > 800 or image.height > 600:
-            image.thumbnail((800, 600), Image.Resampling.LANCZOS)
-        
-        # Save processed image (in production, save to cloud storage)
-        processed_filename = f"processed_{uuid.uuid4().hex[:10]}.jpg"
-        processed_path = f"/tmp/{processed_filename}"
-        image.save(processed_path, "JPEG", quality=85)
-        
-        return processed_path
-        
-    except Exception as e:
-        logging.error(f"Error processing image: {str(e)}")
-        return None
-
 # Web Scraping Functions
-async def scrape_breaking_news() -> List[dict]:
-    """Scrape breaking news from Bengali news websites"""
-    breaking_news = []
-    
-    headers = {
-        'User-Agent': 'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/91.0.4472.124 Safari/537.36'
+scrape_engine = ScrapeEngine(
+    timeout=float(os.environ.get('SCRAPE_TIMEOUT', 10)),
+    deadline=float(os.environ.get('SCRAPE_DEADLINE', 15)),
+    per_host_limit=int(os.environ.get('SCRAPE_PER_HOST_LIMIT', 2)),
+    parser=os.environ.get('SCRAPE_PARSER', 'lxml')
+)
+# Image Processing: streamed, size-capped downloads, a process pool for the
+# transform (off the event loop) and the processed-image store
+image_store = ImageStore(os.environ.get('IMAGE_STORE_DIR', ROOT_DIR / 'image_store'))
+image_downloader = ImageDownloader(
+    scrape_engine,
+    max_bytes=int(float(os.environ.get('IMAGE_MAX_MB', 10)) * 1024 * 1024),
+    max_pixels=int(float(os.environ.get('IMAGE_MAX_MEGAPIXELS', 40)) * 1_000_000)
+)
+image_processor = ImageProcessor(
+    image_store,
+    image_downloader,
+    workers=int(os.environ.get('IMAGE_WORKERS', 0)) or None,  # default: one per core
+    timeout=float(os.environ.get('IMAGE_TIMEOUT', 30))
+)
+# Offline runs: serve every source from the replay server (python -m benchmarks.replay_server)
+if os.environ.get('SCRAPER_REPLAY_URL'):
+    point_sources_at(os.environ['SCRAPER_REPLAY_URL'])
+# ETag/Last-Modified and page/headline hashes per source, for conditional scraping
+scraper_state = SourceStateStore(db.scraper_state)
+# Near-duplicate headlines across sources: dropped, or kept with `duplicate_of` in link mode
+near_duplicates = NearDuplicateIndex(threshold=float(os.environ.get('NEAR_DUPLICATE_THRESHOLD', 0.7)))
+NEAR_DUPLICATE_MODE = os.environ.get('NEAR_DUPLICATE_MODE', 'drop')  # drop | link
+NEAR_DUPLICATE_WINDOW = float(os.environ.get('NEAR_DUPLICATE_WINDOW_HOURS', 72)) * 3600
+
+def screen_near_duplicate(article: NewsArticle) -> bool:
+    """Check a new scraped article against recent titles; False means drop it"""
+    signature = near_duplicates.signature(article.title)
+    match = near_duplicates.best_match(signature)
+    if match is None:
+        near_duplicates.add(article.id, signature)
+        return True
+    original_id, similarity = match
+    logging.info(f"Near-duplicate ({similarity:.2f}) of {original_id}: {article.title[:50]}...")
+    if NEAR_DUPLICATE_MODE == 'link':
+        article.duplicate_of = original_id
+        return True
+    return False
+
+async def rebuild_near_duplicate_index():
+    """Index the titles of recent scraped originals (linked duplicates are represented by their original)"""
+    since = datetime.now(timezone.utc) - timedelta(seconds=NEAR_DUPLICATE_WINDOW)
+    cursor = db.news_articles.find(
+        {"published_at": {"$gte": since}, "duplicate_of": None, "source": {"$ne": None}},
+        {"_id": 0, "id": 1, "title": 1}
+    ).sort("published_at", 1)
+    count = 0
+    async for article in cursor:
+        near_duplicates.add(article["id"], near_duplicates.signature(article["title"]))
+        count += 1
+    logging.info(f"Near-duplicate index rebuilt from {count} recent articles")
+
+# Second pipeline stage: real bodies and lead images fetched from source_url after the scrape cycle
+async def store_extracted_body(article_id: str, body: str, lead_image: Optional[str]):
+    article = await db.news_articles.find_one(
+        {"id": article_id},
+        {"_id": 0, "id": 1, "category": 1, "is_featured": 1, "is_breaking": 1, "published_at": 1, "image_url": 1}
+    )
+    if not article:
+        return
+    first_paragraph = body.split("\n\n", 1)[0]
+    update = {
+        "content": body,
+        "summary": first_paragraph[:200] + "..." if len(first_paragraph) > 200 else first_paragraph
     }
-    
+    if lead_image and not article.get("image_url"):
+        update["image_url"] = lead_image
+    await db.news_articles.update_one({"id": article_id}, {"$set": update})
+    invalidate_article_caches(article)
+
+body_extractor = BodyExtractor(
+    scrape_engine,
+    store_extracted_body,
+    workers=int(os.environ.get('BODY_EXTRACT_WORKERS', 4)),  # 0 disables the stage
+    max_queue=int(os.environ.get('BODY_EXTRACT_QUEUE', 500))
+)
+
+# Shared ingestion for scraped and generated articles
+news_batch = TypeAdapter(List[NewsArticle])
+
+def breaking_news_articles(items: List[dict]) -> List[NewsArticle]:
+    """Validate scraped items as breaking news articles in one pass"""
+    return news_batch.validate_python([{
+        "title": item['title'],
+        "content": item['content'],
+        "summary": item['summary'],
+        "category": "ব্রেকিং নিউজ",
+        "is_breaking": True,
+        "source": item['source'],
+        "source_url": item.get('source_url'),
+        "image_url": item.get('image_url'),
+        "image_variants": item.get('image_variants')
+    } for item in items])
+
+async def ingest_articles(articles: List[NewsArticle]) -> List[NewsArticle]:
+    """Screen scraped articles for near-duplicates, then store the batch in one idempotent bulk
+    write keyed on the title fingerprint of the scraped ones (generated articles are not
+    deduplicated). Runs the insert hooks; returns the articles actually stored."""
+    screened = [article for article in articles if not article.source or screen_near_duplicate(article)]
+    documents = [with_fingerprint(article.dict()) for article in screened]
+    stored_documents = await insert_articles(db.news_articles, documents)
+    stored_ids = {document['id'] for document in stored_documents}
+    for article in screened:
+        if article.id not in stored_ids:
+            near_duplicates.remove(article.id)  # already stored by a concurrent run
+    await on_articles_inserted(*stored_documents)
+    stored = [article for article in screened if article.id in stored_ids]
+    if body_extractor.workers:
+        for article in stored:
+            if article.source and article.source_url:
+                body_extractor.submit(article.id, article.source_url)
+    return stored
+
+# Per-source polling cadence around the admin's breaking_news_interval
+breaking_news_scheduler = AdaptiveScheduler(
+    base_interval=AdminSettings.model_fields['breaking_news_interval'].default * 60,
+    min_interval=float(os.environ.get('SCRAPE_MIN_INTERVAL', 60)),
+    max_interval=float(os.environ.get('SCRAPE_MAX_INTERVAL', 3600))
+)
+
+async def scrape_breaking_news(sources: Optional[List[str]] = None, force: bool = False) -> List[SourceResult]:
+    """Scrape breaking news from Bengali news websites (each source caps its own items).
+    Unchanged sources contribute nothing unless `force` is set. Store the items, then
+    `save_states(scraper_state, results)`."""
     try:
-        # Scrape from Somoy News
-        try:
-            response = requests.get("https://www.somoynews.tv/bangla", headers=headers, timeout=10)
-            if response.status_code == 200:
-                soup = BeautifulSoup(response.content, 'html.parser')
-                
-                # Find breaking news section
-                breaking_elements = soup.find_all(['div', 'article'], class_=lambda x: x and ('breaking' in x.lower() or 'urgent' in x.lower() or 'latest' in x.lower()))[:3]
-                
-                for element in breaking_elements:
-                    title_elem = element.find(['h1', 'h2', 'h3', 'h4', 'a'])
-                    img_elem = element.find('img')
-                    
-                    if title_elem:
-                        title = title_elem.get_text(strip=True)
-                        link = title_elem.get('href', '') if title_elem.name == 'a' else ''
-                        if link and not link.startswith('http'):
-                            link = f"https://www.somoynews.tv{link}"
-                        
-                        image_url = None
-                        if img_elem and img_elem.get('src'):
-                            image_url = img_elem.get('src')
-                            if not image_url.startswith('http'):
-                                image_url = f"https://www.somoynews.tv{image_url}"
-                        
-                        if len(title) > 10:  # Valid title
-                            breaking_news.append({
-                                "title": title,
-                                "source": "সময় টিভি",
-                                "source_url": link,
-                                "image_url": image_url,
-                                "content": f"সময় টিভি থেকে প্রাপ্ত ব্রেকিং নিউজ: {title}",
-                                "summary": title[:100] + "..." if len(title) > 100 else title
-                            })
-        except Exception as e:
-            logging.warning(f"Error scraping Somoy News: {str(e)}")
-        
-        # Scrape from Jamuna TV
-        try:
-            response = requests.get("https://www.jamuna.tv", headers=headers, timeout=10)
-            if response.status_code == 200:
-                soup = BeautifulSoup(response.content, 'html.parser')
-                
-                # Find latest news
-                news_elements = soup.find_all(['div', 'article'], class_=lambda x: x and ('news' in x.lower() or 'item' in x.lower()))[:3]
-                
-                for element in news_elements:
-                    title_elem = element.find(['h1', 'h2', 'h3', 'h4', 'a'])
-                    img_elem = element.find('img')
-                    
-                    if title_elem:
-                        title = title_elem.get_text(strip=True)
-                        link = title_elem.get('href', '') if title_elem.name == 'a' else ''
-                        if link and not link.startswith('http'):
-                            link = f"https://www.jamuna.tv{link}"
-                        
-                        image_url = None
-                        if img_elem and img_elem.get('src'):
-                            image_url = img_elem.get('src')
-                            if not image_url.startswith('http'):
-                                image_url = f"https://www.jamuna.tv{image_url}"
-                        
-                        if len(title) > 10:  # Valid title
-                            breaking_news.append({
-                                "title": title,
-                                "source": "যমুনা টিভি",
-                                "source_url": link,
-                                "image_url": image_url,
-                                "content": f"যমুনা টিভি থেকে প্রাপ্ত গুরুত্বপূর্ণ সংবাদ: {title}",
-                                "summary": title[:100] + "..." if len(title) > 100 else title
-                            })
-        except Exception as e:
-            logging.warning(f"Error scraping Jamuna TV: {str(e)}")
-        
-        # Scrape from Prothom Alo
-        try:
-            response = requests.get("https://www.prothomalo.com", headers=headers, timeout=10)
-            if response.status_code == 200:
-                soup = BeautifulSoup(response.content, 'html.parser')
-                
-                # Find latest news
-                news_elements = soup.find_all(['div', 'article'], class_=lambda x: x and ('story' in x.lower() or 'news' in x.lower()))[:2]
-                
-                for element in news_elements:
-                    title_elem = element.find(['h1', 'h2', 'h3', 'h4', 'a'])
-                    img_elem = element.find('img')
-                    
-                    if title_elem:
-                        title = title_elem.get_text(strip=True)
-                        link = title_elem.get('href', '') if title_elem.name == 'a' else ''
-                        if link and not link.startswith('http'):
-                            link = f"https://www.prothomalo.com{link}"
-                        
-                        image_url = None
-                        if img_elem and img_elem.get('src'):
-                            image_url = img_elem.get('src')
-                            if not image_url.startswith('http'):
-                                image_url = f"https://www.prothomalo.com{image_url}"
-                        
-                        if len(title) > 10:  # Valid title
-                            breaking_news.append({
-                                "title": title,
-                                "source": "প্রথম আলো",
-                                "source_url": link,
-                                "image_url": image_url,
-                                "content": f"প্রথম আলো থেকে প্রাপ্ত সংবাদ: {title}",
-                                "summary": title[:100] + "..." if len(title) > 100 else title
-                            })
-        except Exception as e:
-            logging.warning(f"Error scraping Prothom Alo: {str(e)}")
-        
+        return await scrape_sources(scrape_engine, sources, scraper_state, force)
     except Exception as e:
         logging.error(f"Error in breaking news scraping: {str(e)}")
-    
-    return breaking_news[:8]  # Return max 8 breaking news
+        return []
+
+def scraped_items(results: List[SourceResult]) -> List[dict]:
+    return [news_data for result in results for news_data in result.items]
+
+def requested_sources(request: Optional[BreakingNewsRequest]) -> Optional[List[str]]:
+    """Validate the scraper sources selected in a request body"""
+    if request is None or request.sources is None:
+        return None
+    try:
+        resolve_sources(request.sources)
+    except KeyError as e:
+        raise HTTPException(status_code=400, detail=f"অজানা সংবাদ উৎস: {e.args[0]}")
+    return request.sources
 
 # AI News Generation Function
 async def generate_news_with_ai(category: str, count: int = 1) -> List[dict]:
@@ -542,9 +692,21 @@ async def websocket_endpoint(websocket: WebSocket):
 async def root():
     return {"message": "বাংলা নিউজ পোর্টাল API"}
 
+# The category list only changes with a deploy
+CATEGORIES_BODY = dumps({"categories": NEWS_CATEGORIES})
+CATEGORIES_ETAG = content_etag(CATEGORIES_BODY)
+CATEGORIES_LAST_MODIFIED = http_now()
+
 @api_router.get("/categories")
-async def get_categories():
-    return {"categories": NEWS_CATEGORIES}
+async def get_categories(request: Request):
+    if is_not_modified(request, CATEGORIES_ETAG, CATEGORIES_LAST_MODIFIED):
+        return not_modified_response(CATEGORIES_ETAG, CATEGORIES_LAST_MODIFIED)
+    
+    return Response(
+        content=CATEGORIES_BODY,
+        media_type="application/json",
+        headers=validator_headers(CATEGORIES_ETAG, CATEGORIES_LAST_MODIFIED)
+    )
 
 # Enhanced Admin Routes
 @api_router.get("/admin/settings")
@@ -564,69 +726,112 @@ async def get_admin_settings(admin: str = Depends(verify_admin)):
     
     return AdminSettings(**settings)
 
+async def compute_admin_stats() -> AdminStats:
+    # Counts come from the maintained counters document
+    counters = await article_counters.read()
+    today_news = counters["day"].get(day_key(datetime.now(timezone.utc)), 0)
+    
+    # Recent activities
+    recent_articles = await db.news_articles.find(
+        {}, {"_id": 0, "title": 1, "category": 1, "published_at": 1, "is_breaking": 1, "is_featured": 1}
+    ).sort("published_at", -1).limit(5).to_list(length=None)
+    recent_activities = []
+    for article in recent_articles:
+        recent_activities.append({
+            "type": "news_created",
+            "title": article['title'][:50] + "..." if len(article['title']) > 50 else article['title'],
+            "category": article['category'],
+            "timestamp": article['published_at'].isoformat(),
+            "is_breaking": article.get('is_breaking', False),
+            "is_featured": article.get('is_featured', False)
+        })
+    
+    # System health
+    system_health = {
+        "database_status": "healthy",
+        "api_status": "active",
+        "breaking_news_fetch": "active",
+        "pending_view_counts": view_counter.stats()["pending_views"],
+        "total_articles_today": today_news
+    }
+    
+    return AdminStats(
+        total_news=counters["total"],
+        featured_news=counters["featured"],
+        breaking_news=counters["breaking"],
+        today_news=today_news,
+        category_stats={category: counters["category"].get(category, 0) for category in NEWS_CATEGORIES},
+        recent_activities=recent_activities,
+        system_health=system_health
+    )
+
 @api_router.get("/admin/stats")
 async def get_admin_stats(admin: str = Depends(verify_admin)) -> AdminStats:
     """Get comprehensive admin statistics"""
     try:
-        # Basic counts
-        total_news = await db.news_articles.count_documents({})
-        featured_news = await db.news_articles.count_documents({"is_featured": True})
-        breaking_news = await db.news_articles.count_documents({"is_breaking": True})
-        
-        # Today's news
-        today = datetime.now(timezone.utc).date()
-        today_start = datetime.combine(today, datetime.min.time()).replace(tzinfo=timezone.utc)
-        today_news = await db.news_articles.count_documents({
-            "published_at": {"$gte": today_start}
-        })
-        
-        # Category wise count
-        category_stats = {}
-        for category in NEWS_CATEGORIES:
-            count = await db.news_articles.count_documents({"category": category})
-            category_stats[category] = count
-        
-        # Recent activities
-        recent_articles = await db.news_articles.find({}).sort("published_at", -1).limit(5).to_list(length=None)
-        recent_activities = []
-        for article in recent_articles:
-            recent_activities.append({
-                "type": "news_created",
-                "title": article['title'][:50] + "..." if len(article['title']) > 50 else article['title'],
-                "category": article['category'],
-                "timestamp": article['published_at'].isoformat(),
-                "is_breaking": article.get('is_breaking', False),
-                "is_featured": article.get('is_featured', False)
-            })
-        
-        # System health
-        system_health = {
-            "database_status": "healthy",
-            "api_status": "active",
-            "breaking_news_fetch": "active",
-            "total_articles_today": today_news
-        }
-        
-        return AdminStats(
-            total_news=total_news,
-            featured_news=featured_news,
-            breaking_news=breaking_news,
-            today_news=today_news,
-            category_stats=category_stats,
-            recent_activities=recent_activities,
-            system_health=system_health
-        )
-        
+        return await admin_stats_cache.get(compute_admin_stats)
     except Exception as e:
         logging.error(f"Error getting admin stats: {str(e)}")
         raise HTTPException(status_code=500, detail=f"পরিসংখ্যান লোড করতে সমস্যা: {str(e)}")
 
+@api_router.post("/admin/counters/reconcile")
+async def reconcile_counters(admin: str = Depends(verify_admin)):
+    """Recompute the article counters from scratch and report drift"""
+    try:
+        report = await article_counters.reconcile(db.news_articles, NEWS_CATEGORIES)
+        invalidate_stats_caches()
+        return report
+    except Exception as e:
+        logging.error(f"Error reconciling counters: {str(e)}")
+        raise HTTPException(status_code=500, detail=f"কাউন্টার মিলাতে সমস্যা: {str(e)}")
+
+@api_router.get("/admin/cache-stats")
+async def get_cache_stats(admin: str = Depends(verify_admin)):
+    """Get hit ratios, memory footprint and invalidation counters of the in-process caches"""
+    return {
+        "feed_cache": feed_cache.stats(),
+        "article_cache": article_cache.stats(),
+        "admin_stats_cache": admin_stats_cache.stats(),
+        "news_stats_cache": news_stats_cache.stats()
+    }
+
+@api_router.get("/admin/image-stats")
+async def get_image_stats(admin: str = Depends(verify_admin)):
+    """Get queue depth, throughput and failures of the image worker pool, downloads and the store"""
+    return {
+        "processor": image_processor.stats(),
+        "downloader": image_downloader.stats(),
+        "store": await asyncio.to_thread(image_store.stats)
+    }
+
+@api_router.post("/admin/images/gc")
+async def run_image_garbage_collection(admin: str = Depends(verify_admin)):
+    """Delete stored images that no article references"""
+    try:
+        return await collect_image_garbage()
+    except Exception as e:
+        logging.error(f"Error collecting image garbage: {str(e)}")
+        raise HTTPException(status_code=500, detail=f"ছবি পরিষ্কারে সমস্যা: {str(e)}")
+
+@api_router.get("/admin/indexes")
+async def get_index_report(admin: str = Depends(verify_admin)):
+    """Report index coverage of the hot queries via explain()"""
+    try:
+        existing = await db.news_articles.index_information()
+        return {
+            "news_articles_indexes": sorted(existing.keys()),
+            "hot_queries": await explain_hot_queries(db)
+        }
+    except Exception as e:
+        logging.error(f"Error explaining hot queries: {str(e)}")
+        raise HTTPException(status_code=500, detail=f"ইনডেক্স রিপোর্ট তৈরিতে সমস্যা: {str(e)}")
+
 @api_router.delete("/admin/clear-test-data")
 async def clear_test_data(admin: str = Depends(verify_admin)):
     """Clear test data from database"""
     try:
-        # Delete test articles
-        result = await db.news_articles.delete_many({
+        # Find test articles first so the counters can be decremented for them
+        test_articles = await db.news_articles.find({
             "$or": [
                 {"title": {"$regex": "CRUD"}},
                 {"title": {"$regex": "টেস্ট"}},
@@ -634,7 +839,15 @@ async def clear_test_data(admin: str = Depends(verify_admin)):
                 {"content": {"$regex": "CRUD"}},
                 {"content": {"$regex": "পরীক্ষা"}}
             ]
-        })
+        }, {"_id": 1, "id": 1, "category": 1, "is_featured": 1, "is_breaking": 1, "published_at": 1}).to_list(length=None)
+        
+        # Delete test articles
+        result = await db.news_articles.delete_many({"_id": {"$in": [article["_id"] for article in test_articles]}})
+        if result.deleted_count:
+            invalidate_all_article_caches()
+            await update_counters(article_counters.record_deleted(test_articles))
+            for article in test_articles:
+                near_duplicates.remove(article.get("id"))
         
         return {
             "message": f"{result.deleted_count}টি টেস্ট ডেটা সফলভাবে মুছে ফেলা হয়েছে",
@@ -674,6 +887,8 @@ async def update_admin_settings(
             {"$set": update_dict},
             upsert=True
         )
+        # Let the breaking news loop pick up interval/enable changes now rather than after its sleep
+        breaking_news_scheduler.wake()
     
     updated_settings = await db.admin_settings.find_one()
     return AdminSettings(**updated_settings)
@@ -687,35 +902,30 @@ async def create_test_news(
     news_article = NewsArticle(**article.dict())
     article_dict = news_article.dict()
     await db.news_articles.insert_one(article_dict)
+    await on_articles_inserted(article_dict)
     return {"message": "টেস্ট সংবাদ সফলভাবে তৈরি হয়েছে", "article": news_article}
 
 @api_router.post("/admin/generate-all-categories")
 async def generate_news_all_categories(admin: str = Depends(verify_admin)):
     """Generate news for all categories - Admin only"""
     try:
-        all_generated = []
+        generated = []
         failed_categories = []
         
         for category in NEWS_CATEGORIES:
             try:
                 # Generate 3-5 news for each category
                 articles_data = await generate_news_with_ai(category, 4)
-                
-                # Save to database
-                saved_articles = []
-                for article_data in articles_data:
-                    article = NewsArticle(**article_data)
-                    article_dict = article.dict()
-                    await db.news_articles.insert_one(article_dict)
-                    saved_articles.append(article)
-                
-                all_generated.extend(saved_articles)
+                generated.extend(news_batch.validate_python(articles_data))
                 
             except Exception as e:
                 logging.error(f"Error generating news for category {category}: {str(e)}")
                 failed_categories.append(category)
                 continue
         
+        # Save every category's articles to the database in one batch
+        all_generated = await ingest_articles(generated)
+        
         return {
             "message": f"সফলভাবে {len(all_generated)}টি সংবাদ তৈরি হয়েছে",
             "total_generated": len(all_generated),
@@ -728,42 +938,53 @@ async def generate_news_all_categories(admin: str = Depends(verify_admin)):
         logging.error(f"Error in generate all categories: {str(e)}")
         raise HTTPException(status_code=500, detail=f"সব ক্যাটাগরিতে সংবাদ তৈরিতে সমস্যা: {str(e)}")
 
+@api_router.get("/admin/scraper/sources")
+async def get_scraper_sources(admin: str = Depends(verify_admin)):
+    """List the configured scraper sources and their conditional-fetch state"""
+    return {
+        "sources": list(SCRAPER_SOURCES.values()),
+        "parser": scrape_engine.parser_name,
+        "metrics": scrape_engine.metrics.stats(),
+        "body_extraction": body_extractor.stats(),
+        "state": await scraper_state.all(),
+        "schedule": breaking_news_scheduler.stats(),
+        "near_duplicates": {**near_duplicates.stats(), "mode": NEAR_DUPLICATE_MODE}
+    }
+
+@api_router.delete("/admin/scraper/state")
+async def reset_scraper_state(admin: str = Depends(verify_admin)):
+    """Forget stored validators and hashes so the next cycle refetches every source in full"""
+    await scraper_state.clear()
+    return {"message": "স্ক্র্যাপার অবস্থা রিসেট করা হয়েছে"}
+
+@api_router.post("/admin/scraper/sources/{source_key}/test")
+async def test_scraper_source(source_key: str, admin: str = Depends(verify_admin)):
+    """Scrape a single source without saving anything, reporting timings and extracted items"""
+    if source_key not in SCRAPER_SOURCES:
+        raise HTTPException(status_code=404, detail="সংবাদ উৎস পাওয়া যায়নি")
+    return await scrape_source(scrape_engine, SCRAPER_SOURCES[source_key])
+
 @api_router.post("/admin/force-breaking-news")
-async def force_fetch_breaking_news(admin: str = Depends(verify_admin)):
+async def force_fetch_breaking_news(
+    request: Optional[BreakingNewsRequest] = None,
+    admin: str = Depends(verify_admin)
+):
     """Manually force fetch breaking news"""
+    sources = requested_sources(request)
     try:
-        breaking_news_data = await scrape_breaking_news()
+        results = await scrape_breaking_news(sources, force=True)
         
-        saved_articles = []
-        for news_data in breaking_news_data:
-            # Check if this news already exists
-            existing = await db.news_articles.find_one({
-                "title": news_data['title'],
-                "is_breaking": True
-            })
-            
-            if not existing:
-                article = NewsArticle(
-                    title=news_data['title'],
-                    content=news_data['content'],
-                    summary=news_data['summary'],
-                    category="ব্রেকিং নিউজ",
-                    is_breaking=True,
-                    source=news_data['source'],
-                    source_url=news_data.get('source_url'),
-                    image_url=news_data.get('image_url')
-                )
-                
-                article_dict = article.dict()
-                await db.news_articles.insert_one(article_dict)
-                saved_articles.append(article)
+        # Skip news that already exists (one fingerprint lookup for the batch)
+        fresh_items = await new_items(db.news_articles, scraped_items(results))
+        saved_articles = await ingest_articles(breaking_news_articles(fresh_items))
+        await save_states(scraper_state, results)
         
         # Broadcast new breaking news
         if saved_articles:
-            await manager.broadcast(json.dumps({
+            await manager.broadcast(dumps({
                 "type": "breaking_news",
                 "data": [article.dict() for article in saved_articles]
-            }))
+            }).decode())
         
         return {
             "message": f"{len(saved_articles)}টি নতুন ব্রেকিং নিউজ সংগ্রহ করা হয়েছে",
@@ -776,36 +997,23 @@ async def force_fetch_breaking_news(admin: str = Depends(verify_admin)):
 
 # Breaking News Routes
 @api_router.post("/breaking-news/fetch")
-async def fetch_breaking_news():
+async def fetch_breaking_news(request: Optional[BreakingNewsRequest] = None):
     """Fetch breaking news from external sources"""
+    sources = requested_sources(request)
     try:
-        breaking_news_data = await scrape_breaking_news()
+        results = await scrape_breaking_news(sources)
+        
+        # Skip news that already exists
+        fresh_items = await new_items(db.news_articles, scraped_items(results))
+        # Process all images of the batch concurrently in the worker pool
+        processed_images = await image_processor.process_images(news_data.get('image_url') for news_data in fresh_items)
+        for news_data, processed_image in zip(fresh_items, processed_images):
+            if processed_image:
+                news_data.update(processed_image)
         
         # Save breaking news to database
-        saved_articles = []
-        for news_data in breaking_news_data:
-            # Process image if available
-            processed_image = None
-            if news_data.get('image_url'):
-                processed_image = process_image(news_data['image_url'])
-                if processed_image:
-                    news_data['image_url'] = processed_image
-            
-            # Create news article
-            article = NewsArticle(
-                title=news_data['title'],
-                content=news_data['content'],
-                summary=news_data['summary'],
-                category="ব্রেকিং নিউজ",
-                is_breaking=True,
-                source=news_data['source'],
-                source_url=news_data.get('source_url'),
-                image_url=news_data.get('image_url')
-            )
-            
-            article_dict = article.dict()
-            await db.news_articles.insert_one(article_dict)
-            saved_articles.append(article)
+        saved_articles = await ingest_articles(breaking_news_articles(fresh_items))
+        await save_states(scraper_state, results)
         
         return {
             "message": f"{len(saved_articles)}টি ব্রেকিং নিউজ সংগ্রহ করা হয়েছে",
@@ -816,27 +1024,43 @@ async def fetch_breaking_news():
         logging.error(f"Error fetching breaking news: {str(e)}")
         raise HTTPException(status_code=500, detail=f"ব্রেকিং নিউজ সংগ্রহে সমস্যা: {str(e)}")
 
-@api_router.get("/breaking-news", response_model=List[NewsArticle])
-async def get_breaking_news():
-    """Get all breaking news"""
-    articles = await db.news_articles.find(
-        {"is_breaking": True}
-    ).sort("published_at", -1).limit(20).to_list(length=None)
+@api_router.get("/breaking-news", response_model=Union[List[NewsArticle], List[NewsArticleCard], NewsPage])
+async def get_breaking_news(
+    request: Request,
+    limit: int = Query(default=20, ge=1, le=100),
+    cursor: Optional[str] = None,
+    view: str = Query(default="full", pattern="^(full|card)$")
+):
+    """Get all breaking news (pass `cursor` - empty for the first page - for keyset paging, `view=card` to omit bodies)"""
+    query = {"is_breaking": True}
     
-    return [NewsArticle(**article) for article in articles]
+    if cursor is not None:
+        return await cursor_feed(request, query, "breaking-news", cursor, limit, view)
+    
+    encoder, projection = LIST_VIEWS[view]
+    
+    async def load():
+        articles = await db.news_articles.find(query, projection).sort("published_at", -1).limit(limit).to_list(length=None)
+        return encoder.encode_many(articles)
+    
+    return await cached_feed(request, query, ("breaking-news", view, limit), load)
 
 @api_router.get("/breaking-news/latest")
-async def get_latest_breaking_news():
+async def get_latest_breaking_news(request: Request):
     """Get latest breaking news for ticker"""
-    articles = await db.news_articles.find(
-        {"is_breaking": True}
-    ).sort("published_at", -1).limit(10).to_list(length=None)
+    query = {"is_breaking": True}
     
-    return [{
-        "id": article['id'],
-        "title": article['title'],
-        "published_at": article['published_at'].isoformat()
-    } for article in articles]
+    async def load():
+        articles = await db.news_articles.find(
+            query, {"_id": 0, "id": 1, "title": 1, "published_at": 1}
+        ).sort("published_at", -1).limit(10).to_list(length=None)
+        return [{
+            "id": article['id'],
+            "title": article['title'],
+            "published_at": article['published_at'].isoformat()
+        } for article in articles]
+    
+    return await cached_feed(request, query, ("breaking-news/latest", 10), load)
 
 # Regular News Routes
 @api_router.post("/news/generate")
@@ -850,12 +1074,7 @@ async def generate_news(request: GenerateNewsRequest, background_tasks: Backgrou
         articles_data = await generate_news_with_ai(request.category, request.count)
         
         # Save to database
-        saved_articles = []
-        for article_data in articles_data:
-            article = NewsArticle(**article_data)
-            article_dict = article.dict()
-            await db.news_articles.insert_one(article_dict)
-            saved_articles.append(article)
+        saved_articles = await ingest_articles(news_batch.validate_python(articles_data))
         
         return {
             "message": f"{len(saved_articles)}টি সংবাদ সফলভাবে তৈরি হয়েছে",
@@ -866,15 +1085,18 @@ async def generate_news(request: GenerateNewsRequest, background_tasks: Backgrou
         logging.error(f"Error generating news: {str(e)}")
         raise HTTPException(status_code=500, detail=f"সংবাদ তৈরিতে সমস্যা হয়েছে: {str(e)}")
 
-@api_router.get("/news", response_model=List[NewsArticle])
+@api_router.get("/news", response_model=Union[List[NewsArticle], List[NewsArticleCard], NewsPage])
 async def get_news(
+    request: Request,
     category: Optional[str] = None,
-    limit: int = Query(default=20, le=100),
+    limit: int = Query(default=20, ge=1, le=100),
     skip: int = Query(default=0, ge=0),
     featured: Optional[bool] = None,
-    breaking: Optional[bool] = None
+    breaking: Optional[bool] = None,
+    cursor: Optional[str] = None,
+    view: str = Query(default="full", pattern="^(full|card)$")
 ):
-    """Get news articles with filtering"""
+    """Get news articles with filtering (pass `cursor` - empty for the first page - for keyset paging, `view=card` to omit bodies)"""
     query = {}
     
     if category:
@@ -884,23 +1106,34 @@ async def get_news(
     if breaking is not None:
         query["is_breaking"] = breaking
     
-    articles = await db.news_articles.find(query).sort("published_at", -1).skip(skip).limit(limit).to_list(length=None)
-    return [NewsArticle(**article) for article in articles]
+    if cursor is not None:
+        return await cursor_feed(request, query, "news", cursor, limit, view)
+    
+    encoder, projection = LIST_VIEWS[view]
+    
+    async def load():
+        articles = await db.news_articles.find(query, projection).sort("published_at", -1).skip(skip).limit(limit).to_list(length=None)
+        return encoder.encode_many(articles)
+    
+    return await cached_feed(request, query, ("news", view, skip, limit), load)
 
 @api_router.get("/news/{article_id}", response_model=NewsArticle)
 async def get_article(article_id: str):
-    """Get specific news article"""
-    article = await db.news_articles.find_one({"id": article_id})
-    if not article:
-        raise HTTPException(status_code=404, detail="সংবাদটি পাওয়া যায়নি")
-    
-    # Increment view count
-    await db.news_articles.update_one(
-        {"id": article_id},
-        {"$inc": {"views": 1}}
-    )
+    """Get specific news article (view counts in cached responses refresh with the cache TTL)"""
+    body = article_cache.get(article_id)
+    if body is None:
+        version = article_cache.version
+        article = await db.news_articles.find_one({"id": article_id})
+        if not article:
+            raise HTTPException(status_code=404, detail="সংবাদটি পাওয়া যায়নি")
+        
+        # Include views not yet flushed (they are written behind in bulk)
+        article["views"] = article.get("views", 0) + view_counter.pending_for(article_id)
+        body = dumps(article_encoder.encode(article))
+        article_cache.put(article_id, body, version)
     
-    return NewsArticle(**article)
+    view_counter.record(article_id)
+    return Response(content=body, media_type="application/json")
 
 @api_router.post("/news", response_model=NewsArticle)
 async def create_news(article: NewsArticleCreate):
@@ -908,6 +1141,7 @@ async def create_news(article: NewsArticleCreate):
     news_article = NewsArticle(**article.dict())
     article_dict = news_article.dict()
     await db.news_articles.insert_one(article_dict)
+    await on_articles_inserted(article_dict)
     return news_article
 
 @api_router.put("/news/{article_id}/featured")
@@ -918,10 +1152,13 @@ async def toggle_featured(article_id: str):
         raise HTTPException(status_code=404, detail="সংবাদটি পাওয়া যায়নি")
     
     new_status = not article.get("is_featured", False)
-    await db.news_articles.update_one(
+    result = await db.news_articles.update_one(
         {"id": article_id},
         {"$set": {"is_featured": new_status}}
     )
+    invalidate_article_caches(article, {**article, "is_featured": new_status})
+    if result.modified_count:
+        await update_counters(article_counters.record_flag_change("featured", new_status))
     
     return {"message": f"ফিচার স্ট্যাটাস পরিবর্তন করা হয়েছে: {'ফিচার করা হয়েছে' if new_status else 'ফিচার থেকে সরানো হয়েছে'}"}
 
@@ -933,32 +1170,29 @@ async def toggle_breaking(article_id: str):
         raise HTTPException(status_code=404, detail="সংবাদটি পাওয়া যায়নি")
     
     new_status = not article.get("is_breaking", False)
-    await db.news_articles.update_one(
+    result = await db.news_articles.update_one(
         {"id": article_id},
         {"$set": {"is_breaking": new_status}}
     )
+    invalidate_article_caches(article, {**article, "is_breaking": new_status})
+    if result.modified_count:
+        await update_counters(article_counters.record_flag_change("breaking", new_status))
     
     return {"message": f"ব্রেকিং নিউজ স্ট্যাটাস পরিবর্তন করা হয়েছে: {'ব্রেকিং নিউজ' if new_status else 'সাধারণ সংবাদ'}"}
 
 @api_router.get("/news/stats/overview")
 async def get_news_stats():
     """Get news statistics"""
-    total_news = await db.news_articles.count_documents({})
-    featured_news = await db.news_articles.count_documents({"is_featured": True})
-    breaking_news = await db.news_articles.count_documents({"is_breaking": True})
-    
-    # Category wise count
-    category_stats = {}
-    for category in NEWS_CATEGORIES:
-        count = await db.news_articles.count_documents({"category": category})
-        category_stats[category] = count
+    async def compute():
+        counters = await article_counters.read()
+        return {
+            "total_news": counters["total"],
+            "featured_news": counters["featured"],
+            "breaking_news": counters["breaking"],
+            "category_stats": {category: counters["category"].get(category, 0) for category in NEWS_CATEGORIES}
+        }
     
-    return {
-        "total_news": total_news,
-        "featured_news": featured_news,
-        "breaking_news": breaking_news,
-        "category_stats": category_stats
-    }
+    return await news_stats_cache.get(compute)
 
 # PDF Newspaper Generation
 async def generate_newspaper_pdf():
@@ -973,9 +1207,13 @@ async def generate_newspaper_pdf():
             "categories": {}
         }
         
+        # Only the first 501 characters of each body are needed for the excerpt
+        projection = {field: 1 for field in NewsArticle.model_fields if field != "content"}
+        projection.update({"_id": 0, "content": {"$substrCP": ["$content", 0, 501]}})
+        
         total_articles = 0
         for category in NEWS_CATEGORIES:
-            articles = await db.news_articles.find({"category": category}).sort("published_at", -1).limit(5).to_list(length=None)
+            articles = await db.news_articles.find({"category": category}, projection).sort("published_at", -1).limit(5).to_list(length=None)
             if articles:
                 newspaper_data["categories"][category] = [NewsArticle(**article) for article in articles]
                 total_articles += len(articles)
@@ -1188,6 +1426,34 @@ async def download_newspaper_pdf():
         logging.error(f"Error downloading newspaper: {str(e)}")
         raise HTTPException(status_code=500, detail=f"সংবাদপত্র ডাউনলোড করতে সমস্যা: {str(e)}")
 
+# Processed images (content-addressed, so the bytes behind a URL never change)
+IMMUTABLE_CACHE_CONTROL = "public, max-age=31536000, immutable"
+
+def accepted_image_formats(accept: str) -> List[str]:
+    """Variant formats the client takes, best first (JPEG always works)"""
+    accept = accept.lower()
+    return [name for name in VARIANT_FORMATS if name == "jpeg" or IMAGE_FORMATS[name]["media_type"] in accept]
+
+@api_router.get("/images/{key}")
+async def get_image(
+    key: str,
+    request: Request,
+    w: Optional[int] = Query(default=None, ge=1, le=4096),
+    format: Optional[str] = Query(default=None, pattern="^(jpeg|webp|avif)$")
+):
+    """Serve a processed image: the narrowest variant at least `w` px wide, in `format` or the
+    best format the Accept header allows"""
+    formats = [format] if format else accepted_image_formats(request.headers.get("accept", ""))
+    variant = await asyncio.to_thread(image_store.select, key, w, formats) if IMAGE_KEY.match(key) else None
+    if variant is None:
+        raise HTTPException(status_code=404, detail="ছবি পাওয়া যায়নি")
+    headers = {"ETag": f'"{variant["path"].name}"', "Cache-Control": IMMUTABLE_CACHE_CONTROL}
+    if not format:
+        headers["Vary"] = "Accept"
+    if request.headers.get("if-none-match") == headers["ETag"]:
+        return Response(status_code=304, headers=headers)
+    return FileResponse(variant["path"], media_type=IMAGE_FORMATS[variant["format"]]["media_type"], headers=headers)
+
 # Legacy status check endpoints
 @api_router.post("/status", response_model=StatusCheck)
 async def create_status_check(input: StatusCheckCreate):
@@ -1221,4 +1487,8 @@ logger = logging.getLogger(__name__)
 
 @app.on_event("shutdown")
 async def shutdown_db_client():
+    await view_counter.flush()
+    await body_extractor.stop()
+    await scrape_engine.close()
+    image_processor.shutdown()
     client.close()
\ No newline at end of file
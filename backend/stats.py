@@ -0,0 +1,42 @@
+from datetime import datetime, timezone
+from typing import List
+
+
+def _as_flag(field: str) -> dict:
+    return {"$cond": [{"$eq": [f"${field}", True]}, 1, 0]}
+
+
+def day_key(moment: datetime) -> str:
+    """UTC calendar day bucket of a timestamp (naive values from Mongo are UTC)"""
+    if moment.tzinfo:
+        moment = moment.astimezone(timezone.utc)
+    return moment.strftime("%Y-%m-%d")
+
+
+async def aggregate_article_stats(collection, categories: List[str]) -> dict:
+    """Totals, featured/breaking counts, per-category and per-day counts, computed
+    with a single aggregation round trip (the counters are reconciled against it)"""
+    facets = {
+        "by_category": [{"$group": {
+            "_id": "$category",
+            "total": {"$sum": 1},
+            "featured": {"$sum": _as_flag("is_featured")},
+            "breaking": {"$sum": _as_flag("is_breaking")},
+        }}],
+        "by_day": [{"$group": {
+            "_id": {"$dateToString": {"format": "%Y-%m-%d", "date": "$published_at"}},
+            "total": {"$sum": 1},
+        }}],
+    }
+    result = (await collection.aggregate([{"$facet": facets}]).to_list(length=1))[0]
+
+    groups = result["by_category"]
+    counts = {group["_id"]: group["total"] for group in groups}
+    return {
+        "total_news": sum(group["total"] for group in groups),
+        "featured_news": sum(group["featured"] for group in groups),
+        "breaking_news": sum(group["breaking"] for group in groups),
+        "category_stats": {category: counts.get(category, 0) for category in categories},
+        "category_counts": counts,
+        "daily_counts": {group["_id"]: group["total"] for group in result["by_day"]},
+    }
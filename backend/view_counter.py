@@ -0,0 +1,83 @@
+import asyncio
+import logging
+from collections import Counter
+from typing import Awaitable, Callable, Iterable, Optional
+
+from pymongo import UpdateOne
+
+
+# Write-behind view counter
+class ViewCounter:
+    """Aggregates article view increments in memory and flushes them in bulk.
+
+    At most `max_pending` increments are ever held unflushed, which bounds
+    the number of views lost if the process dies between flushes.
+    `on_flush(article_ids)` runs after each successful flush, so cached
+    responses carrying the old counts can be dropped.
+    """
+
+    def __init__(self, collection, flush_interval: float = 5.0, max_pending: int = 1000,
+                 on_flush: Optional[Callable[[Iterable[str]], Awaitable[None]]] = None):
+        self.collection = collection
+        self.on_flush = on_flush
+        self.flush_interval = flush_interval
+        self.max_pending = max_pending
+        self._pending: Counter = Counter()
+        self._pending_total = 0
+        self._flush_lock = asyncio.Lock()
+        self._early_flush = None
+        self.flushes = 0
+        self.flushed_views = 0
+        self.failed_flushes = 0
+
+    def record(self, article_id: str):
+        self._pending[article_id] += 1
+        self._pending_total += 1
+        if self._pending_total >= self.max_pending and (self._early_flush is None or self._early_flush.done()):
+            self._early_flush = asyncio.create_task(self.flush())
+
+    def pending_for(self, article_id: str) -> int:
+        return self._pending.get(article_id, 0)
+
+    async def flush(self):
+        """Write all pending increments with one unordered bulk_write"""
+        async with self._flush_lock:
+            if not self._pending:
+                return
+            batch, self._pending = self._pending, Counter()
+            self._pending_total = 0
+            try:
+                await self.collection.bulk_write(
+                    [UpdateOne({"id": article_id}, {"$inc": {"views": count}}) for article_id, count in batch.items()],
+                    ordered=False
+                )
+                self.flushes += 1
+                self.flushed_views += sum(batch.values())
+            except Exception as e:
+                # Keep the counts for the next flush instead of losing them
+                logging.error(f"Error flushing view counts: {str(e)}")
+                self.failed_flushes += 1
+                self._pending.update(batch)
+                self._pending_total = sum(self._pending.values())
+                return
+        if self.on_flush is not None:
+            try:
+                await self.on_flush(batch.keys())
+            except Exception as e:
+                logging.error(f"Error after flushing view counts: {str(e)}")
+
+    async def run(self):
+        while True:
+            await asyncio.sleep(self.flush_interval)
+            await self.flush()
+
+    def stats(self) -> dict:
+        return {
+            "pending_articles": len(self._pending),
+            "pending_views": self._pending_total,
+            "max_pending": self.max_pending,
+            "flush_interval": self.flush_interval,
+            "flushes": self.flushes,
+            "flushed_views": self.flushed_views,
+            "failed_flushes": self.failed_flushes,
+        }
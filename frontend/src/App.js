@@ -54,6 +54,16 @@ import {
 
 const BACKEND_URL = process.env.REACT_APP_BACKEND_URL;
 
+// Processed images are served by the backend (/api/images/...) in several widths;
+// the browser picks one from srcSet and the best format it accepts
+const imageSrc = (url) => (url && url.startsWith('/api/') ? `${BACKEND_URL}${url}` : url);
+
+const imageSrcSet = (article) => {
+  if (!article.image_variants || !article.image_variants.length) return undefined;
+  const widths = [...new Set(article.image_variants.map((variant) => variant.width))];
+  return widths.map((width) => `${imageSrc(article.image_url)}?w=${width} ${width}w`).join(', ');
+};
+
 // News Categories
 const NEWS_CATEGORIES = [
   "রাজনীতি",
@@ -1077,7 +1087,9 @@ function NewsPortalContent() {
                         {article.image_url && (
                           <div className="mb-4 rounded-lg overflow-hidden">
                             <img 
-                              src={article.image_url} 
+                              src={imageSrc(article.image_url)} 
+                              srcSet={imageSrcSet(article)}
+                              sizes="(min-width: 768px) 33vw, 100vw"
                               alt={article.title}
                               className="w-full h-32 md:h-48 object-cover group-hover:scale-105 transition-transform duration-300"
                             />
@@ -1153,7 +1165,9 @@ function NewsPortalContent() {
                       {article.image_url && (
                         <div className="mb-4 rounded-lg overflow-hidden">
                           <img 
-                            src={article.image_url} 
+                            src={imageSrc(article.image_url)} 
+                            srcSet={imageSrcSet(article)}
+                            sizes="(min-width: 768px) 25vw, 100vw"
                             alt={article.title}
                             className="w-full h-24 md:h-32 object-cover group-hover:scale-105 transition-transform duration-300"
                           />
@@ -1287,7 +1301,9 @@ function NewsPortalContent() {
                   {selectedArticle.image_url && (
                     <div className="rounded-lg overflow-hidden">
                       <img 
-                        src={selectedArticle.image_url} 
+                        src={imageSrc(selectedArticle.image_url)} 
+                        srcSet={imageSrcSet(selectedArticle)}
+                        sizes="(min-width: 768px) 50vw, 100vw"
                         alt={selectedArticle.title}
                         className="w-full h-48 md:h-64 object-cover"
                       />
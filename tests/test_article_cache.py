@@ -0,0 +1,75 @@
+import pytest
+
+import caches
+from caches import ArticleCache
+
+
+@pytest.fixture
+def clock(monkeypatch):
+    now = [1000.0]
+    monkeypatch.setattr(caches.time, "monotonic", lambda: now[0])
+    return now
+
+
+def test_entries_expire_after_ttl(clock):
+    cache = ArticleCache(ttl=60)
+    cache.put("a", b"{}", cache.version)
+    clock[0] += 59
+    assert cache.get("a") == b"{}"
+    clock[0] += 1
+    assert cache.get("a") is None
+    assert cache.stats()["expirations"] == 1
+    assert cache.stats()["bytes"] == 0
+
+
+def test_byte_bound_evicts_least_recently_used(clock):
+    cache = ArticleCache(max_bytes=10)
+    cache.put("a", b"aaaa", cache.version)
+    cache.put("b", b"bbbb", cache.version)
+    cache.get("a")
+    cache.put("c", b"cccc", cache.version)
+    assert cache.get("b") is None
+    assert cache.get("a") == b"aaaa" and cache.get("c") == b"cccc"
+    assert cache.stats()["bytes"] == 8
+    assert cache.stats()["evictions"] == 1
+
+
+def test_oversized_body_is_not_stored(clock):
+    cache = ArticleCache(max_bytes=10)
+    cache.put("a", b"x" * 11, cache.version)
+    assert cache.get("a") is None
+    assert cache.stats()["bytes"] == 0
+
+
+def test_entry_count_bound(clock):
+    cache = ArticleCache(max_entries=2)
+    for article_id in "abc":
+        cache.put(article_id, b"{}", cache.version)
+    assert cache.get("a") is None
+    assert cache.stats()["entries"] == 2
+
+
+def test_replacing_an_entry_keeps_the_byte_count(clock):
+    cache = ArticleCache()
+    cache.put("a", b"aaaa", cache.version)
+    cache.put("a", b"aa", cache.version)
+    assert cache.stats()["bytes"] == 2
+
+
+def test_write_during_a_read_skips_the_result(clock):
+    cache = ArticleCache()
+    version = cache.version
+    cache.invalidate(["a"])
+    cache.put("a", b"stale", version)
+    assert cache.get("a") is None
+
+
+def test_invalidate_and_clear(clock):
+    cache = ArticleCache()
+    cache.put("a", b"aa", cache.version)
+    cache.put("b", b"bb", cache.version)
+    cache.invalidate(["a", "missing"])
+    assert cache.get("a") is None and cache.get("b") == b"bb"
+    cache.clear()
+    assert cache.get("b") is None
+    assert cache.stats()["bytes"] == 0
@@ -0,0 +1,157 @@
+import asyncio
+
+from datetime import datetime, timezone
+
+import caches
+from caches import CachedFeed, FeedCache, TTLValue
+from view_counter import ViewCounter
+
+STORED_AT = datetime(2024, 5, 1, 8, 30, tzinfo=timezone.utc)
+
+
+def feed(body: bytes) -> CachedFeed:
+    return CachedFeed(body, f'"{body.decode()}"', STORED_AT)
+
+
+def test_feed_cache_roundtrip():
+    cache = FeedCache()
+    cache.put({"category": "খেলাধুলা"}, ("news", 0), feed(b"[1]"), cache.version)
+    assert cache.get({"category": "খেলাধুলা"}, ("news", 0)) == feed(b"[1]")
+    assert cache.get({"category": "খেলাধুলা"}, ("news", 20)) is None
+
+
+def test_feed_cache_skips_result_read_during_a_write():
+    cache = FeedCache()
+    version = cache.version
+    cache.invalidate([{"id": "a", "category": "খেলাধুলা"}])
+    cache.put({}, ("news",), feed(b"[]"), version)
+    assert cache.get({}, ("news",)) is None
+
+
+def test_invalidate_drops_only_matching_feeds():
+    cache = FeedCache()
+    cache.put({"category": "খেলাধুলা"}, ("news",), feed(b"sports"), cache.version)
+    cache.put({"category": "রাজনীতি"}, ("news",), feed(b"politics"), cache.version)
+    cache.put({}, ("news",), feed(b"all"), cache.version)
+
+    cache.invalidate([{"id": "a", "category": "খেলাধুলা", "is_breaking": False}])
+
+    assert cache.get({"category": "খেলাধুলা"}, ("news",)) is None
+    assert cache.get({}, ("news",)) is None
+    assert cache.get({"category": "রাজনীতি"}, ("news",)) == feed(b"politics")
+
+
+def test_feeds_expire_after_ttl(monkeypatch):
+    now = [1000.0]
+    monkeypatch.setattr(caches.time, "monotonic", lambda: now[0])
+    cache = FeedCache(ttl=30)
+    cache.put({}, ("news",), feed(b"[0]"), cache.version)
+    now[0] += 29
+    assert cache.get({}, ("news",)) == feed(b"[0]")
+    now[0] += 1
+    assert cache.get({}, ("news",)) is None
+    assert cache.stats()["expirations"] == 1
+
+
+def test_byte_bound_evicts_least_recently_used():
+    cache = FeedCache(max_bytes=10)
+    cache.put({}, (0,), feed(b"aaaa"), cache.version)
+    cache.put({}, (1,), feed(b"bbbb"), cache.version)
+    cache.get({}, (0,))
+    cache.put({}, (2,), feed(b"cccc"), cache.version)
+    assert cache.get({}, (1,)) is None
+    assert cache.get({}, (0,)) == feed(b"aaaa")
+    assert cache.stats()["bytes"] == 8
+    cache.put({}, (3,), feed(b"x" * 11), cache.version)  # larger than the whole cache: not stored
+    assert cache.get({}, (3,)) is None
+
+
+def test_lru_eviction():
+    cache = FeedCache(max_entries=2)
+    for page in range(3):
+        cache.put({}, (page,), feed(b"x"), cache.version)
+    assert cache.get({}, (0,)) is None
+    assert cache.stats()["evictions"] == 1
+
+
+
+def test_ttl_value_recomputes_after_invalidate():
+    stats = TTLValue(ttl=60)
+    computed = []
+
+    async def compute():
+        computed.append(len(computed))
+        return {"featured_news": len(computed) - 1}
+
+    async def run():
+        assert await stats.get(compute) == {"featured_news": 0}
+        assert await stats.get(compute) == {"featured_news": 0}
+        stats.invalidate()
+        return await stats.get(compute)
+
+    assert asyncio.run(run()) == {"featured_news": 1}
+    assert len(computed) == 2
+
+
+def test_ttl_value_skips_result_computed_across_an_invalidate():
+    stats = TTLValue(ttl=60)
+    computed = []
+
+    async def compute():
+        computed.append(None)
+        if len(computed) == 1:
+            stats.invalidate()  # a write lands while the first aggregation runs
+        return len(computed)
+
+    async def run():
+        first = await stats.get(compute)
+        return first, await stats.get(compute)
+
+    assert asyncio.run(run()) == (1, 2)
+
+
+class RecordingCollection:
+    def __init__(self, fail=False):
+        self.fail = fail
+        self.batches = []
+
+    async def bulk_write(self, operations, ordered=True):
+        if self.fail:
+            raise RuntimeError("primary stepped down")
+        self.batches.append(operations)
+
+
+def test_view_flush_reports_flushed_articles():
+    flushed = []
+
+    async def on_flush(article_ids):
+        flushed.extend(article_ids)
+
+    async def run():
+        counter = ViewCounter(RecordingCollection(), on_flush=on_flush)
+        counter.record("a")
+        counter.record("a")
+        counter.record("b")
+        await counter.flush()
+        return counter
+
+    counter = asyncio.run(run())
+    assert sorted(flushed) == ["a", "b"]
+    assert counter.stats()["flushed_views"] == 3
+
+
+def test_failed_view_flush_keeps_counts_and_skips_callback():
+    flushed = []
+
+    async def on_flush(article_ids):
+        flushed.extend(article_ids)
+
+    async def run():
+        counter = ViewCounter(RecordingCollection(fail=True), on_flush=on_flush)
+        counter.record("a")
+        await counter.flush()
+        return counter
+
+    counter = asyncio.run(run())
+    assert flushed == []
+    assert counter.pending_for("a") == 1
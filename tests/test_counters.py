@@ -0,0 +1,61 @@
+import asyncio
+from datetime import datetime, timezone
+
+import pytest
+
+from counters import COUNTERS_ID, ArticleCounters, _article_delta, counter_key, decode_counter_key
+
+PUBLISHED = datetime(2024, 5, 1, 8, 30, tzinfo=timezone.utc)
+
+
+class CounterCollection:
+    """Applies $inc updates to one in-memory document, nesting dotted paths like MongoDB"""
+
+    def __init__(self):
+        self.document = {}
+
+    async def update_one(self, query, update, upsert=False):
+        for path, value in update["$inc"].items():
+            parts = path.split(".")
+            assert all(part and not part.startswith("$") for part in parts), path
+            target = self.document
+            for part in parts[:-1]:
+                target = target.setdefault(part, {})
+            target[parts[-1]] = target.get(parts[-1], 0) + value
+
+    async def find_one(self, query):
+        return {"_id": COUNTERS_ID, **self.document}
+
+
+def test_delta_for_an_article():
+    delta = _article_delta({"category": "খেলাধুলা", "is_breaking": True, "published_at": PUBLISHED}, 1)
+    assert delta == {"total": 1, "breaking": 1, "category.খেলাধুলা": 1, "day.2024-05-01": 1}
+
+
+def test_delta_sign_for_deletes():
+    delta = _article_delta({"category": "রাজনীতি", "is_featured": True, "published_at": PUBLISHED}, -1)
+    assert delta["total"] == -1 and delta["featured"] == -1 and delta["category.রাজনীতি"] == -1
+
+
+@pytest.mark.parametrize("category", ["রাজনীতি", "a.b", "$where", "100%", "%2E", "", "x.$y%"])
+def test_counter_keys_round_trip_and_are_safe(category):
+    key = counter_key(category)
+    assert "." not in key and not key.startswith("$") and key
+    assert decode_counter_key(key) == category
+
+
+def test_dotted_and_dollar_categories_count_as_flat_keys():
+    async def run():
+        counters = ArticleCounters(CounterCollection())
+        await counters.record_inserted([
+            {"category": "world.news", "published_at": PUBLISHED},
+            {"category": "$money", "published_at": PUBLISHED},
+            {"category": "world.news", "published_at": PUBLISHED},
+        ])
+        await counters.record_deleted([{"category": "$money", "published_at": PUBLISHED}])
+        return await counters.read()
+
+    counts = asyncio.run(run())
+    assert counts["total"] == 2
+    assert counts["category"] == {"world.news": 2, "$money": 0}
+    assert counts["day"] == {"2024-05-01": 2}
@@ -0,0 +1,32 @@
+from extractor import extract_article
+
+URL = "https://www.prothomalo.com/bangladesh/article-1"
+
+PAGE = """<html><head><meta charset="utf-8"><meta property="og:image" content="/img/lead.jpg"></head><body>
+<nav><p>প্রচ্ছদ, বাংলাদেশ, আন্তর্জাতিক, খেলা, বিনোদন, মতামত</p></nav>
+<div class="article-body">
+<p>ঢাকায় আজ সকাল থেকে ভারী বৃষ্টি হচ্ছে, আবহাওয়া অফিস সতর্কবার্তা দিয়েছে।</p>
+<p>নগরীর বিভিন্ন এলাকায় জলাবদ্ধতা দেখা দিয়েছে, যান চলাচল ব্যাহত হচ্ছে।</p>
+</div>
+<div class="related-news"><p>আরও পড়ুন: অন্য একটি খবরের শিরোনাম এখানে দেওয়া আছে।</p></div>
+</body></html>"""
+
+
+def test_extracts_body_and_lead_image_from_bytes():
+    body, lead_image = extract_article(PAGE.encode("utf-8"), URL)
+    assert body.split("\n\n") == [
+        "ঢাকায় আজ সকাল থেকে ভারী বৃষ্টি হচ্ছে, আবহাওয়া অফিস সতর্কবার্তা দিয়েছে।",
+        "নগরীর বিভিন্ন এলাকায় জলাবদ্ধতা দেখা দিয়েছে, যান চলাচল ব্যাহত হচ্ছে।",
+    ]
+    assert lead_image == "https://www.prothomalo.com/img/lead.jpg"
+
+
+def test_xml_declaration():
+    page = '<?xml version="1.0" encoding="UTF-8"?>\n' + PAGE
+    assert extract_article(page.encode("utf-8"), URL) == extract_article(PAGE.encode("utf-8"), URL)
+    assert extract_article(page, URL)[0]
+
+
+def test_empty_page():
+    assert extract_article(b"", URL) == ("", None)
+    assert extract_article(b"  \n", URL) == ("", None)
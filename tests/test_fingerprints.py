@@ -0,0 +1,57 @@
+import asyncio
+
+from fingerprints import FINGERPRINT_FIELD, new_items, normalize_title, title_fingerprint
+from indexes import REQUIRED_INDEXES
+
+
+class FingerprintCollection:
+    """Answers the `$exists`/`$in` fingerprint lookup from a list of documents"""
+
+    def __init__(self, documents):
+        self.documents = documents
+        self.queries = []
+
+    def find(self, query, projection=None):
+        self.queries.append(query)
+        condition = query[FINGERPRINT_FIELD]
+
+        async def documents():
+            for document in self.documents:
+                if FINGERPRINT_FIELD in document and document[FINGERPRINT_FIELD] in condition["$in"]:
+                    yield {FINGERPRINT_FIELD: document[FINGERPRINT_FIELD]}
+        return documents()
+
+
+def test_normalize_title():
+    assert normalize_title("  ঢাকায়   ভারী বৃষ্টি।  ") == "ঢাকায় ভারী বৃষ্টি"
+    assert normalize_title("Dhaka: Heavy RAIN!") == "dhaka heavy rain"
+    assert normalize_title("নির্বাচন\u200c কমিশন\u00ad") == "নির্বাচন কমিশন"
+    assert normalize_title("“উদ্ধৃতি” - খবর") == "উদ্ধৃতি খবর"
+
+
+def test_normalize_title_composes_unicode():
+    decomposed = "\u09c7\u09be"  # e-kar + aa-kar, NFC composes them to o-kar
+    assert normalize_title(f"ক{decomposed}থায়") == normalize_title("ক\u09cbথায়")
+
+
+def test_fingerprint_ignores_formatting_only():
+    assert title_fingerprint("ঢাকায় ভারী বৃষ্টি") == title_fingerprint("ঢাকায়  ভারী বৃষ্টি।")
+    assert title_fingerprint("ঢাকায় ভারী বৃষ্টি") != title_fingerprint("চট্টগ্রামে ভারী বৃষ্টি")
+    assert len(title_fingerprint("ঢাকায় ভারী বৃষ্টি")) == 40
+
+
+def test_new_items_drops_stored_and_repeated_titles():
+    collection = FingerprintCollection([{"title": "পুরনো খবর", FINGERPRINT_FIELD: title_fingerprint("পুরনো খবর")}])
+    items = [{"title": "পুরনো খবর!"}, {"title": "নতুন খবর"}, {"title": "নতুন  খবর।"}]
+    fresh = asyncio.run(new_items(collection, items))
+    assert [item["title"] for item in fresh] == ["নতুন খবর"]
+    assert fresh[0][FINGERPRINT_FIELD] == title_fingerprint("নতুন খবর")
+    assert len(collection.queries) == 1
+    assert collection.queries[0][FINGERPRINT_FIELD]["$exists"] is True  # matches the partial index filter
+
+
+def test_fingerprint_index_is_unique_and_partial():
+    index = next(model.document for model in REQUIRED_INDEXES["news_articles"] if model.document["name"] == "title_fingerprint_unique")
+    assert index["key"] == {FINGERPRINT_FIELD: 1}
+    assert index["unique"] is True
+    assert index["partialFilterExpression"] == {FINGERPRINT_FIELD: {"$exists": True}}
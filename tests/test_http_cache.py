@@ -0,0 +1,30 @@
+from datetime import datetime, timezone
+
+from starlette.requests import Request
+
+from http_cache import content_etag, is_not_modified
+
+LAST_MODIFIED = datetime(2024, 5, 1, 8, 30, tzinfo=timezone.utc)
+
+
+def request(**headers) -> Request:
+    return Request({"type": "http", "headers": [(name.replace("_", "-").encode(), value.encode()) for name, value in headers.items()]})
+
+
+def test_etag_follows_the_body():
+    assert content_etag(b'[{"views": 3}]') == content_etag(b'[{"views": 3}]')
+    assert content_etag(b'[{"views": 3}]') != content_etag(b'[{"views": 4}]')
+
+
+def test_if_none_match():
+    etag = content_etag(b"[]")
+    assert is_not_modified(request(if_none_match=etag), etag, LAST_MODIFIED)
+    assert is_not_modified(request(if_none_match=f'"other", {etag}'), etag, LAST_MODIFIED)
+    assert not is_not_modified(request(if_none_match='"other"'), etag, LAST_MODIFIED)
+
+
+def test_if_modified_since():
+    etag = content_etag(b"[]")
+    assert is_not_modified(request(if_modified_since="Wed, 01 May 2024 08:30:00 GMT"), etag, LAST_MODIFIED)
+    assert not is_not_modified(request(if_modified_since="Wed, 01 May 2024 08:29:59 GMT"), etag, LAST_MODIFIED)
+    assert not is_not_modified(request(), etag, LAST_MODIFIED)
@@ -0,0 +1,96 @@
+import asyncio
+import itertools
+
+from pymongo import InsertOne, UpdateOne
+from pymongo.errors import BulkWriteError
+
+from fingerprints import FINGERPRINT_FIELD, title_fingerprint
+from ingest import DUPLICATE_KEY, insert_articles, with_fingerprint
+
+
+class BulkResult:
+    def __init__(self, upserted_ids):
+        self.upserted_ids = upserted_ids
+
+
+class ArticleCollection:
+    """Unordered bulk_write over a list: upserts match on the filter and apply
+    $setOnInsert only when nothing matches; `id` and the fingerprint are unique"""
+
+    def __init__(self, documents=()):
+        self.documents = [dict(document) for document in documents]
+        self.operations = []
+        self._ids = itertools.count(1)
+
+    def _duplicate(self, document):
+        return any(document.get(field) is not None and stored.get(field) == document[field]
+                   for stored in self.documents for field in ("id", FINGERPRINT_FIELD))
+
+    async def bulk_write(self, operations, ordered=True):
+        self.operations.append(operations)
+        upserted, errors = {}, []
+        for index, operation in enumerate(operations):
+            if isinstance(operation, UpdateOne):
+                if any(all(stored.get(key) == value for key, value in operation._filter.items()) for stored in self.documents):
+                    continue
+                document = {**operation._filter, **operation._doc["$setOnInsert"]}
+            else:
+                document = dict(operation._doc)
+            if self._duplicate(document):
+                errors.append({"index": index, "code": DUPLICATE_KEY})
+                continue
+            document["_id"] = next(self._ids)
+            self.documents.append(document)
+            if isinstance(operation, UpdateOne):
+                upserted[index] = document["_id"]
+        if errors:
+            raise BulkWriteError({"writeErrors": errors, "upserted": [{"index": index, "_id": _id} for index, _id in upserted.items()]})
+        return BulkResult(upserted)
+
+
+def scraped(article_id, fingerprint, **fields):
+    return {"id": article_id, "title": f"শিরোনাম {article_id}", FINGERPRINT_FIELD: fingerprint, **fields}
+
+
+def test_fingerprinted_documents_are_set_on_insert_upserts():
+    collection = ArticleCollection()
+    stored = asyncio.run(insert_articles(collection, [scraped("a", "f1"), {"id": "m", "title": "হাতে লেখা"}]))
+    assert [document["id"] for document in stored] == ["a", "m"]
+    first, manual = collection.operations[0]
+    assert first == UpdateOne({FINGERPRINT_FIELD: "f1"}, {"$setOnInsert": {"id": "a", "title": "শিরোনাম a"}}, upsert=True)
+    assert manual == InsertOne({"id": "m", "title": "হাতে লেখা"})
+
+
+def test_rerunning_a_batch_stores_nothing_and_keeps_the_original():
+    collection = ArticleCollection([scraped("a", "f1", views=7)])
+    stored = asyncio.run(insert_articles(collection, [scraped("b", "f1", views=0), scraped("c", "f2")]))
+    assert [document["id"] for document in stored] == ["c"]
+    assert [(document["id"], document.get("views")) for document in collection.documents] == [("a", 7), ("c", None)]
+
+
+def test_duplicate_insert_does_not_stop_the_batch():
+    collection = ArticleCollection([{"id": "m", "title": "হাতে লেখা"}])
+    stored = asyncio.run(insert_articles(collection, [{"id": "m", "title": "আবার"}, scraped("d", "f3")]))
+    assert [document["id"] for document in stored] == ["d"]
+    assert stored[0]["_id"] is not None
+
+
+def test_empty_batch_writes_nothing():
+    collection = ArticleCollection()
+    assert asyncio.run(insert_articles(collection, [])) == []
+    assert collection.operations == []
+
+
+def test_only_scraped_articles_are_fingerprinted():
+    scraped_article = {"id": "s", "title": "ঢাকায় ভারী বৃষ্টি", "source": "somoynews"}
+    assert with_fingerprint(scraped_article)[FINGERPRINT_FIELD] == title_fingerprint("ঢাকায় ভারী বৃষ্টি")
+    assert FINGERPRINT_FIELD not in with_fingerprint({"id": "g", "title": "ঢাকায় ভারী বৃষ্টি", "source": None})
+
+
+def test_generated_fallback_titles_are_stored_on_every_run():
+    collection = ArticleCollection()
+    for run in range(2):
+        batch = [{"id": f"{run}-{index}", "title": f"খেলাধুলা বিভাগের সংবাদ {index + 1}", "source": None} for index in range(3)]
+        stored = asyncio.run(insert_articles(collection, [with_fingerprint(document) for document in batch]))
+        assert len(stored) == 3
+    assert len(collection.documents) == 6
@@ -0,0 +1,48 @@
+import pytest
+
+from near_duplicates import NearDuplicateIndex
+
+TITLE = "ঢাকায় আজ ভারী বৃষ্টির পূর্বাভাস দিয়েছে আবহাওয়া অফিস"
+
+
+def index_of(**titles) -> NearDuplicateIndex:
+    index = NearDuplicateIndex()
+    for article_id, title in titles.items():
+        index.add(article_id, index.signature(title))
+    return index
+
+
+def test_reworded_headline_matches():
+    index = index_of(a=TITLE, b="চট্টগ্রাম বন্দরে নতুন কন্টেইনার টার্মিনাল চালু")
+    match = index.best_match(index.signature("ঢাকায় আজ ভারী বৃষ্টির পূর্বাভাস দিল আবহাওয়া অফিস।"))
+    assert match is not None
+    assert match[0] == "a" and match[1] >= index.threshold
+
+
+def test_formatting_differences_are_identical():
+    index = index_of(a=TITLE)
+    assert index.best_match(index.signature(f"  {TITLE}!  ")) == ("a", 1.0)
+
+
+def test_unrelated_headline_does_not_match():
+    index = index_of(a=TITLE)
+    assert index.best_match(index.signature("জাতীয় দলের নতুন অধিনায়কের নাম ঘোষণা করল বিসিবি")) is None
+
+
+def test_signatures_are_stable_across_instances():
+    assert (NearDuplicateIndex().signature(TITLE) == NearDuplicateIndex().signature(TITLE)).all()
+
+
+def test_remove_and_eviction_drop_buckets():
+    index = NearDuplicateIndex(max_entries=1)
+    index.add("a", index.signature(TITLE))
+    index.add("b", index.signature("জাতীয় দলের নতুন অধিনায়কের নাম ঘোষণা"))
+    assert index.best_match(index.signature(TITLE)) is None
+    index.remove("b")
+    assert index.stats()["entries"] == 0
+    assert index.stats()["buckets"] == 0
+
+
+def test_bands_must_divide_permutations():
+    with pytest.raises(ValueError):
+        NearDuplicateIndex(num_perm=100, bands=32)
@@ -0,0 +1,71 @@
+import asyncio
+from datetime import datetime, timezone
+
+import pytest
+
+from pagination import InvalidCursor, decode_cursor, encode_cursor, fetch_page, keyset_query
+
+PUBLISHED = datetime(2024, 5, 1, 8, 30, 15, 250000, tzinfo=timezone.utc)
+
+
+def test_cursor_round_trip():
+    cursor = encode_cursor({"published_at": PUBLISHED, "id": "a1b2", "title": "ignored"})
+    assert "=" not in cursor
+    assert decode_cursor(cursor) == (PUBLISHED, "a1b2")
+
+
+@pytest.mark.parametrize("cursor", ["not-base64!", "e30", "eyJwIjoxfQ", "eyJwIjoieCIsImkiOiIxIn0", "e"])
+def test_invalid_cursor(cursor):
+    with pytest.raises(InvalidCursor):
+        decode_cursor(cursor)
+
+
+def test_first_page_keeps_query():
+    assert keyset_query({"category": "খেলাধুলা"}, None) == {"category": "খেলাধুলা"}
+    assert keyset_query({}, "") == {}
+
+
+def test_keyset_query_after_cursor():
+    cursor = encode_cursor({"published_at": PUBLISHED, "id": "a1b2"})
+    after = {"$or": [
+        {"published_at": {"$lt": PUBLISHED}},
+        {"published_at": PUBLISHED, "id": {"$lt": "a1b2"}},
+    ]}
+    assert keyset_query({}, cursor) == after
+    assert keyset_query({"is_breaking": True}, cursor) == {"$and": [{"is_breaking": True}, after]}
+
+
+class ArticleCursor:
+    def __init__(self, documents):
+        self.documents = documents
+
+    def sort(self, keys):
+        return self
+
+    def limit(self, count):
+        self.documents = self.documents[:count]
+        return self
+
+    async def to_list(self, length=None):
+        return self.documents
+
+
+class Articles:
+    """Returns the stored articles in keyset order; queries are not evaluated"""
+
+    def __init__(self, documents):
+        self.documents = documents
+
+    def find(self, query, projection=None):
+        return ArticleCursor(list(self.documents))
+
+
+ARTICLES = [{"published_at": PUBLISHED, "id": f"a{index}"} for index in (3, 2, 1)]
+
+
+def test_fetch_page_returns_next_cursor_until_the_last_page():
+    articles, next_cursor = asyncio.run(fetch_page(Articles(ARTICLES), {}, "", 2))
+    assert [article["id"] for article in articles] == ["a3", "a2"]
+    assert decode_cursor(next_cursor) == (PUBLISHED, "a2")
+    articles, next_cursor = asyncio.run(fetch_page(Articles(ARTICLES), {}, "", 3))
+    assert len(articles) == 3 and next_cursor is None
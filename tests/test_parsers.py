@@ -0,0 +1,50 @@
+import pytest
+
+from parsers import available_parsers, get_parser
+from scraper import SCRAPER_SOURCES, extract_region
+
+SOURCE = SCRAPER_SOURCES["somoynews"]
+
+PAGE = """<html><head><meta charset="utf-8"></head><body>
+<div class="breaking-news"><h2><a href="/news/1">ঢাকায় আজ ভারী বৃষ্টির পূর্বাভাস দিয়েছে আবহাওয়া অফিস</a></h2><img src="/img/1.jpg"></div>
+<div class="sidebar"><h2>এটি কোনো শিরোনাম নয়, এটি সাইডবার</h2></div>
+</body></html>"""
+
+
+@pytest.fixture(params=available_parsers())
+def parser(request):
+    return get_parser(request.param)
+
+
+def test_parses_bytes_with_declared_charset(parser):
+    _, items = extract_region(SOURCE, PAGE.encode("utf-8"), parser)
+    assert [item["title"] for item in items] == ["ঢাকায় আজ ভারী বৃষ্টির পূর্বাভাস দিয়েছে আবহাওয়া অফিস"]
+    assert items[0]["image_url"] == "https://www.somoynews.tv/img/1.jpg"
+
+
+def test_parses_xml_declaration(parser):
+    page = '<?xml version="1.0" encoding="UTF-8"?>\n' + PAGE
+    _, from_bytes = extract_region(SOURCE, page.encode("utf-8"), parser)
+    _, from_text = extract_region(SOURCE, page, parser)
+    assert len(from_bytes) == len(from_text) == 1
+    assert from_bytes[0]["title"] == from_text[0]["title"]
+
+
+@pytest.mark.parametrize("page", [b"", b"   \n", b"<!-- nothing -->", ""])
+def test_empty_page_has_no_headlines(parser, page):
+    _, items = extract_region(SOURCE, page, parser)
+    assert items == []
+
+
+def test_non_utf8_charset(parser):
+    page = ('<html><head><meta charset="windows-1252"></head><body>'
+            '<div class="latest"><h3>Café prices rise again in the capital</h3></div></body></html>')
+    _, items = extract_region(SOURCE, page.encode("windows-1252"), parser)
+    assert items[0]["title"] == "Café prices rise again in the capital"
+
+
+def test_backends_extract_the_same_items():
+    page = PAGE.encode("utf-8")
+    _, reference = extract_region(SOURCE, page, get_parser("html.parser"))
+    for name in available_parsers():
+        assert extract_region(SOURCE, page, get_parser(name))[1] == reference, name
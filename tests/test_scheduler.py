@@ -0,0 +1,83 @@
+import asyncio
+
+import pytest
+
+import scheduler
+from scheduler import AdaptiveScheduler
+
+
+@pytest.fixture
+def clock(monkeypatch):
+    now = [1000.0]
+    monkeypatch.setattr(scheduler.time, "monotonic", lambda: now[0])
+    return now
+
+
+def make(**options) -> AdaptiveScheduler:
+    return AdaptiveScheduler(base_interval=600, min_interval=60, max_interval=3600, jitter=0, **options)
+
+
+def interval(schedule: AdaptiveScheduler, key: str) -> float:
+    return schedule.stats()["sources"][key]["interval"]
+
+
+def test_new_sources_are_due_immediately(clock):
+    schedule = make()
+    assert schedule.due(["somoynews", "jamuna"]) == ["somoynews", "jamuna"]
+
+
+def test_productive_sources_speed_up_and_idle_ones_back_off(clock):
+    schedule = make()
+    schedule.record("busy", new_items=3)
+    schedule.record("idle", new_items=0)
+    assert interval(schedule, "busy") == 300
+    assert interval(schedule, "idle") == 900
+    clock[0] += 300
+    assert schedule.due(["busy", "idle"]) == ["busy"]
+    assert schedule.seconds_until_next(["idle"]) == 600
+
+
+def test_intervals_stay_within_bounds(clock):
+    schedule = make()
+    for _ in range(10):
+        schedule.record("busy", new_items=1)
+        schedule.record("idle", new_items=0)
+    assert interval(schedule, "busy") == 60
+    assert interval(schedule, "idle") == 3600
+
+
+def test_failures_back_off_exponentially_from_the_base(clock):
+    schedule = make()
+    schedule.record("flaky", new_items=5)
+    schedule.record("flaky", new_items=0, failed=True)
+    assert interval(schedule, "flaky") == 1200
+    schedule.record("flaky", new_items=0, failed=True)
+    assert interval(schedule, "flaky") == 2400
+    schedule.record("flaky", new_items=2)
+    assert schedule.stats()["sources"]["flaky"]["failures"] == 0
+
+
+def test_new_base_interval_reschedules_every_source(clock):
+    schedule = make()
+    schedule.record("idle", new_items=0)
+    schedule.set_base_interval(120)
+    assert interval(schedule, "idle") == 120
+    assert schedule.seconds_until_next(["idle"]) == 120
+
+
+def test_whole_cycle_failures_back_off_until_a_success():
+    schedule = make()
+    assert [schedule.cycle_failed() for _ in range(3)] == [60, 120, 240]
+    schedule.cycle_succeeded()
+    assert schedule.cycle_failed() == 60
+
+
+def test_wake_interrupts_sleep():
+    async def run():
+        schedule = make()
+        sleeper = asyncio.ensure_future(schedule.sleep(60))
+        await asyncio.sleep(0)
+        schedule.wake()
+        await asyncio.wait_for(sleeper, timeout=1)
+
+    asyncio.run(run())
@@ -0,0 +1,50 @@
+import asyncio
+
+import httpx
+
+from benchmarks.bench_scraper import MemoryCollection
+from scraper import SCRAPER_SOURCES, ScrapeEngine, SourceStateStore, save_states, scrape_source
+
+SOURCE = SCRAPER_SOURCES["somoynews"]
+PAGE = ('<html><body><div class="breaking"><h2>ঢাকায় আজ ভারী বৃষ্টির পূর্বাভাস দিয়েছে আবহাওয়া অফিস</h2></div>'
+        '</body></html>').encode("utf-8")
+
+
+def engine_serving(page: bytes) -> ScrapeEngine:
+    def respond(request):
+        if request.headers.get("if-none-match") == '"v1"':
+            return httpx.Response(304)
+        return httpx.Response(200, content=page, headers={"ETag": '"v1"'})
+
+    engine = ScrapeEngine()
+    engine._client = httpx.AsyncClient(transport=httpx.MockTransport(respond))
+    return engine
+
+
+def test_state_is_returned_not_saved():
+    async def run():
+        engine, collection = engine_serving(PAGE), MemoryCollection()
+        result = await scrape_source(engine, SOURCE, SourceStateStore(collection))
+        await engine.close()
+        return result, collection
+
+    result, collection = asyncio.run(run())
+    assert len(result.items) == 1
+    assert result.state["etag"] == '"v1"'
+    assert collection.documents == {}
+    assert "state" not in result.model_dump()
+
+
+def test_unsaved_state_rescrapes_the_page():
+    async def run():
+        engine, state = engine_serving(PAGE), SourceStateStore(MemoryCollection())
+        await scrape_source(engine, SOURCE, state)  # items not stored: state not saved
+        retry = await scrape_source(engine, SOURCE, state)
+        await save_states(state, [retry])
+        after_commit = await scrape_source(engine, SOURCE, state)
+        await engine.close()
+        return retry, after_commit
+
+    retry, after_commit = asyncio.run(run())
+    assert not retry.unchanged and len(retry.items) == 1
+    assert after_commit.unchanged and after_commit.status_code == 304 and after_commit.items == []
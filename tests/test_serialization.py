@@ -0,0 +1,69 @@
+import json
+import uuid
+from datetime import datetime
+from typing import List, Optional
+
+from bson import ObjectId
+from fastapi.encoders import jsonable_encoder
+from pydantic import BaseModel, Field
+
+from serialization import DocumentEncoder, dumps
+
+PUBLISHED = datetime(2024, 5, 1, 8, 30, 15, 250000)  # naive UTC, as the (not tz_aware) Motor client returns it
+
+
+class Variant(BaseModel):
+    width: int
+    url: str
+
+
+class Article(BaseModel):
+    """Shaped like server.NewsArticle: required fields, defaults and a default factory"""
+    id: str = Field(default_factory=lambda: str(uuid.uuid4()))
+    title: str
+    author: str = "সংবাদদাতা"
+    published_at: datetime
+    image_url: Optional[str] = None
+    image_variants: Optional[List[Variant]] = None
+    is_breaking: bool = False
+    views: int = 0
+
+
+DOCUMENT = {
+    "_id": ObjectId(),
+    "id": "a1",
+    "title": "ঢাকায় ভারী বৃষ্টি",
+    "published_at": PUBLISHED,
+    "image_variants": [{"width": 400, "url": "/api/images/k?w=400"}],
+    "views": 12,
+    "title_fingerprint": "f" * 40,
+}
+
+
+def test_matches_the_validated_model_response():
+    encoded = json.loads(dumps(DocumentEncoder(Article).encode(DOCUMENT)))
+    assert encoded == jsonable_encoder(Article(**DOCUMENT))
+
+
+def test_follows_model_field_order_and_drops_other_fields():
+    encoded = DocumentEncoder(Article).encode(DOCUMENT)
+    assert list(encoded) == list(Article.model_fields)
+    assert "_id" not in encoded and "title_fingerprint" not in encoded
+
+
+def test_fills_defaults_for_missing_fields():
+    encoded = DocumentEncoder(Article).encode({"id": "a2", "title": "শিরোনাম", "published_at": PUBLISHED})
+    assert encoded["author"] == "সংবাদদাতা"
+    assert encoded["is_breaking"] is False and encoded["views"] == 0
+    assert encoded["image_url"] is None
+
+
+def test_encode_many():
+    documents = [DOCUMENT, {**DOCUMENT, "id": "a3"}]
+    encoder = DocumentEncoder(Article)
+    assert encoder.encode_many(documents) == [encoder.encode(document) for document in documents]
+
+
+def test_dumps_datetimes_and_models():
+    assert json.loads(dumps({"at": PUBLISHED})) == {"at": "2024-05-01T08:30:15.250000"}
+    assert json.loads(dumps([Variant(width=1, url="u")])) == [{"width": 1, "url": "u"}]